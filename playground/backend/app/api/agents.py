@@ -1,19 +1,36 @@
+import asyncio
 import logging
-import json
-from fastapi import APIRouter, HTTPException
+import os
+import time
+import uuid
+from contextlib import aclosing, nullcontext
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
+from fastapi import APIRouter, HTTPException, Request
 from app.models.api_models import AgentRequest, MultiAgentRequest
 from app.core.kernel import create_kernel
+from app.core.semantic_cache import embed_question, semantic_cache
+from app.core.sessions import InMemorySessionStore
+from app.core.streaming import format_sse, sse_response
+from app.filters.tool_calls import ToolCallRecorder, record_tool_calls
 from semantic_kernel.connectors.ai.open_ai import AzureChatPromptExecutionSettings
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     FunctionChoiceBehavior,
 )
-from semantic_kernel.agents import ChatCompletionAgent, AgentGroupChat
+from semantic_kernel.agents import (
+    AgentGroupChat,
+    ChatCompletionAgent,
+    ChatHistoryAgentThread,
+)
 from semantic_kernel.agents.strategies import (
     SequentialSelectionStrategy,
     DefaultTerminationStrategy,
 )
-from semantic_kernel.contents import FunctionCallContent
+from semantic_kernel.contents import (
+    AuthorRole,
+    ChatMessageContent,
+    StreamingChatMessageContent,
+)
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -21,224 +38,644 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/agent", tags=["agents"])
 
 
-@router.post("/chat")
-async def agent_chat(request: AgentRequest):
-    # Create a fresh kernel with the requested plugins
-    kernel, _ = create_kernel(plugins=request.available_plugins)
+class AgentSession:
+    """
+    A conversation kept on the server, so clients send only each new message.
 
-    try:
-        # Create a ChatCompletionAgent with the provided system prompt
+    Single-agent ("chat") sessions keep the agent's thread and multi-agent
+    ("multi-chat") sessions keep the group chat history. Either way the
+    messages stay resident and are never resent, re-validated or rebuilt.
+
+    Args:
+        kind (str): "chat" or "multi-chat", the endpoint family it belongs to.
+        chat_history (ChatHistory): Messages the session starts with.
+    """
+
+    def __init__(self, kind: str, chat_history: ChatHistory):
+        self.session_id = str(uuid.uuid4())
+        self.kind = kind
+        # The thread is kept rather than rebuilt around chat_history, since
+        # ChatHistoryAgentThread replaces an empty history with a new one
+        self.thread = (
+            ChatHistoryAgentThread(chat_history=chat_history) if kind == "chat" else None
+        )
+        self.chat_history = chat_history
+        # Serializes turns, so concurrent requests cannot interleave messages
+        self.lock = asyncio.Lock()
+        self.message_count = 0
+        self.size_bytes = 0
+        self.record([message.content for message in chat_history.messages])
+
+    def record(self, contents: List[Optional[str]]) -> None:
+        """Account for messages added to the conversation."""
+        self.message_count += len(contents)
+        self.size_bytes += sum(len(content or "") for content in contents)
+
+    async def messages(self) -> List[ChatMessageContent]:
+        if self.thread is not None:
+            return [message async for message in self.thread.get_messages()]
+        return list(self.chat_history.messages)
+
+
+def create_agent_session_store() -> InMemorySessionStore:
+    """
+    Create the agent session store from the environment.
+
+    Sessions hold live chat histories, so they are always kept in memory,
+    capped by AGENT_SESSION_MAX_ENTRIES and by AGENT_SESSION_MAX_BYTES of
+    message text. Idle sessions expire after AGENT_SESSION_IDLE_TTL_SECONDS.
+
+    Returns:
+        InMemorySessionStore: The configured session store.
+    """
+    max_bytes = os.getenv("AGENT_SESSION_MAX_BYTES")
+    return InMemorySessionStore(
+        idle_ttl=float(os.getenv("AGENT_SESSION_IDLE_TTL_SECONDS", "1800")),
+        max_entries=int(os.getenv("AGENT_SESSION_MAX_ENTRIES", "1000")),
+        max_bytes=int(max_bytes) if max_bytes else None,
+        sizer=lambda session: session.size_bytes,
+    )
+
+
+# Server-side conversations for /agent/chat and /agent/multi-chat
+agent_sessions = create_agent_session_store()
+
+
+async def resolve_session(
+    request: Union[AgentRequest, MultiAgentRequest], kind: str
+) -> Optional[AgentSession]:
+    """
+    Return the server-side session a request continues or starts, if any.
+
+    A request with ``session_id`` continues that session and only its
+    ``message`` is used. A request with ``stateful`` starts a new session
+    seeded with its ``chat_history``. Other requests are stateless.
+
+    Raises:
+        HTTPException: 404 if the session is unknown or has expired, so the
+            client can fall back to resending the full history; 400 if it
+            belongs to the other endpoint family.
+    """
+    if request.session_id:
+        session = await agent_sessions.get(request.session_id)
+        if session is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Session {request.session_id} not found or expired",
+            )
+        if session.kind != kind:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Session {request.session_id} is a {session.kind} session",
+            )
+        return session
+
+    if request.stateful:
+        session = AgentSession(kind, build_chat_history(request.chat_history))
+        await agent_sessions.put(session.session_id, session)
+        return session
+    return None
+
+
+async def save_session(session: AgentSession, contents: List[Optional[str]]) -> None:
+    """Record a turn's messages and re-store the session to update its size."""
+    session.record(contents)
+    await agent_sessions.put(session.session_id, session)
+
+
+def session_fields(session: Optional[AgentSession]) -> Dict[str, Any]:
+    """Response fields identifying the session, empty for stateless requests."""
+    if session is None:
+        return {}
+    return {"session_id": session.session_id, "message_count": session.message_count}
+
+
+def build_chat_history(messages: List[Dict[str, str]]) -> ChatHistory:
+    """
+    Build a ChatHistory from the client-supplied user/assistant messages.
+
+    Args:
+        messages: Messages with ``role`` and ``content`` keys.
+
+    Returns:
+        ChatHistory: A new chat history containing the messages.
+    """
+    chat_history = ChatHistory()
+    for msg in messages:
+        if msg["role"].lower() == "user":
+            chat_history.add_user_message(msg["content"])
+        elif msg["role"].lower() == "assistant":
+            chat_history.add_assistant_message(msg["content"])
+    return chat_history
+
+
+def create_execution_settings(temperature: float) -> AzureChatPromptExecutionSettings:
+    """Create the agent execution settings with automatic function calling."""
+    execution_settings = AzureChatPromptExecutionSettings(
+        service_id="chat",
+        temperature=temperature,
+        top_p=0.8,
+        max_tokens=1000,
+    )
+    execution_settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
+    return execution_settings
+
+
+def create_agents(kernel, agent_configs: List[Dict[str, str]]) -> List[ChatCompletionAgent]:
+    """
+    Create the group chat agents, falling back to the default perspectives.
+
+    Args:
+        kernel: The kernel shared by the agents.
+        agent_configs: Agent ``name``/``instructions`` pairs supplied by the client.
+
+    Returns:
+        list: The configured ChatCompletionAgents.
+    """
+    # Create agents based on the provided configurations
+    agents = []
+    for agent_config in agent_configs:
         agent = ChatCompletionAgent(
-            kernel=kernel, name="PlaygroundAgent", instructions=request.system_prompt
+            kernel=kernel,
+            name=agent_config.get("name", "Agent"),
+            instructions=agent_config.get(
+                "instructions", "You are a helpful assistant."
+            ),
+        )
+        agents.append(agent)
+
+    # If no agents were provided, create default agents
+    if not agents:
+        # Create default agents with different perspectives
+        agent_factual = ChatCompletionAgent(
+            kernel=kernel,
+            name="Researcher",
+            instructions="You are a fact-based researcher who provides accurate and concise information. Always stick to verified facts and cite sources when possible. Keep your responses very concise, clear and straightforward.",
         )
 
-        # Create a chat history
-        chat_history = ChatHistory()
-
-        # Add previous messages from the chat history if available
-        for msg in request.chat_history:
-            if msg["role"].lower() == "user":
-                chat_history.add_user_message(msg["content"])
-            elif msg["role"].lower() == "assistant":
-                chat_history.add_assistant_message(msg["content"])
+        agent_creative = ChatCompletionAgent(
+            kernel=kernel,
+            name="Innovator",
+            instructions="You are a creative thinker who generates novel ideas and perspectives. Offer innovative approaches and unique ideas. Feel free to brainstorm and suggest creative solutions. Keep your responses very concise, imaginative and engaging.",
+        )
 
-        # Add the current user message
-        chat_history.add_user_message(request.message)
+        agent_critic = ChatCompletionAgent(
+            kernel=kernel,
+            name="Critic",
+            instructions="You are a thoughtful critic who evaluates ideas and identifies potential issues. Analyze the strengths and weaknesses of proposals and suggest improvements. Be constructive in your criticism. Keep your responses very concise, clear and straightforward.",
+        )
 
-        # Create execution settings
-        execution_settings = AzureChatPromptExecutionSettings(
-            service_id="chat",
-            temperature=request.temperature,
-            top_p=0.8,
-            max_tokens=1000,
+        agent_synthesizer = ChatCompletionAgent(
+            kernel=kernel,
+            name="Synthesizer",
+            instructions="You are a skilled synthesizer who integrates diverse perspectives into coherent conclusions. Identify common themes across different viewpoints and create a balanced, integrated perspective. Keep your responses very concise, clear and straightforward.",
         )
 
-        # Set up function calling behavior
-        execution_settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
+        agents = [agent_factual, agent_creative, agent_critic, agent_synthesizer]
+
+    return agents
+
+
+async def create_group_chat(
+    kernel, request: MultiAgentRequest, session: Optional[AgentSession] = None
+) -> Tuple[AgentGroupChat, ChatHistory]:
+    """
+    Create a sequential group chat seeded with the conversation and message.
+
+    Args:
+        kernel: The kernel shared by the agents.
+        request: The multi-agent request.
+        session: Server-side session whose history the group chat continues;
+            without one, the history is built from ``request.chat_history``.
+            The group chat works on a copy, which the caller stores back in
+            the session once the turn succeeds, so a failed or abandoned turn
+            leaves the session as it was.
+
+    Returns:
+        Tuple[AgentGroupChat, ChatHistory]: The group chat and its history.
+    """
+    # Create a group chat with the agents
+    group_chat = AgentGroupChat(
+        agents=create_agents(kernel, request.agent_configs),
+        selection_strategy=SequentialSelectionStrategy(),
+        termination_strategy=DefaultTerminationStrategy(
+            maximum_iterations=request.max_iterations
+        ),
+    )
+
+    # Add previous messages from the session or the client's chat history
+    if session is not None:
+        # Copying the session's message list reuses the message objects as is
+        group_chat.history = ChatHistory(messages=list(session.chat_history.messages))
+    else:
+        group_chat.history = build_chat_history(request.chat_history)
+
+    # Add the current user message
+    await group_chat.add_chat_message(message=request.message)
+
+    return group_chat, group_chat.history
+
+
+async def invoke_group_chat_turns(
+    group_chat: AgentGroupChat, stream_tokens: bool = False
+) -> AsyncIterator[Tuple[int, Union[ChatMessageContent, StreamingChatMessageContent]]]:
+    """
+    Invoke a group chat, yielding each message with the index of its turn.
+
+    Runs the same loop as ``AgentGroupChat.invoke``, one selected agent per
+    iteration, so a turn ends with its iteration even when the selection
+    strategy picks the same agent twice in a row.
+
+    Args:
+        group_chat: The group chat, seeded with the conversation.
+        stream_tokens (bool): Yield streamed chunks instead of whole messages.
+    """
+    strategy = group_chat.termination_strategy
+    for turn in range(strategy.maximum_iterations):
+        agent = await group_chat.selection_strategy.next(
+            group_chat.agents, group_chat.history.messages
+        )
+        messages = (
+            group_chat.invoke_stream(agent, is_joining=False)
+            if stream_tokens
+            else group_chat.invoke(agent, is_joining=False)
+        )
+        async with aclosing(messages):
+            async for message in messages:
+                yield turn, message
 
-        # Get the response from the agent
-        response = await agent.get_response(
-            messages=chat_history, execution_settings=execution_settings
+        group_chat.is_complete = await strategy.should_terminate(
+            agent, group_chat.history.messages
         )
+        if group_chat.is_complete:
+            break
+
+
+async def run_parallel_round(
+    kernel,
+    request: MultiAgentRequest,
+    tool_calls: ToolCallRecorder,
+    session: Optional[AgentSession] = None,
+) -> Dict[str, Any]:
+    """
+    Run one fan-out round: independent agents answer concurrently, then the
+    Synthesizer (or the last configured agent) merges their answers.
+
+    Args:
+        kernel: The kernel shared by the agents.
+        request: The multi-agent request.
+        tool_calls: The recorder attached to the kernel.
+        session: Server-side session the round continues and is appended to.
+
+    Returns:
+        dict: The multi-chat response payload with per-stage timings.
+    """
+    agents = create_agents(kernel, request.agent_configs)
+    synthesizer = next((a for a in agents if a.name == "Synthesizer"), agents[-1])
+    independent_agents = [agent for agent in agents if agent is not synthesizer]
+
+    execution_settings = create_execution_settings(request.temperature)
+    semaphore = asyncio.Semaphore(max(1, request.max_concurrency))
+
+    def conversation() -> ChatHistory:
+        # Copying the session's message list reuses the message objects as is
+        if session is not None:
+            chat_history = ChatHistory(messages=list(session.chat_history.messages))
+        else:
+            chat_history = build_chat_history(request.chat_history)
+        chat_history.add_user_message(request.message)
+        return chat_history
 
-        # Track function calls
-        plugin_calls = []
-
-        # Extract function calls from the chat history
-        for message in chat_history:
-            for item in message.items:
-                if isinstance(item, FunctionCallContent):
-                    # Convert arguments to a dictionary if it's a string
-                    args = item.arguments
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except:
-                            args = {"location": args}
-
-                    plugin_calls.append(
-                        {
-                            "plugin_name": item.plugin_name,
-                            "function_name": item.function_name,
-                            "parameters": args,
-                        }
-                    )
+    async def answer(agent: ChatCompletionAgent) -> Dict[str, Any]:
+        # Every agent sees the same conversation, not each other's answers
+        chat_history = conversation()
+
+        async with semaphore:
+            start_time = time.perf_counter()
+            response = await agent.get_response(
+                messages=chat_history, execution_settings=execution_settings
+            )
+            latency_ms = (time.perf_counter() - start_time) * 1000
 
-        # Return the agent's response along with the updated chat history and plugin calls
         return {
-            "response": response.content,
-            "chat_history": [
-                {"role": "user", "content": request.message},
-                {"role": "assistant", "content": response.content},
-            ],
-            "plugin_calls": plugin_calls,
+            "agent_name": agent.name,
+            "content": response.message.content,
+            "latency_ms": round(latency_ms, 1),
         }
-    except Exception as e:
-        logger.error(f"Error in agent_chat: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
 
+    # Fan-out stage
+    fan_out_start = time.perf_counter()
+    answers = await asyncio.gather(*(answer(agent) for agent in independent_agents))
+    fan_out_ms = (time.perf_counter() - fan_out_start) * 1000
+
+    # Synthesis stage sees the conversation plus every independent answer
+    synthesis_history = conversation()
+    for agent_answer in answers:
+        synthesis_history.add_message(
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                content=agent_answer["content"],
+                name=agent_answer["agent_name"],
+            )
+        )
+
+    synthesis_start = time.perf_counter()
+    synthesis = await synthesizer.get_response(
+        messages=synthesis_history, execution_settings=execution_settings
+    )
+    synthesis_ms = (time.perf_counter() - synthesis_start) * 1000
+
+    agent_responses = [
+        {"agent_name": a["agent_name"], "content": a["content"], "is_new": True}
+        for a in answers
+    ]
+    agent_responses.append(
+        {
+            "agent_name": synthesizer.name,
+            "content": synthesis.message.content,
+            "is_new": True,
+        }
+    )
+
+    if session is not None:
+        session.chat_history.add_user_message(request.message)
+        for resp in agent_responses:
+            session.chat_history.add_message(
+                ChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    content=resp["content"],
+                    name=resp["agent_name"],
+                )
+            )
+        await save_session(
+            session, [request.message] + [r["content"] for r in agent_responses]
+        )
+
+    return {
+        "agent_responses": agent_responses,
+        "chat_history": [{"role": "user", "content": request.message}]
+        + [
+            {
+                "role": "assistant",
+                "content": resp["content"],
+                "agent_name": resp["agent_name"],
+            }
+            for resp in agent_responses
+        ],
+        "plugin_calls": tool_calls.plugin_calls(),
+        "peak_tool_concurrency": tool_calls.peak_in_flight,
+        "timings": {
+            "fan_out_ms": round(fan_out_ms, 1),
+            "synthesis_ms": round(synthesis_ms, 1),
+            "total_ms": round(fan_out_ms + synthesis_ms, 1),
+            "agents": [
+                {"agent_name": a["agent_name"], "latency_ms": a["latency_ms"]}
+                for a in answers
+            ]
+            + [{"agent_name": synthesizer.name, "latency_ms": round(synthesis_ms, 1)}],
+        },
+        **session_fields(session),
+    }
+
+
+@router.post("/chat")
+async def agent_chat(request: AgentRequest):
+    # Continue or start a server-side session when the client asks for one
+    session = await resolve_session(request, "chat")
 
-@router.post("/multi-chat")
-async def multi_agent_chat(request: MultiAgentRequest):
     # Create a fresh kernel with the requested plugins
     kernel, _ = create_kernel(plugins=request.available_plugins)
+    tool_calls = record_tool_calls(
+        kernel, request.tool_concurrency, request.tool_timeout
+    )
 
     try:
-        # Create agents based on the provided configurations
-        agents = []
-        for agent_config in request.agent_configs:
+        async with session.lock if session is not None else nullcontext():
+            # Create a ChatCompletionAgent with the provided system prompt
             agent = ChatCompletionAgent(
-                kernel=kernel,
-                name=agent_config.get("name", "Agent"),
-                instructions=agent_config.get(
-                    "instructions", "You are a helpful assistant."
-                ),
-            )
-            agents.append(agent)
-
-        # If no agents were provided, create default agents
-        if not agents:
-            # Create default agents with different perspectives
-            agent_factual = ChatCompletionAgent(
-                kernel=kernel,
-                name="Researcher",
-                instructions="You are a fact-based researcher who provides accurate and concise information. Always stick to verified facts and cite sources when possible. Keep your responses very concise, clear and straightforward.",
-            )
-
-            agent_creative = ChatCompletionAgent(
-                kernel=kernel,
-                name="Innovator",
-                instructions="You are a creative thinker who generates novel ideas and perspectives. Offer innovative approaches and unique ideas. Feel free to brainstorm and suggest creative solutions. Keep your responses very concise, imaginative and engaging.",
+                kernel=kernel, name="PlaygroundAgent", instructions=request.system_prompt
             )
 
-            agent_critic = ChatCompletionAgent(
-                kernel=kernel,
-                name="Critic",
-                instructions="You are a thoughtful critic who evaluates ideas and identifies potential issues. Analyze the strengths and weaknesses of proposals and suggest improvements. Be constructive in your criticism. Keep your responses very concise, clear and straightforward.",
+            # Answers only depend on the question itself for the first turn
+            cache_scope = None
+            first_turn = not request.chat_history and (
+                session is None or session.message_count == 0
             )
-
-            agent_synthesizer = ChatCompletionAgent(
-                kernel=kernel,
-                name="Synthesizer",
-                instructions="You are a skilled synthesizer who integrates diverse perspectives into coherent conclusions. Identify common themes across different viewpoints and create a balanced, integrated perspective. Keep your responses very concise, clear and straightforward.",
+            if request.semantic_cache and first_turn:
+                cache_scope = semantic_cache.scope_key(
+                    request.system_prompt, request.available_plugins
+                )
+                question_embedding = await embed_question(kernel, request.message)
+                cached = semantic_cache.lookup(
+                    cache_scope, request.message, question_embedding
+                )
+                if cached is not None:
+                    if session is not None:
+                        await session.thread.on_new_message(request.message)
+                        await session.thread.on_new_message(
+                            ChatMessageContent(
+                                role=AuthorRole.ASSISTANT, content=cached["response"]
+                            )
+                        )
+                        await save_session(session, [request.message, cached["response"]])
+                    return {
+                        "response": cached["response"],
+                        "chat_history": [
+                            {"role": "user", "content": request.message},
+                            {"role": "assistant", "content": cached["response"]},
+                        ],
+                        "plugin_calls": cached["plugin_calls"],
+                        "cached": True,
+                        **session_fields(session),
+                    }
+
+            # Create execution settings with function calling enabled
+            execution_settings = create_execution_settings(request.temperature)
+
+            # Get the response from the agent
+            start_time = time.perf_counter()
+            if session is not None:
+                # The session's thread already holds the conversation
+                response = await agent.get_response(
+                    messages=request.message,
+                    thread=session.thread,
+                    execution_settings=execution_settings,
+                )
+                await save_session(session, [request.message, response.message.content])
+            else:
+                # Create a chat history with the previous messages and the current one
+                chat_history = build_chat_history(request.chat_history)
+                chat_history.add_user_message(request.message)
+                response = await agent.get_response(
+                    messages=chat_history, execution_settings=execution_settings
+                )
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+        # The response item wraps the message; the text is on the message
+        answer = response.message.content
+
+        # Tool calls recorded while the agent answered, with their timings
+        plugin_calls = tool_calls.plugin_calls()
+
+        if cache_scope is not None:
+            semantic_cache.store(
+                cache_scope,
+                request.message,
+                question_embedding,
+                {"response": answer, "plugin_calls": plugin_calls},
+                latency_ms,
+                used_tools=bool(plugin_calls),
             )
 
-            agents = [agent_factual, agent_creative, agent_critic, agent_synthesizer]
-
-        # Create a group chat with the agents
-        group_chat = AgentGroupChat(
-            agents=agents,
-            selection_strategy=SequentialSelectionStrategy(),
-            termination_strategy=DefaultTerminationStrategy(
-                maximum_iterations=request.max_iterations
-            ),
-        )
+        # Return the agent's response along with the new messages and plugin calls
+        return {
+            "response": answer,
+            "chat_history": [
+                {"role": "user", "content": request.message},
+                {"role": "assistant", "content": answer},
+            ],
+            "plugin_calls": plugin_calls,
+            "peak_tool_concurrency": tool_calls.peak_in_flight,
+            **session_fields(session),
+        }
+    except Exception as e:
+        logger.error(f"Error in agent_chat: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
 
-        # Create a chat history
-        chat_history = ChatHistory()
-        group_chat.history = chat_history
-
-        # Add previous messages from the chat history if available
-        for msg in request.chat_history:
-            if msg["role"].lower() == "user":
-                chat_history.add_user_message(msg["content"])
-            elif msg["role"].lower() == "assistant":
-                chat_history.add_assistant_message(msg["content"])
-
-        # Add the current user message
-        await group_chat.add_chat_message(message=request.message)
-
-        # Create execution settings
-        execution_settings = AzureChatPromptExecutionSettings(
-            service_id="chat",
-            temperature=request.temperature,
-            top_p=0.8,
-            max_tokens=1000,
-        )
 
-        # Set up function calling behavior
-        execution_settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
+@router.post("/chat/stream")
+async def agent_chat_stream(request: AgentRequest):
+    session = await resolve_session(request, "chat")
 
-        # Track agent responses
-        agent_responses = []
-        current_agent = None
+    # Create a fresh kernel with the requested plugins
+    kernel, _ = create_kernel(plugins=request.available_plugins)
+    tool_calls = record_tool_calls(
+        kernel, request.tool_concurrency, request.tool_timeout
+    )
+
+    agent = ChatCompletionAgent(
+        kernel=kernel, name="PlaygroundAgent", instructions=request.system_prompt
+    )
+    execution_settings = create_execution_settings(request.temperature)
+
+    if session is not None:
+        # The session's thread already holds the conversation
+        stream_args = {"messages": request.message, "thread": session.thread}
+    else:
+        chat_history = build_chat_history(request.chat_history)
+        chat_history.add_user_message(request.message)
+        stream_args = {"messages": chat_history}
 
-        # Invoke the group chat
+    async def event_stream():
+        chunks = []
         try:
-            async for response in group_chat.invoke():
-                if response is not None and response.name:
-                    # Add a separator between different agents
-                    if current_agent != response.name:
-                        current_agent = response.name
-                        agent_responses.append(
-                            {
-                                "agent_name": response.name,
-                                "content": response.content,
-                                "is_new": True,
-                            }
-                        )
-                    else:
-                        # Same agent continuing
-                        agent_responses.append(
-                            {
-                                "agent_name": response.name,
-                                "content": response.content,
-                                "is_new": False,
-                            }
-                        )
-        except Exception as e:
-            logger.error(f"Error during group chat invocation: {str(e)}")
-            raise HTTPException(
-                status_code=500, detail=f"Error during group chat invocation: {str(e)}"
+            # The lock is held in the stream, since that is where the turn runs
+            async with session.lock if session is not None else nullcontext():
+                # Forward each token as soon as the model produces it
+                async for chunk in agent.invoke_stream(
+                    **stream_args, execution_settings=execution_settings
+                ):
+                    # Each item wraps a streamed message; the text is on the message
+                    content = chunk.message.content
+                    if content:
+                        chunks.append(content)
+                        yield format_sse({"content": content}, event="token")
+
+                response = "".join(chunks)
+                if session is not None:
+                    await save_session(session, [request.message, response])
+
+            # The final event carries the same payload as /agent/chat
+            yield format_sse(
+                {
+                    "response": response,
+                    "chat_history": [
+                        {"role": "user", "content": request.message},
+                        {"role": "assistant", "content": response},
+                    ],
+                    "plugin_calls": tool_calls.plugin_calls(),
+                    "peak_tool_concurrency": tool_calls.peak_in_flight,
+                    **session_fields(session),
+                },
+                event="done",
             )
+        except Exception as e:
+            logger.error(f"Error in agent_chat_stream: {str(e)}")
+            yield format_sse({"detail": str(e)}, event="error")
 
-        # Track function calls
-        plugin_calls = []
-
-        # Extract function calls from the chat history
-        for message in chat_history:
-            for item in message.items:
-                if isinstance(item, FunctionCallContent):
-                    # Convert arguments to a dictionary if it's a string
-                    args = item.arguments
-                    if isinstance(args, str):
-                        try:
-                            args = json.loads(args)
-                        except:
-                            args = {"location": args}
-
-                    plugin_calls.append(
-                        {
-                            "plugin_name": item.plugin_name,
-                            "function_name": item.function_name,
-                            "parameters": args,
-                        }
-                    )
+    return sse_response(event_stream())
 
-        # Reset is_complete to allow for further conversations
-        group_chat.is_complete = False
 
-        # Return the agent responses along with the updated chat history and plugin calls
+@router.post("/multi-chat")
+async def multi_agent_chat(request: MultiAgentRequest):
+    # Continue or start a server-side session when the client asks for one
+    session = await resolve_session(request, "multi-chat")
+
+    # Create a fresh kernel with the requested plugins
+    kernel, _ = create_kernel(plugins=request.available_plugins)
+    tool_calls = record_tool_calls(
+        kernel, request.tool_concurrency, request.tool_timeout
+    )
+
+    try:
+        async with session.lock if session is not None else nullcontext():
+            # Parallel mode answers concurrently and synthesizes in a second stage
+            if request.mode == "parallel":
+                return await run_parallel_round(kernel, request, tool_calls, session)
+
+            # Create the group chat seeded with the history and the current message
+            group_chat, chat_history = await create_group_chat(kernel, request, session)
+
+            # Create execution settings with function calling enabled
+            execution_settings = create_execution_settings(request.temperature)
+
+            # Track agent responses
+            agent_responses = []
+            current_agent = None
+
+            # Invoke the group chat
+            try:
+                async for response in group_chat.invoke():
+                    if response is not None and response.name:
+                        # Add a separator between different agents
+                        if current_agent != response.name:
+                            current_agent = response.name
+                            agent_responses.append(
+                                {
+                                    "agent_name": response.name,
+                                    "content": response.content,
+                                    "is_new": True,
+                                }
+                            )
+                        else:
+                            # Same agent continuing
+                            agent_responses.append(
+                                {
+                                    "agent_name": response.name,
+                                    "content": response.content,
+                                    "is_new": False,
+                                }
+                            )
+            except Exception as e:
+                logger.error(f"Error during group chat invocation: {str(e)}")
+                raise HTTPException(
+                    status_code=500, detail=f"Error during group chat invocation: {str(e)}"
+                )
+
+            # Tool calls recorded while the agent answered, with their timings
+            plugin_calls = tool_calls.plugin_calls()
+
+            # Reset is_complete to allow for further conversations
+            group_chat.is_complete = False
+
+            # The group chat appended the message and answers to the session history
+            if session is not None:
+                session.chat_history = chat_history
+                await save_session(
+                    session, [request.message] + [r["content"] for r in agent_responses]
+                )
+
+        # Return the agent responses along with the new messages and plugin calls
         return {
             "agent_responses": agent_responses,
             "chat_history": [{"role": "user", "content": request.message}]
@@ -251,7 +688,168 @@ async def multi_agent_chat(request: MultiAgentRequest):
                 for resp in agent_responses
             ],
             "plugin_calls": plugin_calls,
+            "peak_tool_concurrency": tool_calls.peak_in_flight,
+            **session_fields(session),
         }
     except Exception as e:
         logger.error(f"Error in multi_agent_chat: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/multi-chat/stream")
+async def multi_agent_chat_stream(request: MultiAgentRequest, http_request: Request):
+    session = await resolve_session(request, "multi-chat")
+
+    # Create a fresh kernel with the requested plugins
+    kernel, _ = create_kernel(plugins=request.available_plugins)
+    tool_calls = record_tool_calls(
+        kernel, request.tool_concurrency, request.tool_timeout
+    )
+
+    # A session's group chat is created in the stream, once its lock is held
+    group_chat = None
+    if session is None:
+        try:
+            group_chat, _ = await create_group_chat(kernel, request)
+        except Exception as e:
+            logger.error(f"Error in multi_agent_chat_stream: {str(e)}")
+            raise HTTPException(status_code=500, detail=str(e))
+
+    async def event_stream():
+        nonlocal group_chat
+        agent_responses = []
+        current_agent = None
+        turn_chunks = []
+        streamed_turn = None
+
+        def join_chunks(chunks: List[Tuple[str, str]]) -> Tuple[str, str]:
+            return chunks[0][0], "".join(chunk for _, chunk in chunks)
+
+        def complete_turn(agent_name: str, content: str) -> str:
+            nonlocal current_agent
+            agent_response = {
+                "agent_name": agent_name,
+                "content": content,
+                "is_new": agent_name != current_agent,
+            }
+            current_agent = agent_name
+            agent_responses.append(agent_response)
+            return format_sse(agent_response, event="turn")
+
+        try:
+            async with session.lock if session is not None else nullcontext():
+                if session is not None:
+                    group_chat, _ = await create_group_chat(kernel, request, session)
+
+                # Each agent turn (or token) is pushed as soon as it is produced
+                turns = invoke_group_chat_turns(group_chat, request.stream_tokens)
+                async with aclosing(turns):
+                    async for turn, response in turns:
+                        # Stop the remaining turns once the client has gone away
+                        if await http_request.is_disconnected():
+                            logger.info("Client disconnected, aborting group chat")
+                            return
+
+                        if response is None or not response.name:
+                            continue
+
+                        if not request.stream_tokens:
+                            yield complete_turn(response.name, response.content)
+                            continue
+
+                        # A new turn closes the previous agent's streamed turn
+                        if turn_chunks and turn != streamed_turn:
+                            yield complete_turn(*join_chunks(turn_chunks))
+                            turn_chunks = []
+
+                        streamed_turn = turn
+                        if response.content:
+                            turn_chunks.append((response.name, response.content))
+                            yield format_sse(
+                                {"agent_name": response.name, "content": response.content},
+                                event="token",
+                            )
+
+                if turn_chunks:
+                    yield complete_turn(*join_chunks(turn_chunks))
+
+                # The group chat appended the message and answers to the session history
+                if session is not None:
+                    session.chat_history = group_chat.history
+                    await save_session(
+                        session,
+                        [request.message] + [r["content"] for r in agent_responses],
+                    )
+
+            # The final event carries the same payload as /agent/multi-chat
+            yield format_sse(
+                {
+                    "agent_responses": agent_responses,
+                    "chat_history": [{"role": "user", "content": request.message}]
+                    + [
+                        {
+                            "role": "assistant",
+                            "content": resp["content"],
+                            "agent_name": resp["agent_name"],
+                        }
+                        for resp in agent_responses
+                    ],
+                    "plugin_calls": tool_calls.plugin_calls(),
+                    "peak_tool_concurrency": tool_calls.peak_in_flight,
+                    **session_fields(session),
+                },
+                event="done",
+            )
+        except Exception as e:
+            logger.error(f"Error during group chat streaming: {str(e)}")
+            yield format_sse({"detail": str(e)}, event="error")
+
+    return sse_response(event_stream())
+
+
+@router.get("/sessions")
+async def get_session_metrics():
+    """Report live agent sessions and how many were evicted or expired."""
+    return await agent_sessions.metrics()
+
+
+@router.get("/sessions/{session_id}")
+async def get_session(session_id: str):
+    """
+    Return a session's full conversation, e.g. for a client that lost its copy.
+
+    Args:
+        session_id: The ID returned when the session was started.
+    """
+    session = await agent_sessions.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+
+    chat_history = []
+    for message in await session.messages():
+        # Tool call and tool result messages carry no text
+        if message.content:
+            entry = {"role": message.role.value, "content": message.content}
+            if message.name:
+                entry["agent_name"] = message.name
+            chat_history.append(entry)
+
+    return {
+        "session_id": session.session_id,
+        "kind": session.kind,
+        "chat_history": chat_history,
+    }
+
+
+@router.delete("/sessions/{session_id}")
+async def end_session(session_id: str):
+    """
+    End a session and free its conversation.
+
+    Args:
+        session_id: The ID returned when the session was started.
+    """
+    if not await agent_sessions.delete(session_id):
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+
+    return {"status": "success", "message": f"Session {session_id} ended"}
@@ -1,22 +1,20 @@
 import logging
-from io import StringIO
+import os
 from fastapi import APIRouter, HTTPException
 from app.models.api_models import FilterRequest
 from app.core.kernel import create_kernel
-from app.filters.content_filters import ContentFilter, input_filter_fn, output_filter_fn
+from app.core.log_capture import capture_logs
+from app.core.streaming import sse_response, stream_kernel_function
+from app.filters.content_filters import content_filter, input_filter_fn, output_filter_fn
 from semantic_kernel.functions import kernel_function
 
 # Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/filters", tags=["filters"])
 
-# Run a test of our regex patterns to verify they work
-logger.info("Initializing filters API and testing regex patterns...")
-content_filter = ContentFilter()
-test_results = content_filter.test_patterns()
-logger.info(f"Pattern test results: {test_results}")
+# Upper bound on the debug logs returned with each response
+log_capture_max_bytes = int(os.getenv("LOG_CAPTURE_MAX_BYTES", "65536"))
 
 
 @router.post("/process")
@@ -24,28 +22,12 @@ async def process_with_filters(request: FilterRequest):
     try:
         kernel, _ = create_kernel()
 
-        # Set up log capture for this request
-        logs = ""
-        log_capture = StringIO()
-        log_handler = logging.StreamHandler(log_capture)
-        log_handler.setFormatter(
-            logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        )
-        # Set logging level to capture all messages
-        log_handler.setLevel(logging.DEBUG)
-
-        # Add handler to root logger to capture all logs
-        root_logger = logging.getLogger()
-        root_logger.addHandler(log_handler)
-
-        try:
+        # Capture the logs of this request only
+        with capture_logs(log_capture_max_bytes) as log_capture:
             # Directly log input for debugging
             logger.warning(
                 f"PROCESSING INPUT: {request.text[:50]}{'...' if len(request.text) > 50 else ''}")
 
-            # Process with the content filter
-            content_filter = ContentFilter()
-
             # Directly test the input for sensitive information
             logger.warning(f"Testing input directly with ContentFilter")
             filtered_input, input_detections = content_filter.redact_sensitive_info(
@@ -113,17 +95,25 @@ async def process_with_filters(request: FilterRequest):
                 },
             }
 
-        except Exception as e:
-            logger.error(f"Error in process_with_filters: {str(e)}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-        finally:
-            # Always clean up the log handler
-            if log_handler in root_logger.handlers:
-                root_logger.removeHandler(log_handler)
-            if log_capture and not log_capture.closed:
-                log_capture.close()
-
     except Exception as e:
         logger.error(f"Error in process_with_filters: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/process/stream")
+async def process_with_filters_stream(request: FilterRequest):
+    """
+    Stream the echo function with PII redacted from the output as it is generated.
+    """
+    kernel, _ = create_kernel()
+    kernel.add_filter("function_invocation", output_filter_fn)
+
+    echo_fn = kernel.add_function(
+        prompt="{{$input}}",
+        function_name="echo",
+        plugin_name="TestPlugin",
+    )
+
+    return sse_response(
+        stream_kernel_function(kernel, echo_fn, "result", input=request.text)
+    )
@@ -1,25 +1,81 @@
+import json
 import logging
+import os
+from typing import Optional, Union
 from fastapi import APIRouter, HTTPException
-from app.models.api_models import FunctionInput, TranslationRequest, SummarizeRequest
+from fastapi.responses import StreamingResponse
+from semantic_kernel.connectors.ai.open_ai import AzureChatPromptExecutionSettings
+from app.models.api_models import (
+    FunctionBatchInput,
+    FunctionInput,
+    SummarizeRequest,
+    TranslationRequest,
+)
+from app.core.batch_invoke import invoke_function_batch
 from app.core.kernel import create_kernel
+from app.core.streaming import format_sse, sse_response, stream_kernel_function
+from app.core.summarizer import summarizer
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["functions"])
 
+# Upper bound on the concurrency a batch request may ask for
+BATCH_MAX_CONCURRENCY = int(os.getenv("FUNCTIONS_BATCH_MAX_CONCURRENCY", "16"))
+
+
+def _prompt_settings(
+    max_tokens: int, temperature: Optional[float] = None
+) -> AzureChatPromptExecutionSettings:
+    """Create the execution settings for a prompt function."""
+    return AzureChatPromptExecutionSettings(
+        service_id="chat", max_tokens=max_tokens, temperature=temperature
+    )
+
+
+def _add_semantic_function(kernel, data: Union[FunctionInput, FunctionBatchInput]):
+    """Register the user-defined semantic function on the kernel."""
+    return kernel.add_function(
+        prompt=data.prompt,
+        function_name=data.function_name,
+        plugin_name=data.plugin_name,
+        prompt_execution_settings=_prompt_settings(500, data.temperature),
+    )
+
+
+def _add_translate_function(kernel, temperature: Optional[float] = None):
+    """Register the translation function on the kernel."""
+    translate_prompt = """
+        {{$input}}\n\nTranslate this into {{$target_language}}:"""
+
+    return kernel.add_function(
+        prompt=translate_prompt,
+        function_name="translator",
+        plugin_name="Translator",
+        prompt_execution_settings=_prompt_settings(500, temperature),
+    )
+
+
+def _add_summarize_function(kernel, temperature: Optional[float] = None):
+    """Register the summarization function on the kernel."""
+    summarize_prompt = """
+        {{$input}}\n\nTL;DR in one sentence:"""
+
+    return kernel.add_function(
+        prompt=summarize_prompt,
+        function_name="tldr",
+        plugin_name="Summarizer",
+        prompt_execution_settings=_prompt_settings(100, temperature),
+    )
+
 
 @router.post("/functions/semantic")
 async def invoke_semantic_function(data: FunctionInput):
     kernel, _ = create_kernel()
     try:
         # Create a semantic function
-        function = kernel.add_function(
-            prompt=data.prompt,
-            function_name=data.function_name,
-            plugin_name=data.plugin_name,
-            max_tokens=500,
-        )
+        function = _add_semantic_function(kernel, data)
 
         # Prepare parameters
         parameters = data.parameters or {}
@@ -33,20 +89,62 @@ async def invoke_semantic_function(data: FunctionInput):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/functions/semantic/stream")
+async def invoke_semantic_function_stream(data: FunctionInput):
+    kernel, _ = create_kernel()
+    try:
+        function = _add_semantic_function(kernel, data)
+    except Exception as e:
+        logger.error(f"Error in invoke_semantic_function_stream: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    parameters = data.parameters or {}
+    return sse_response(
+        stream_kernel_function(
+            kernel, function, "result", input=data.input_text, **parameters
+        )
+    )
+
+
+@router.post("/functions/semantic/batch")
+async def invoke_semantic_function_batch(data: FunctionBatchInput):
+    """
+    Run one semantic function over many inputs, streaming NDJSON results back.
+
+    The kernel and the function are created once for the whole batch. Each
+    line is a ``result`` or ``error`` event with the index of its input, in
+    completion order, followed by a final ``done`` event.
+    """
+    kernel, _ = create_kernel()
+    try:
+        function = _add_semantic_function(kernel, data)
+    except Exception as e:
+        logger.error(f"Error in invoke_semantic_function_batch: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def results():
+        try:
+            async for event in invoke_function_batch(
+                kernel,
+                function,
+                data.inputs,
+                parameters=data.parameters,
+                max_concurrency=min(data.max_concurrency, BATCH_MAX_CONCURRENCY),
+            ):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Error in invoke_semantic_function_batch: {str(e)}")
+            yield json.dumps({"event": "error", "detail": str(e)}) + "\n"
+
+    return StreamingResponse(results(), media_type="application/x-ndjson")
+
+
 @router.post("/translate")
 async def translate_text(request: TranslationRequest):
     kernel, _ = create_kernel()
     try:
         # Define a translation function
-        translate_prompt = """
-        {{$input}}\n\nTranslate this into {{$target_language}}:"""
-
-        translate_fn = kernel.add_function(
-            prompt=translate_prompt,
-            function_name="translator",
-            plugin_name="Translator",
-            max_tokens=500,
-        )
+        translate_fn = _add_translate_function(kernel, request.temperature)
 
         # Invoke the translation function
         result = await kernel.invoke(
@@ -59,25 +157,75 @@ async def translate_text(request: TranslationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/translate/stream")
+async def translate_text_stream(request: TranslationRequest):
+    kernel, _ = create_kernel()
+    translate_fn = _add_translate_function(kernel, request.temperature)
+
+    return sse_response(
+        stream_kernel_function(
+            kernel,
+            translate_fn,
+            "translated_text",
+            input=request.text,
+            target_language=request.target_language,
+        )
+    )
+
+
 @router.post("/summarize")
 async def summarize_text(request: SummarizeRequest):
     kernel, _ = create_kernel()
     try:
-        # Define a summarization function
-        summarize_prompt = """
-        {{$input}}\n\nTL;DR in one sentence:"""
+        # Condense long documents chunk by chunk until they fit in one prompt
+        condensed = None
+        async for event in summarizer.condense(kernel, request.text):
+            condensed = event
 
-        summarize_fn = kernel.add_function(
-            prompt=summarize_prompt,
-            function_name="tldr",
-            plugin_name="Summarizer",
-            max_tokens=100,
-        )
+        # Define a summarization function
+        summarize_fn = _add_summarize_function(kernel, request.temperature)
 
         # Invoke the summarization function
-        result = await kernel.invoke(summarize_fn, input=request.text)
+        result = await kernel.invoke(summarize_fn, input=condensed["text"])
 
-        return {"summary": str(result)}
+        return {
+            "summary": str(result),
+            "chunks": condensed["chunks"],
+            "cached_chunks": condensed["cached_chunks"],
+        }
     except Exception as e:
         logger.error(f"Error in summarize_text: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/summarize/stream")
+async def summarize_text_stream(request: SummarizeRequest):
+    """
+    Stream a summary as SSE, with ``progress`` events while long text is condensed.
+
+    Each ``progress`` event reports the chunks summarized so far at one level
+    of the map-reduce pipeline; the final summary then streams as ``token``
+    events followed by a ``done`` event.
+    """
+    kernel, _ = create_kernel()
+    summarize_fn = _add_summarize_function(kernel, request.temperature)
+
+    async def events():
+        condensed = None
+        try:
+            async for event in summarizer.condense(kernel, request.text):
+                if event["event"] == "progress":
+                    yield format_sse(event, event="progress")
+                else:
+                    condensed = event
+        except Exception as e:
+            logger.error(f"Error in summarize_text_stream: {str(e)}")
+            yield format_sse({"detail": str(e)}, event="error")
+            return
+
+        async for message in stream_kernel_function(
+            kernel, summarize_fn, "summary", input=condensed["text"]
+        ):
+            yield message
+
+    return sse_response(events())
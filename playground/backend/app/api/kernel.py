@@ -2,6 +2,10 @@ import logging
 from fastapi import APIRouter, HTTPException
 from app.models.api_models import KernelResetRequest
 from app.core.kernel import create_kernel, reset_memory
+from app.core.semantic_cache import semantic_cache
+from app.core.services import chat_limiter, chat_single_flight, embedding_limiter
+from app.core.summarizer import summarizer
+from app.filters.completion_cache import completion_cache
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,3 +40,23 @@ async def reset_kernel(request: KernelResetRequest):
     except Exception as e:
         logger.error(f"Error in reset_kernel: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/cache")
+async def get_cache_stats():
+    """Return hit rates and savings of the caches and request coalescing."""
+    return {
+        "completion_cache": completion_cache.stats(),
+        "semantic_cache": semantic_cache.stats(),
+        "single_flight": chat_single_flight.stats(),
+        "summary_chunk_cache": summarizer.stats(),
+    }
+
+
+@router.get("/rate-limits")
+async def get_rate_limit_stats():
+    """Return queue depth, wait times and throttling of the upstream rate limiters."""
+    return {
+        "chat": chat_limiter.stats(),
+        "embeddings": embedding_limiter.stats(),
+    }
@@ -1,13 +1,18 @@
+import json
 import logging
-from fastapi import APIRouter, HTTPException
-from app.models.api_models import MemoryItem, SearchQuery
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from app.models.api_models import MemoryBulkRequest, MemoryItem, SearchQuery
 from app.core.kernel import (
     create_kernel,
     FINANCE_COLLECTION,
     PERSONAL_COLLECTION,
     WEATHER_COLLECTION,
     initialize_memory,
+    memory_store,
 )
+from app.core.memory_ingest import ingest_memory_items
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,6 +41,67 @@ async def add_to_memory(item: MemoryItem):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/add-bulk")
+async def add_bulk_to_memory(
+    request: Request, batch_size: int = 64, max_concurrency: int = 4
+):
+    """
+    Add many items to memory, streaming NDJSON progress events back.
+
+    The body is either a JSON MemoryBulkRequest or, with an
+    ``application/x-ndjson`` content type, one MemoryItem per line; the latter
+    takes its settings from the query parameters. The body is read in full
+    before the response starts, since the streaming response listens for
+    client disconnects on the same receive channel.
+    """
+    if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+        body = await request.body()
+        ndjson_items = []
+        for line_number, line in enumerate(body.splitlines(), start=1):
+            if not line.strip():
+                continue
+            try:
+                ndjson_items.append(MemoryItem(**json.loads(line)))
+            except (ValueError, TypeError, ValidationError) as e:
+                raise HTTPException(
+                    status_code=422, detail=f"Invalid item on line {line_number}: {e}"
+                )
+
+        async def items():
+            for item in ndjson_items:
+                yield item
+
+    else:
+        try:
+            bulk_request = MemoryBulkRequest(**await request.json())
+        except (ValueError, TypeError, ValidationError) as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        batch_size = bulk_request.batch_size
+        max_concurrency = bulk_request.max_concurrency
+
+        async def items():
+            for item in bulk_request.items:
+                yield item
+
+    kernel, _ = create_kernel()
+
+    async def progress():
+        try:
+            async for event in ingest_memory_items(
+                items(),
+                kernel.get_service("embeddings"),
+                memory_store,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+            ):
+                yield json.dumps(event) + "\n"
+        except Exception as e:
+            logger.error(f"Error in add_bulk_to_memory: {str(e)}")
+            yield json.dumps({"event": "error", "detail": str(e)}) + "\n"
+
+    return StreamingResponse(progress(), media_type="application/x-ndjson")
+
+
 @router.post("/search")
 async def search_memory(query: SearchQuery):
     # Ensure memory is initialized before searching
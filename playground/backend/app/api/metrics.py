@@ -0,0 +1,30 @@
+import logging
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+from app.core.tracing import tracer
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics")
+async def get_metrics(format: str = "prometheus"):
+    """
+    Return latency histograms and token counts for every traced span.
+
+    Spans cover HTTP requests, kernel construction, prompt rendering, kernel
+    functions, tool calls and model calls, keyed by kind and name.
+
+    Args:
+        format (str): "prometheus" for the text exposition format, or "json"
+            for a summary with estimated percentiles.
+    """
+    if format == "json":
+        return tracer.summary()
+    if format != "prometheus":
+        raise HTTPException(status_code=400, detail=f"Unknown format: {format}")
+    return PlainTextResponse(
+        tracer.prometheus(), media_type="text/plain; version=0.0.4"
+    )
@@ -1,4 +1,9 @@
+import asyncio
+import copy
 import logging
+import os
+import uuid
+import weakref
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 from typing import Dict, List, Optional
 from enum import Enum
@@ -7,6 +12,7 @@ from pydantic import BaseModel
 from semantic_kernel import Kernel
 from semantic_kernel.core_plugins.text_memory_plugin import TextMemoryPlugin
 from semantic_kernel.kernel_pydantic import KernelBaseModel
+from semantic_kernel.processes.kernel_process.kernel_process import KernelProcess
 from semantic_kernel.processes.kernel_process.kernel_process_step import (
     KernelProcessStep,
 )
@@ -20,7 +26,6 @@ from semantic_kernel.processes.local_runtime.local_event import KernelProcessEve
 from semantic_kernel.processes.local_runtime.local_kernel_process import start
 from semantic_kernel.processes.process_builder import ProcessBuilder
 from semantic_kernel.functions import kernel_function
-from semantic_kernel.contents import ChatHistory
 
 from app.models.api_models import (
     ChatProcessRequest,
@@ -28,7 +33,14 @@ from app.models.api_models import (
     ContentProcessRequest,
     ContentResponse,
 )
+from app.core.checkpoints import (
+    CheckpointStore,
+    InMemoryCheckpointStore,
+    SQLiteCheckpointStore,
+)
+from app.core.context_builder import ChatContextBuilder
 from app.core.kernel import create_kernel
+from app.core.sessions import InMemorySessionStore, SessionStore, SQLiteSessionStore
 
 # Configure logging
 logging.basicConfig(
@@ -38,20 +50,135 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/process", tags=["process"])
 
-# In-memory storage for active chat processes
-active_processes: Dict[str, dict] = {}
+
+def create_session_store() -> SessionStore:
+    """
+    Create the chat session store from the environment.
+
+    PROCESS_SESSION_DB selects a SQLite store shared by every worker; otherwise
+    sessions are kept in memory, capped by PROCESS_SESSION_MAX_ENTRIES and
+    PROCESS_SESSION_MAX_BYTES. Idle sessions expire after
+    PROCESS_SESSION_IDLE_TTL_SECONDS.
+
+    Returns:
+        SessionStore: The configured session store.
+    """
+    idle_ttl = float(os.getenv("PROCESS_SESSION_IDLE_TTL_SECONDS", "1800"))
+    max_entries = int(os.getenv("PROCESS_SESSION_MAX_ENTRIES", "1000"))
+
+    db_path = os.getenv("PROCESS_SESSION_DB")
+    if db_path:
+        return SQLiteSessionStore(db_path, idle_ttl=idle_ttl, max_entries=max_entries)
+
+    max_bytes = os.getenv("PROCESS_SESSION_MAX_BYTES")
+    return InMemorySessionStore(
+        idle_ttl=idle_ttl,
+        max_entries=max_entries,
+        max_bytes=int(max_bytes) if max_bytes else None,
+    )
+
+
+# Storage for active chat processes; each session holds its step states
+session_store = create_session_store()
+
+# One lock per chat process on this worker, dropped once no request holds it
+_process_locks: "weakref.WeakValueDictionary[str, asyncio.Lock]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def process_lock(process_id: str) -> asyncio.Lock:
+    """
+    Return the lock that serializes the requests of one chat process.
+
+    A turn loads the saved step states, runs the process and saves the new
+    states; two turns running at once would both start from the same states,
+    and the one saved last would drop the other.
+    """
+    lock = _process_locks.get(process_id)
+    if lock is None:
+        lock = _process_locks[process_id] = asyncio.Lock()
+    return lock
+
+
+def create_checkpoint_store() -> CheckpointStore:
+    """
+    Create the process step checkpoint store from the environment.
+
+    PROCESS_CHECKPOINT_DB selects a SQLite store, so a process can be resumed
+    by any worker using the same file; otherwise checkpoints are kept in
+    memory. Diffs are written in batches of PROCESS_CHECKPOINT_BATCH_SIZE, or
+    PROCESS_CHECKPOINT_FLUSH_INTERVAL_SECONDS after they are queued.
+
+    Returns:
+        CheckpointStore: The configured checkpoint store.
+    """
+    options = dict(
+        batch_size=int(os.getenv("PROCESS_CHECKPOINT_BATCH_SIZE", "64")),
+        flush_interval=float(os.getenv("PROCESS_CHECKPOINT_FLUSH_INTERVAL_SECONDS", "0.5")),
+    )
+    db_path = os.getenv("PROCESS_CHECKPOINT_DB")
+    if db_path:
+        return SQLiteCheckpointStore(db_path, **options)
+    return InMemoryCheckpointStore(**options)
+
+
+# Step state of running chatbot processes, recorded after each emitted event
+checkpoint_store = create_checkpoint_store()
+
+# Fits each turn's context into a token budget, summarizing older turns
+context_builder = ChatContextBuilder(
+    token_budget=int(os.getenv("PROCESS_CONTEXT_TOKEN_BUDGET", "2000")),
+    summary_token_budget=int(os.getenv("PROCESS_SUMMARY_TOKEN_BUDGET", "256")),
+)
+
+# Kernel shared by all chat sessions, created on first use
+_chat_kernel: Optional[Kernel] = None
+
+
+def get_chat_kernel() -> Kernel:
+    """Return the kernel whose chat service answers every chat session."""
+    global _chat_kernel
+    if _chat_kernel is None:
+        _chat_kernel, _ = create_kernel(plugins=["Weather"])
+    return _chat_kernel
+
+
+async def emit_checkpointed(
+    context: KernelProcessStepContext, process_event: Enum, data=None
+) -> None:
+    """
+    Emit an event from a step, then checkpoint the step's state.
+
+    The local runtime's step context knows the ID of the process the step runs
+    in, its name, and its current state; other runtimes only emit the event.
+    """
+    await context.emit_event(process_event=process_event, data=data)
+    channel = context.step_message_channel
+    process_id = getattr(channel, "parent_process_id", None)
+    if process_id:
+        await checkpoint_store.record(
+            process_id, channel.name, channel.step_state.state
+        )
+
 
 # Define events for our chatbot process
 
 
 class ChatBotEvents(Enum):
     StartProcess = "startProcess"
+    UserMessage = "userMessage"
     IntroComplete = "introComplete"
     UserInputReceived = "userInputReceived"
     AssistantResponseGenerated = "assistantResponseGenerated"
     Exit = "exit"
 
 
+def is_exit_command(message: str) -> bool:
+    """Return whether a user message ends the conversation."""
+    return message.strip().lower() == "exit"
+
+
 # Define state for user input step
 
 
@@ -69,7 +196,7 @@ class IntroStep(KernelProcessStep):
         """Prints the introduction message."""
         logger.info("Welcome to the Semantic Kernel Process Framework Chatbot!")
         logger.info("Type 'exit' to end the conversation.")
-        return "Welcome to the Semantic Kernel Process Framework Chatbot!\nType 'exit' to end the conversation."
+        return "Welcome to the Semantic Kernel Process Framework Chatbot! Type 'exit' to end the conversation."
 
 
 # Create a step to handle user input
@@ -86,27 +213,23 @@ class UserInputStep(KernelProcessStep[UserInputState]):
         self.state = state.state
 
     @kernel_function(name="get_user_input")
-    async def get_user_input(self, context: KernelProcessStepContext):
-        """Gets the user input."""
+    async def get_user_input(self, context: KernelProcessStepContext, user_message: str):
+        """Gets the user input sent to the process by the API."""
         if not self.state:
             raise ValueError("State has not been initialized")
 
-        # In a real implementation, this would come from the API
-        # For now, we'll use a placeholder that will be replaced in the API endpoint
-        user_message = "__USER_MESSAGE_PLACEHOLDER__"
-
         logger.info(f"User input: {user_message}")
 
-        if "exit" in user_message.lower():
-            await context.emit_event(process_event=ChatBotEvents.Exit, data=None)
+        if is_exit_command(user_message):
+            await emit_checkpointed(context, ChatBotEvents.Exit)
             return
 
         self.state.current_input_index += 1
         self.state.user_inputs.append(user_message)
 
         # Emit the user input event
-        await context.emit_event(
-            process_event=ChatBotEvents.UserInputReceived, data=user_message
+        await emit_checkpointed(
+            context, ChatBotEvents.UserInputReceived, data=user_message
         )
 
 
@@ -115,6 +238,10 @@ class UserInputStep(KernelProcessStep[UserInputState]):
 
 class ChatBotState(KernelBaseModel):
     chat_messages: list = []
+    # Kept by the context builder: message token counts and the rolling summary
+    token_counts: list[int] = []
+    summary: str = ""
+    summary_upto: int = 0
 
 
 # Create a step to handle the chatbot response
@@ -130,22 +257,35 @@ class ChatBotResponseStep(KernelProcessStep[ChatBotState]):
         state.state = state.state or self.create_default_state()
         self.state = state.state
 
+    @kernel_function(name="add_intro_message")
+    async def add_intro_message(
+        self, context: KernelProcessStepContext, intro_message: str
+    ):
+        """Starts the chat history with the introduction message."""
+        self._append("system", intro_message)
+        await emit_checkpointed(
+            context, ChatBotEvents.IntroComplete, data=intro_message
+        )
+
     @kernel_function(name="get_chat_response")
     async def get_chat_response(
         self, context: KernelProcessStepContext, user_message: str, kernel: Kernel
     ):
         """Generates a response from the chat completion service."""
         # Add user message to the state
-        self.state.chat_messages.append({"role": "user", "content": user_message})
+        self._append("user", user_message)
 
         # Get chat completion service and generate a response
         chat_service = kernel.get_service(service_id="chat")
         settings = chat_service.instantiate_prompt_execution_settings(service_id="chat")
 
-        chat_history = ChatHistory()
-        chat_history.add_user_message(user_message)
-
         try:
+            # Fill the token budget with the newest messages and a rolling summary
+            session = self._session()
+            chat_history = await context_builder.build(session, chat_service)
+            self.state.summary = session.get("summary", "")
+            self.state.summary_upto = session.get("summary_upto", 0)
+
             response = await chat_service.get_chat_message_contents(
                 chat_history=chat_history, settings=settings
             )
@@ -159,35 +299,46 @@ class ChatBotResponseStep(KernelProcessStep[ChatBotState]):
             logger.info(f"Assistant: {answer}")
 
             # Update state with the response
-            self.state.chat_messages.append({"role": "assistant", "content": answer})
+            self._append("assistant", answer)
 
             # Emit an event: assistantResponse
-            await context.emit_event(
-                process_event=ChatBotEvents.AssistantResponseGenerated, data=answer
+            await emit_checkpointed(
+                context, ChatBotEvents.AssistantResponseGenerated, data=answer
             )
 
             return answer
         except Exception as e:
             logger.error(f"Error generating chat response: {str(e)}")
             error_message = f"Sorry, I encountered an error: {str(e)}"
-            self.state.chat_messages.append(
-                {"role": "assistant", "content": error_message}
-            )
-            await context.emit_event(
-                process_event=ChatBotEvents.AssistantResponseGenerated,
-                data=error_message,
+            self._append("assistant", error_message)
+            await emit_checkpointed(
+                context, ChatBotEvents.AssistantResponseGenerated, data=error_message
             )
             return error_message
 
+    def _session(self) -> dict:
+        # The context builder works on a session dict; the lists are shared
+        return {
+            "messages": self.state.chat_messages,
+            "token_counts": self.state.token_counts,
+            "summary": self.state.summary,
+            "summary_upto": self.state.summary_upto,
+        }
+
+    def _append(self, role: str, content: str) -> None:
+        context_builder.append(self._session(), role, content)
 
-# Function to run the chatbot process
 
+# Build the chatbot process graph
 
-async def run_chatbot_process():
-    """Function to run the chatbot process."""
-    # Create a kernel
-    kernel, _ = create_kernel(plugins=["Weather"])
 
+def build_chatbot_process() -> KernelProcess:
+    """
+    Build the chatbot process definition from its steps and events.
+
+    Returns:
+        KernelProcess: The built process, with each step in its default state.
+    """
     # Create a process builder
     process = ProcessBuilder(name="ChatBot")
 
@@ -201,33 +352,151 @@ async def run_chatbot_process():
         target=intro_step
     )
 
-    # Define the event that triggers the next step in the process
+    # The introduction opens the chat history
     intro_step.on_function_result(
         function_name=IntroStep.print_intro_message.__name__
-    ).send_event_to(target=user_input_step)
+    ).send_event_to(
+        target=response_step,
+        function_name=ChatBotResponseStep.add_intro_message.__name__,
+        parameter_name="intro_message",
+    )
+
+    # Each message sent to the process runs one turn of the conversation
+    process.on_input_event(event_id=ChatBotEvents.UserMessage).send_event_to(
+        target=user_input_step, parameter_name="user_message"
+    )
 
     # Define the event that triggers the process to stop
     user_input_step.on_event(event_id=ChatBotEvents.Exit).stop_process()
 
     # For the user step, send the user input to the response step
     user_input_step.on_event(event_id=ChatBotEvents.UserInputReceived).send_event_to(
-        target=response_step, parameter_name="user_message"
+        target=response_step,
+        function_name=ChatBotResponseStep.get_chat_response.__name__,
+        parameter_name="user_message",
     )
 
-    # For the response step, send the response back to the user input step
-    response_step.on_event(
-        event_id=ChatBotEvents.AssistantResponseGenerated
-    ).send_event_to(target=user_input_step)
+    # The turn ends with the response; the process waits for the next message
 
     # Build the kernel process
-    kernel_process = process.build()
+    return process.build()
+
+
+def instantiate_process(
+    template: KernelProcess,
+    process_id: Optional[str] = None,
+    step_states: Optional[Dict[str, dict]] = None,
+) -> KernelProcess:
+    """
+    Create a runnable copy of a built process with fresh state.
+
+    The local runtime writes the process ID and each step's state into the
+    definition it is started with, so a template cannot be started directly.
+    The copy gets new state objects, deep-copied from the template's initial
+    state, while the step types, edges and factories are shared with the
+    template. Nested processes are copied the same way.
+
+    Args:
+        template: The built process to copy; it is never modified.
+        process_id: The ID of the copy; the runtime assigns one if omitted.
+        step_states: Saved state by step name, such as a loaded checkpoint,
+            used instead of the initial state of those steps.
+
+    Returns:
+        KernelProcess: A process that can be started once.
+    """
+    step_states = step_states or {}
+    steps = [
+        instantiate_process(step)
+        if isinstance(step, KernelProcess)
+        else step.model_copy(
+            update={"state": _fresh_state(step, step_states.get(step.state.name))}
+        )
+        for step in template.steps
+    ]
+    state = template.state.model_copy(
+        update={"state": copy.deepcopy(template.state.state)}
+    )
+    if process_id:
+        state.id = process_id
+    return KernelProcess(
+        state=state,
+        steps=steps,
+        edges=template.output_edges,
+        factories=template.factories,
+    )
+
+
+def _fresh_state(step, saved: Optional[dict]) -> KernelProcessStepState:
+    if saved is None:
+        return step.state.model_copy(update={"state": copy.deepcopy(step.state.state)})
+    state_type = _state_type(step.inner_step_type)
+    restored = state_type.model_validate(saved) if state_type else saved
+    return step.state.model_copy(update={"state": restored})
 
-    # Start the process
-    await start(
-        process=kernel_process,
-        kernel=kernel,
-        initial_event=KernelProcessEvent(id=ChatBotEvents.StartProcess, data=None),
+
+def _state_type(step_type: type) -> Optional[type]:
+    """Return TState of a ``KernelProcessStep[TState]`` subclass, if it has one."""
+    for base in step_type.__mro__:
+        metadata = getattr(base, "__pydantic_generic_metadata__", None) or {}
+        if metadata.get("origin") is KernelProcessStep and metadata.get("args"):
+            return metadata["args"][0]
+    return None
+
+
+# Chatbot process definition, built on first use and shared by every run
+_chatbot_template: Optional[KernelProcess] = None
+
+
+def get_chatbot_process(
+    process_id: Optional[str] = None, step_states: Optional[Dict[str, dict]] = None
+) -> KernelProcess:
+    """Return a fresh instance of the chatbot process, building its template once."""
+    global _chatbot_template
+    if _chatbot_template is None:
+        _chatbot_template = build_chatbot_process()
+    return instantiate_process(_chatbot_template, process_id, step_states)
+
+
+# Function to run the chatbot process
+
+
+async def run_chatbot_process(
+    process_id: str,
+    event: ChatBotEvents,
+    data=None,
+    step_states: Optional[Dict[str, dict]] = None,
+) -> Dict[str, dict]:
+    """
+    Run the chatbot process on one input event until it waits for the next.
+
+    Every run is a fresh instance of the cached process template, started on
+    the shared chat kernel with the step states saved by the previous run.
+
+    Args:
+        process_id: The ID of the chat process.
+        event: ``StartProcess`` to open the chat, ``UserMessage`` for a turn.
+        data: The event data, such as the user message.
+        step_states: The step states returned by the previous run.
+
+    Returns:
+        dict: The state of each stateful step, by step name.
+    """
+    process_context = await start(
+        process=get_chatbot_process(process_id, step_states),
+        kernel=get_chat_kernel(),
+        initial_event=KernelProcessEvent(id=event, data=data),
     )
+    process = await process_context.get_state()
+    return {
+        step.state.name: step.state.state.model_dump(mode="json")
+        for step in process.steps
+        if step.state.state is not None
+    }
+
+
+def _chat_messages(step_states: Dict[str, dict]) -> List[dict]:
+    return step_states[ChatBotResponseStep.__name__]["chat_messages"]
 
 
 @router.post("/chat/start", response_model=ChatResponse)
@@ -245,26 +514,17 @@ async def start_chat_process(
         ChatResponse: The response containing the process ID and initial greeting
     """
     # Generate a unique process ID
-    import uuid
-
     process_id = str(uuid.uuid4())
 
-    # Create a kernel
-    kernel, _ = create_kernel(plugins=["Weather"])
-
-    # Store the process data
-    active_processes[process_id] = {"kernel": kernel, "messages": []}
-
-    # Add the intro message to the chat history
-    intro_message = "Welcome to the Semantic Kernel Process Framework Chatbot! Type 'exit' to end the conversation."
-    active_processes[process_id]["messages"].append(
-        {"role": "system", "content": intro_message}
-    )
+    # Run the introduction and store the step states for the next turn
+    step_states = await run_chatbot_process(process_id, ChatBotEvents.StartProcess)
+    await session_store.put(process_id, {"steps": step_states})
 
+    chat_history = _chat_messages(step_states)
     return ChatResponse(
         process_id=process_id,
-        response=intro_message,
-        chat_history=[{"role": "system", "content": intro_message}],
+        response=chat_history[-1]["content"],
+        chat_history=chat_history,
     )
 
 
@@ -280,77 +540,71 @@ async def send_message(process_id: str, request: ChatProcessRequest):
     Returns:
         ChatResponse: The response containing the chatbot's reply
     """
-    # Check if the process exists
-    if process_id not in active_processes:
-        raise HTTPException(status_code=404, detail="Chat process not found")
-
-    # Get the process data
-    process_data = active_processes[process_id]
-    kernel = process_data["kernel"]
-
-    # Add the user message to the chat history
     user_message = request.message
-    process_data["messages"].append({"role": "user", "content": user_message})
+    async with process_lock(process_id):
+        # Get the process data, if the process exists and has not expired; an
+        # expired process can still be restored with /chat/{process_id}/resume
+        process_data = await session_store.get(process_id)
+        if process_data is None:
+            raise HTTPException(status_code=404, detail="Chat process not found")
+
+        # Run one turn of the process from the state left by the previous one
+        step_states = await run_chatbot_process(
+            process_id,
+            ChatBotEvents.UserMessage,
+            data=user_message,
+            step_states=process_data["steps"],
+        )
+        await session_store.put(process_id, {"steps": step_states})
+
+    chat_history = _chat_messages(step_states)
 
     # Check for exit command
-    if user_message.lower() == "exit":
+    if is_exit_command(user_message):
         return ChatResponse(
             process_id=process_id,
             response="Goodbye! Chat session ended.",
-            chat_history=process_data["messages"]
-            + [{"role": "assistant", "content": "Goodbye! Chat session ended."}],
+            chat_history=chat_history
+            + [
+                {"role": "user", "content": user_message},
+                {"role": "assistant", "content": "Goodbye! Chat session ended."},
+            ],
         )
 
-    # Create a chat history from the existing messages
-    chat_history = ChatHistory()
-
-    # Add the last few messages for context (up to 5)
-    for message in process_data["messages"][-5:]:
-        if message["role"] == "user":
-            chat_history.add_user_message(message["content"])
-        elif message["role"] == "assistant":
-            chat_history.add_assistant_message(message["content"])
-        elif message["role"] == "system":
-            chat_history.add_system_message(message["content"])
-
-    # Get chat completion service
-    chat_service = kernel.get_service(service_id="chat")
-    settings = chat_service.instantiate_prompt_execution_settings(service_id="chat")
-
-    try:
-        # Get the response from the chat service
-        response = await chat_service.get_chat_message_contents(
-            chat_history=chat_history, settings=settings
-        )
+    return ChatResponse(
+        process_id=process_id,
+        response=chat_history[-1]["content"],
+        chat_history=chat_history,
+    )
 
-        if response is None:
-            raise ValueError("Failed to get a response from the chat service.")
 
-        assistant_response = response[0].content
-        logger.info(f"Assistant response: {assistant_response}")
+@router.post("/chat/{process_id}/resume", response_model=ChatResponse)
+async def resume_chat_process(process_id: str):
+    """
+    Resume a chat process from its checkpoints.
 
-        # Add the assistant response to the chat history
-        process_data["messages"].append(
-            {"role": "assistant", "content": assistant_response}
-        )
+    The step states are restored as of the last recorded event, on this or any
+    worker sharing the checkpoint store. The process is not restarted, so the
+    introduction is not replayed; the next message continues the conversation.
 
-        return ChatResponse(
-            process_id=process_id,
-            response=assistant_response,
-            chat_history=process_data["messages"],
-        )
-    except Exception as e:
-        logger.error(f"Error in send_message: {str(e)}")
-        error_message = f"Sorry, I encountered an error: {str(e)}"
+    Args:
+        process_id: The ID of the chat process
 
-        # Add the error message to the chat history
-        process_data["messages"].append({"role": "assistant", "content": error_message})
+    Returns:
+        ChatResponse: The last message and the restored chat history
+    """
+    async with process_lock(process_id):
+        step_states = await checkpoint_store.load(process_id)
+        if step_states is None:
+            raise HTTPException(status_code=404, detail="Process checkpoint not found")
+        await session_store.put(process_id, {"steps": step_states})
 
-        return ChatResponse(
-            process_id=process_id,
-            response=error_message,
-            chat_history=process_data["messages"],
-        )
+    chat_history = _chat_messages(step_states)
+    return ChatResponse(
+        process_id=process_id,
+        response=chat_history[-1]["content"],
+        chat_history=chat_history,
+    )
 
 
 @router.delete("/chat/{process_id}", response_model=dict)
@@ -364,11 +618,58 @@ async def end_chat_process(process_id: str):
     Returns:
         dict: A status message
     """
-    # Check if the process exists
-    if process_id not in active_processes:
+    # Remove the process from the session store, and its checkpoints
+    async with process_lock(process_id):
+        session_deleted = await session_store.delete(process_id)
+        checkpoints_deleted = await checkpoint_store.delete(process_id)
+    if not (session_deleted or checkpoints_deleted):
         raise HTTPException(status_code=404, detail="Chat process not found")
 
-    # Remove the process from active processes
-    del active_processes[process_id]
-
     return {"status": "success", "message": f"Chat process {process_id} ended"}
+
+
+@router.get("/metrics", response_model=dict)
+async def get_session_metrics():
+    """
+    Report live chat sessions, how many were evicted or expired, and checkpoint writes.
+
+    Returns:
+        dict: Session store and checkpoint store metrics
+    """
+    return {
+        **await session_store.metrics(),
+        "checkpoints": checkpoint_store.metrics(),
+    }
+
+
+@router.get("/checkpoints/{process_id}", response_model=dict)
+async def get_process_checkpoint(process_id: str):
+    """
+    Return the checkpointed step state of a chatbot process.
+
+    Args:
+        process_id: The ID of the process
+
+    Returns:
+        dict: The latest recorded state of each step
+    """
+    step_states = await checkpoint_store.load(process_id)
+    if step_states is None:
+        raise HTTPException(status_code=404, detail="Process checkpoint not found")
+    return {"process_id": process_id, "steps": step_states}
+
+
+@router.delete("/checkpoints/{process_id}", response_model=dict)
+async def delete_process_checkpoint(process_id: str):
+    """
+    Remove the checkpoints of a chatbot process.
+
+    Args:
+        process_id: The ID of the process
+
+    Returns:
+        dict: A status message
+    """
+    if not await checkpoint_store.delete(process_id):
+        raise HTTPException(status_code=404, detail="Process checkpoint not found")
+    return {"status": "success", "message": f"Checkpoints of process {process_id} removed"}
@@ -1,37 +1,77 @@
 import logging
-import json
+import time
+from typing import Dict, List
 from fastapi import APIRouter, HTTPException
 from app.models.api_models import WeatherRequest
 from app.core.kernel import create_kernel
+from app.core.semantic_cache import embed_question, semantic_cache
+from app.filters.tool_calls import record_tool_calls
 from semantic_kernel.connectors.ai.open_ai import AzureChatPromptExecutionSettings
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.connectors.ai.function_choice_behavior import (
     FunctionChoiceBehavior,
 )
 from semantic_kernel.agents import ChatCompletionAgent
-from semantic_kernel.contents import FunctionCallContent
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["weather"])
 
+UNAVAILABLE = "Unavailable: the weather service did not answer in time."
+
+
+def format_current_weather(current_weather: Dict) -> str:
+    """Format current conditions as a string."""
+    current_weather_str = f"Location: {current_weather['location']}\n"
+    current_weather_str += f"Temperature: {current_weather['temperature']}°F\n"
+    current_weather_str += f"Condition: {current_weather['condition']}\n"
+    current_weather_str += f"Humidity: {current_weather['humidity']}%\n"
+    current_weather_str += f"Wind Speed: {current_weather['wind_speed']} mph"
+    return current_weather_str
+
+
+def format_forecast(forecast: List[Dict]) -> str:
+    """Format a daily forecast as a string."""
+    forecast_str = ""
+    for day_forecast in forecast:
+        forecast_str += f"Day {day_forecast['day']}:\n"
+        forecast_str += f"  Temperature: {day_forecast['temperature']}°F\n"
+        forecast_str += f"  Condition: {day_forecast['condition']}\n"
+        forecast_str += f"  Humidity: {day_forecast['humidity']}%\n"
+        forecast_str += f"  Wind Speed: {day_forecast['wind_speed']} mph\n\n"
+    return forecast_str.strip()
+
 
 @router.post("/weather")
 async def get_weather(request: WeatherRequest):
     kernel, _ = create_kernel()
     try:
-        # Register the Weather plugin
-        from app.plugins.weather import WeatherPlugin
+        # Register the shared Weather plugin
+        from app.plugins.weather import weather_plugin
 
-        weather_plugin = WeatherPlugin()
         kernel.add_plugin(weather_plugin, "Weather")
 
         # Create a system message for the chat
         system_message = """
         You are a helpful weather assistant. When asked about weather, use the Weather plugin to get accurate information.
         For weather queries, first determine the location, then call the appropriate weather functions to get the data.
-        Always use get_current_weather for current conditions, get_forecast for future predictions, and get_weather_alert for any warnings."""
+        Always use get_current_weather for current conditions, get_forecast for future predictions, and get_weather_alert for any warnings.
+        When the question covers several cities, use get_weather_batch or get_forecast_batch to get all of them in one call."""
+
+        # Near-duplicate queries reuse a recent answer for a short while
+        cache_scope = None
+        if request.semantic_cache:
+            cache_scope = semantic_cache.scope_key(system_message, ["Weather"])
+            query_embedding = await embed_question(kernel, request.query)
+            cached = semantic_cache.lookup(cache_scope, request.query, query_embedding)
+            if cached is not None:
+                return {**cached, "cached": True}
+
+        # Record each tool call and its result as the agent makes it
+        tool_calls = record_tool_calls(
+            kernel, request.tool_concurrency, request.tool_timeout
+        )
 
         # Create a chat completion agent
         agent = ChatCompletionAgent(
@@ -47,100 +87,44 @@ async def get_weather(request: WeatherRequest):
         execution_settings.function_choice_behavior = FunctionChoiceBehavior.Auto()
 
         # Get response from the agent
+        start_time = time.perf_counter()
         response = await agent.get_response(
             messages=chat_history, execution_settings=execution_settings
         )
 
-        # Track function calls and results
-        function_calls = []
-        current_weather = None
-        forecast = None
-        alerts = None
-
-        # Extract function calls from the chat history
-        for message in chat_history:
-            for item in message.items:
-                if isinstance(item, FunctionCallContent):
-                    function_call = {
-                        "plugin_name": item.plugin_name,
-                        "function_name": item.function_name,
-                        "parameters": item.arguments,
-                    }
-                    function_calls.append(function_call)
-
-                    # Execute the function and store results
-                    if item.function_name == "get_current_weather":
-                        # Convert arguments to a dictionary if it's a string
-                        args = item.arguments
-                        if isinstance(args, str):
-                            try:
-                                args = json.loads(args)
-                            except:
-                                args = {"location": args}
-
-                        current_weather = await kernel.invoke(
-                            kernel.plugins["Weather"]["get_current_weather"], **args
-                        )
-                        if not isinstance(current_weather, dict):
-                            current_weather = current_weather.value
-
-                    elif item.function_name == "get_forecast":
-                        # Convert arguments to a dictionary if it's a string
-                        args = item.arguments
-                        if isinstance(args, str):
-                            try:
-                                args = json.loads(args)
-                            except:
-                                args = {"location": args}
-
-                        # Default to 3 days if not specified
-                        if "days" not in args:
-                            args["days"] = 3
-
-                        forecast = await kernel.invoke(
-                            kernel.plugins["Weather"]["get_forecast"], **args
-                        )
-                        if not isinstance(forecast, list):
-                            forecast = forecast.value
-
-                    elif item.function_name == "get_weather_alert":
-                        # Convert arguments to a dictionary if it's a string
-                        args = item.arguments
-                        if isinstance(args, str):
-                            try:
-                                args = json.loads(args)
-                            except:
-                                args = {"location": args}
-
-                        alerts = await kernel.invoke(
-                            kernel.plugins["Weather"]["get_weather_alert"], **args
-                        )
-                        if not isinstance(alerts, dict):
-                            alerts = alerts.value
+        # Report the calls the model made, their timings and the data it was given
+        function_calls = tool_calls.plugin_calls()
+        current_weather = tool_calls.last_result("get_current_weather")
+        forecast = tool_calls.last_result("get_forecast")
+        alerts = tool_calls.last_result("get_weather_alert")
+        weather_batch = tool_calls.last_result("get_weather_batch") or []
+        forecast_batch = tool_calls.last_result("get_forecast_batch") or []
 
         # Prepare response
-        result = {"assistant_response": str(response), "function_calls": function_calls}
+        result = {
+            "assistant_response": str(response),
+            "function_calls": function_calls,
+            "peak_tool_concurrency": tool_calls.peak_in_flight,
+        }
 
         # Add weather data if available
-        if current_weather:
-            # Format current weather as a string
-            current_weather_str = f"Location: {current_weather['location']}\n"
-            current_weather_str += f"Temperature: {current_weather['temperature']}°F\n"
-            current_weather_str += f"Condition: {current_weather['condition']}\n"
-            current_weather_str += f"Humidity: {current_weather['humidity']}%\n"
-            current_weather_str += f"Wind Speed: {current_weather['wind_speed']} mph"
-            result["current_weather"] = current_weather_str
-
-        if forecast:
-            # Format forecast as a string
-            forecast_str = ""
-            for day_forecast in forecast:
-                forecast_str += f"Day {day_forecast['day']}:\n"
-                forecast_str += f"  Temperature: {day_forecast['temperature']}°F\n"
-                forecast_str += f"  Condition: {day_forecast['condition']}\n"
-                forecast_str += f"  Humidity: {day_forecast['humidity']}%\n"
-                forecast_str += f"  Wind Speed: {day_forecast['wind_speed']} mph\n\n"
-            result["forecast"] = forecast_str.strip()
+        current_weathers = ([current_weather] if current_weather else []) + weather_batch
+        if current_weathers:
+            result["current_weather"] = "\n\n".join(
+                format_current_weather(current) for current in current_weathers
+            )
+        elif tool_calls.failed("get_current_weather", "get_weather_batch"):
+            result["current_weather"] = UNAVAILABLE
+
+        forecasts = [format_forecast(forecast)] if forecast else []
+        forecasts += [
+            f"Location: {entry['location']}\n{format_forecast(entry['forecast'])}"
+            for entry in forecast_batch
+        ]
+        if forecasts:
+            result["forecast"] = "\n\n".join(forecasts)
+        elif tool_calls.failed("get_forecast", "get_forecast_batch"):
+            result["forecast"] = UNAVAILABLE
 
         if alerts:
             # Format alerts as a string
@@ -150,6 +134,22 @@ async def get_weather(request: WeatherRequest):
                 )
             else:
                 result["alerts"] = f"No active weather alerts for {alerts['location']}."
+        elif tool_calls.failed("get_weather_alert"):
+            result["alerts"] = UNAVAILABLE
+
+        # Weather answers come from tool calls, so they get the short tool TTL;
+        # an answer missing data from a failed call is not worth reusing
+        if cache_scope is not None and not any(
+            call["status"] != "ok" for call in function_calls
+        ):
+            semantic_cache.store(
+                cache_scope,
+                request.query,
+                query_embedding,
+                result,
+                (time.perf_counter() - start_time) * 1000,
+                used_tools=True,
+            )
 
         return result
     except Exception as e:
@@ -0,0 +1,91 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelFunction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+async def invoke_function_batch(
+    kernel: Kernel,
+    function: KernelFunction,
+    inputs: List[Union[str, Dict[str, str]]],
+    parameters: Optional[Dict[str, str]] = None,
+    max_concurrency: int = 4,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Invoke one function over many inputs, yielding each result as it finishes.
+
+    At most ``max_concurrency`` invocations are in flight, and every upstream
+    call still passes the chat rate limiter. Results come back in completion
+    order and carry the index of their input. The result queue is bounded, so
+    a slow reader pauses the workers instead of buffering every result.
+
+    Args:
+        kernel: The kernel the function is invoked on.
+        function: The function, created once for the whole batch.
+        inputs: Each item is either the ``input`` text or a map of arguments.
+        parameters (dict, optional): Arguments shared by every item; an item's
+            own arguments take precedence.
+        max_concurrency (int): Invocations in flight at once.
+
+    Yields:
+        dict: A ``result`` or ``error`` event per input and a final ``done`` event.
+    """
+    max_concurrency = max(1, max_concurrency)
+    pending: asyncio.Queue = asyncio.Queue()
+    events: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+    stats = {"total": len(inputs), "succeeded": 0, "failed": 0}
+    start_time = time.perf_counter()
+
+    for index in range(len(inputs)):
+        pending.put_nowait(index)
+
+    def arguments(item: Union[str, Dict[str, str]]) -> Dict[str, str]:
+        if isinstance(item, str):
+            return {**(parameters or {}), "input": item}
+        return {**(parameters or {}), **item}
+
+    async def work():
+        while not pending.empty():
+            index = pending.get_nowait()
+            item_start = time.perf_counter()
+            try:
+                result = await kernel.invoke(function, **arguments(inputs[index]))
+                stats["succeeded"] += 1
+                event = {"event": "result", "index": index, "result": str(result)}
+            except Exception as e:
+                logger.error(f"Error invoking batch item {index}: {str(e)}")
+                stats["failed"] += 1
+                event = {"event": "error", "index": index, "detail": str(e)}
+            event["latency_ms"] = round((time.perf_counter() - item_start) * 1000, 1)
+            await events.put(event)
+
+    async def run():
+        workers = [
+            asyncio.create_task(work())
+            for _ in range(min(max_concurrency, len(inputs)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for worker in workers:
+                worker.cancel()
+        # Only reached once every worker finished, so the reader is still there;
+        # when the reader goes away the runner is cancelled and never gets here
+        await events.put(None)
+
+    runner = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+        await runner
+        elapsed_ms = (time.perf_counter() - start_time) * 1000
+        yield {"event": "done", **stats, "elapsed_ms": round(elapsed_ms, 1)}
+    finally:
+        # Wait for the cancelled workers, so their in-flight calls are released
+        runner.cancel()
+        await asyncio.gather(runner, return_exceptions=True)
@@ -0,0 +1,138 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    An in-memory LRU cache whose entries also expire after a time-to-live.
+
+    Reads refresh an entry's recency but not its expiry. When the cache is full
+    the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 3600.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self.expirations = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for ``key`` or ``default`` when missing or expired."""
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.expirations += 1
+            return default
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, evicting the least recently used entries."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove ``key`` and return its value, expired or not."""
+        entry = self._entries.pop(key, _MISSING)
+        return default if entry is _MISSING else entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCache:
+    """
+    A persistent key/value cache tier stored in SQLite.
+
+    Values are JSON documents with an absolute expiry. Queries run in a worker
+    thread so they never block the event loop; expired rows are pruned
+    periodically on write.
+    """
+
+    PRUNE_EVERY = 256
+
+    def __init__(self, path: str, table: str = "cache"):
+        self.path = path
+        self.table = table
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    def _get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT value FROM {self.table} WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def _set(self, key: str, value: Any, ttl: float) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                f"INSERT OR REPLACE INTO {self.table} (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, json.dumps(value), time.time() + ttl),
+            )
+            self._writes += 1
+            if self._writes % self.PRUNE_EVERY == 0:
+                self._connection.execute(
+                    f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)
+                )
+
+    def _clear(self) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(f"DELETE FROM {self.table}")
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the stored value for ``key``, or None when missing or expired."""
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a JSON-serializable ``value`` under ``key`` for ``ttl`` seconds."""
+        await asyncio.to_thread(self._set, key, value, ttl)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+
+def cache_stats(hits: int, misses: int, **extra: Any) -> Dict[str, Any]:
+    """Build a stats payload with the hit rate derived from hits and misses."""
+    lookups = hits + misses
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        **extra,
+    }
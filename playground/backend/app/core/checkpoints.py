@@ -0,0 +1,312 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def diff_state(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Describe how a step state changed as a compact diff.
+
+    Changed fields are sent whole under ``set``, except lists that only grew,
+    which send just their new items under ``append`` as ``[offset, items]``.
+    Removed fields are listed under ``unset``. An empty diff means no change.
+
+    Args:
+        old: The previous state, as a JSON-compatible dict.
+        new: The current state, as a JSON-compatible dict.
+
+    Returns:
+        dict: The diff that turns ``old`` into ``new`` with ``apply_diff``.
+    """
+    diff: Dict[str, Any] = {}
+    for key, value in new.items():
+        if key not in old:
+            diff.setdefault("set", {})[key] = value
+            continue
+        previous = old[key]
+        if previous == value:
+            continue
+        if (
+            isinstance(previous, list)
+            and isinstance(value, list)
+            and value[: len(previous)] == previous
+        ):
+            diff.setdefault("append", {})[key] = [len(previous), value[len(previous):]]
+        else:
+            diff.setdefault("set", {})[key] = value
+    removed = [key for key in old if key not in new]
+    if removed:
+        diff["unset"] = removed
+    return diff
+
+
+def apply_diff(state: Dict[str, Any], diff: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply a diff from ``diff_state`` to a state dict, returning the new state."""
+    state = dict(state)
+    state.update(diff.get("set", {}))
+    for key, (offset, items) in diff.get("append", {}).items():
+        state[key] = list(state.get(key, []))[:offset] + items
+    for key in diff.get("unset", []):
+        state.pop(key, None)
+    return state
+
+
+class CheckpointStore(ABC):
+    """
+    Base class for stores that persist process step state as it changes.
+
+    ``record`` is called with a step's state after each event the step emits.
+    Only the difference from the last recorded state of that step is kept, and
+    diffs are queued and written in batches: once ``batch_size`` are pending,
+    or ``flush_interval`` seconds after the first one was queued. ``load``
+    replays the diffs of a process into the state of each of its steps, so a
+    process can be resumed by ID on any worker sharing the same backend.
+
+    The last recorded state of up to ``max_tracked`` processes is kept in
+    memory to compute diffs; a process dropped from it gets a full snapshot on
+    its next change.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 64,
+        flush_interval: float = 0.5,
+        max_tracked: int = 1000,
+        compact_after: int = 50,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_tracked = max_tracked
+        self.compact_after = compact_after
+        self.diffs_written = 0
+        self.batches_written = 0
+        self.bytes_written = 0
+        # (process_id, step_name, diff JSON) waiting to be written, oldest first
+        self._pending: List[Tuple[str, str, str]] = []
+        # process_id -> step_name -> last recorded state, least recently used first
+        self._last: "OrderedDict[str, Dict[str, Dict[str, Any]]]" = OrderedDict()
+        self._flush_lock = asyncio.Lock()
+        self._flushing: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    def _write(self, rows: List[Tuple[str, str, str]]) -> None:
+        """Append a batch of (process_id, step_name, diff JSON) rows in one transaction."""
+
+    @abstractmethod
+    def _read(self, process_id: str) -> List[Tuple[int, str, str]]:
+        """Return the (seq, step_name, diff JSON) rows of a process in write order."""
+
+    @abstractmethod
+    def _replace(self, process_id: str, snapshots: Dict[str, Tuple[int, str]]) -> None:
+        """
+        Compact each step's rows up to ``seq`` into the snapshot diff given for it.
+
+        Rows written after ``seq``, by this or another worker, are kept.
+        """
+
+    @abstractmethod
+    def _delete(self, process_id: str) -> bool:
+        """Remove every row of a process, returning whether it had any."""
+
+    async def record(self, process_id: str, step_name: str, state: Any) -> None:
+        """
+        Queue the change in a step's state since it was last recorded.
+
+        Args:
+            process_id: The ID of the running process.
+            step_name: The name of the step within the process.
+            state: The step state, a pydantic model or a JSON-compatible dict.
+        """
+        if state is None:
+            return
+        current = state.model_dump(mode="json") if hasattr(state, "model_dump") else state
+
+        steps = self._last.setdefault(process_id, {})
+        self._last.move_to_end(process_id)
+        diff = diff_state(steps.get(step_name, {}), current)
+        steps[step_name] = current
+        while len(self._last) > self.max_tracked:
+            self._last.popitem(last=False)
+        if not diff:
+            return
+
+        self._pending.append((process_id, step_name, json.dumps(diff)))
+        if len(self._pending) >= self.batch_size:
+            await self.flush()
+        elif self._flushing is None or self._flushing.done():
+            self._flushing = asyncio.get_running_loop().create_task(self._flush_later())
+
+    async def flush(self) -> None:
+        """Write every queued diff."""
+        async with self._flush_lock:
+            while self._pending:
+                batch = self._pending[: self.batch_size]
+                del self._pending[: self.batch_size]
+                await asyncio.to_thread(self._write, batch)
+                self.diffs_written += len(batch)
+                self.batches_written += 1
+                self.bytes_written += sum(len(diff) for _, _, diff in batch)
+
+    async def load(self, process_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Rebuild the latest state of each step of a process.
+
+        Args:
+            process_id: The ID of the process.
+
+        Returns:
+            dict or None: Step name to state dict, or None if nothing was recorded.
+        """
+        await self.flush()
+        rows = await asyncio.to_thread(self._read, process_id)
+        if not rows:
+            return None
+
+        states: Dict[str, Dict[str, Any]] = defaultdict(dict)
+        last_seq: Dict[str, int] = {}
+        for seq, step_name, diff in rows:
+            states[step_name] = apply_diff(states[step_name], json.loads(diff))
+            last_seq[step_name] = seq
+        states = dict(states)
+
+        # Resuming here makes these the baseline for the next diffs
+        self._last[process_id] = {name: dict(state) for name, state in states.items()}
+        self._last.move_to_end(process_id)
+        if len(rows) > self.compact_after:
+            snapshots = {
+                name: (last_seq[name], json.dumps({"set": state}))
+                for name, state in states.items()
+            }
+            await asyncio.to_thread(self._replace, process_id, snapshots)
+        return states
+
+    async def forget(self, process_id: str) -> None:
+        """Write the pending diffs of a process and drop its in-memory baseline."""
+        await self.flush()
+        self._last.pop(process_id, None)
+
+    async def delete(self, process_id: str) -> bool:
+        """Remove every checkpoint of a process, returning whether it had any."""
+        self._pending = [row for row in self._pending if row[0] != process_id]
+        self._last.pop(process_id, None)
+        return await asyncio.to_thread(self._delete, process_id)
+
+    async def close(self) -> None:
+        """Write any queued diffs; called on shutdown."""
+        await self.flush()
+
+    def metrics(self) -> Dict[str, Any]:
+        return {
+            "pending_diffs": len(self._pending),
+            "diffs_written": self.diffs_written,
+            "batches_written": self.batches_written,
+            "bytes_written": self.bytes_written,
+            "tracked_processes": len(self._last),
+        }
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.flush_interval)
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Error writing process checkpoints: {str(e)}")
+
+
+class InMemoryCheckpointStore(CheckpointStore):
+    """Checkpoint store kept in process memory; processes resume only on this worker."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._rows: Dict[str, List[Tuple[int, str, str]]] = defaultdict(list)
+        self._seq = 0
+
+    def _write(self, rows: List[Tuple[str, str, str]]) -> None:
+        for process_id, step_name, diff in rows:
+            self._seq += 1
+            self._rows[process_id].append((self._seq, step_name, diff))
+
+    def _read(self, process_id: str) -> List[Tuple[int, str, str]]:
+        return list(self._rows.get(process_id, []))
+
+    def _replace(self, process_id: str, snapshots: Dict[str, Tuple[int, str]]) -> None:
+        rows = []
+        for seq, step_name, diff in self._rows.get(process_id, []):
+            snapshot = snapshots.get(step_name)
+            if snapshot is None or seq > snapshot[0]:
+                rows.append((seq, step_name, diff))
+            elif seq == snapshot[0]:
+                rows.append((seq, step_name, snapshot[1]))
+        self._rows[process_id] = rows
+
+    def _delete(self, process_id: str) -> bool:
+        return self._rows.pop(process_id, None) is not None
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """
+    Checkpoint store persisted in SQLite, shared by every worker using the same file.
+
+    Each batch is one transaction. Queries run in a worker thread so they never
+    block the event loop.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS checkpoints (seq INTEGER PRIMARY KEY "
+                "AUTOINCREMENT, process_id TEXT NOT NULL, step TEXT NOT NULL, "
+                "diff TEXT NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS checkpoints_process "
+                "ON checkpoints (process_id, seq)"
+            )
+
+    def _write(self, rows: List[Tuple[str, str, str]]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT INTO checkpoints (process_id, step, diff) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def _read(self, process_id: str) -> List[Tuple[int, str, str]]:
+        with self._lock:
+            return self._connection.execute(
+                "SELECT seq, step, diff FROM checkpoints WHERE process_id = ? "
+                "ORDER BY seq",
+                (process_id,),
+            ).fetchall()
+
+    def _replace(self, process_id: str, snapshots: Dict[str, Tuple[int, str]]) -> None:
+        with self._lock, self._connection:
+            for step_name, (seq, diff) in snapshots.items():
+                self._connection.execute(
+                    "UPDATE checkpoints SET diff = ? WHERE seq = ?", (diff, seq)
+                )
+                self._connection.execute(
+                    "DELETE FROM checkpoints WHERE process_id = ? AND step = ? "
+                    "AND seq < ?",
+                    (process_id, step_name, seq),
+                )
+
+    def _delete(self, process_id: str) -> bool:
+        with self._lock, self._connection:
+            return (
+                self._connection.execute(
+                    "DELETE FROM checkpoints WHERE process_id = ?", (process_id,)
+                ).rowcount
+                > 0
+            )
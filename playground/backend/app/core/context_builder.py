@@ -0,0 +1,174 @@
+import logging
+from typing import Any, Dict, List
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
+from semantic_kernel.contents import ChatHistory
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Tokenizer used by the gpt-4o family; falls back to a character heuristic
+_encoding = None
+if tiktoken is not None:
+    try:
+        _encoding = tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning(f"tiktoken encoding unavailable, estimating tokens: {str(e)}")
+
+# Tokens added per message for the role and message framing
+MESSAGE_OVERHEAD_TOKENS = 4
+
+SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a conversation. Merge the new messages "
+    "into the existing summary. Keep names, numbers, decisions and open "
+    "questions; drop small talk. Reply with the updated summary only."
+)
+
+
+def count_tokens(text: str) -> int:
+    """
+    Count the tokens of a piece of text.
+
+    Uses tiktoken when it is installed and roughly four characters per token
+    otherwise.
+    """
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return len(text) // 4 + 1
+
+
+def estimate_tokens(text: str) -> int:
+    """Count the tokens of a message, including the per-message framing overhead."""
+    return count_tokens(text) + MESSAGE_OVERHEAD_TOKENS
+
+
+class ChatContextBuilder:
+    """
+    Builds the prompt context for a chat session within a token budget.
+
+    The session is a JSON-serializable dict holding ``messages`` plus the state
+    kept by this builder: ``token_counts`` (one per message, computed once at
+    append time), and a rolling ``summary`` of every message before
+    ``summary_upto``. Recent messages fill the budget newest first; messages
+    that no longer fit are folded into the summary. Folding shrinks the window
+    to ``fold_ratio`` of the budget, so the summary is regenerated once every
+    few turns rather than on every turn.
+    """
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        summary_token_budget: int = 256,
+        fold_ratio: float = 0.6,
+    ):
+        self.token_budget = token_budget
+        self.summary_token_budget = summary_token_budget
+        self.fold_ratio = fold_ratio
+
+    def append(self, session: Dict[str, Any], role: str, content: str) -> None:
+        """Add a message to the session and record its token count."""
+        # Backfill the earlier counts first, so the new message is counted once
+        token_counts = self._token_counts(session)
+        session.setdefault("messages", []).append({"role": role, "content": content})
+        token_counts.append(estimate_tokens(content))
+
+    async def build(
+        self, session: Dict[str, Any], chat_service: ChatCompletionClientBase
+    ) -> ChatHistory:
+        """
+        Build the chat history for the next completion, folding old turns if needed.
+
+        Args:
+            session: The session dict; its summary state is updated in place.
+            chat_service: The service used to regenerate the rolling summary.
+
+        Returns:
+            ChatHistory: The summary (if any) followed by the newest messages.
+        """
+        messages = session.get("messages", [])
+        token_counts = self._token_counts(session)
+        summary_upto = session.get("summary_upto", 0)
+        summary = session.get("summary", "")
+
+        budget = self.token_budget
+        if summary:
+            budget -= estimate_tokens(summary)
+        start = self._window_start(token_counts, summary_upto, budget)
+
+        if start > summary_upto:
+            # Fold everything outside a smaller window so the next turns still fit
+            budget = self.token_budget - self.summary_token_budget
+            start = self._window_start(
+                token_counts, summary_upto, int(budget * self.fold_ratio)
+            )
+            summary = await self._summarize(
+                chat_service, summary, messages[summary_upto:start]
+            )
+            session["summary"] = summary
+            session["summary_upto"] = start
+            logger.info(f"Folded {start - summary_upto} messages into the summary")
+
+        chat_history = ChatHistory()
+        if summary:
+            chat_history.add_system_message(
+                f"Summary of the earlier conversation: {summary}"
+            )
+        for message in messages[start:]:
+            _add_message(chat_history, message)
+        return chat_history
+
+    def _token_counts(self, session: Dict[str, Any]) -> List[int]:
+        # Backfill counts for sessions created before they were tracked
+        messages = session.get("messages", [])
+        token_counts = session.setdefault("token_counts", [])
+        for message in messages[len(token_counts) :]:
+            token_counts.append(estimate_tokens(message["content"]))
+        return token_counts
+
+    @staticmethod
+    def _window_start(token_counts: List[int], floor: int, budget: int) -> int:
+        """Return the first index of the newest messages that fit in the budget."""
+        used = 0
+        start = len(token_counts)
+        while start > floor and used + token_counts[start - 1] <= budget:
+            start -= 1
+            used += token_counts[start]
+        # Always keep the newest message, even if it alone exceeds the budget
+        return min(start, max(len(token_counts) - 1, floor))
+
+    async def _summarize(
+        self,
+        chat_service: ChatCompletionClientBase,
+        summary: str,
+        messages: List[Dict[str, str]],
+    ) -> str:
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        chat_history = ChatHistory()
+        chat_history.add_system_message(SUMMARY_INSTRUCTIONS)
+        chat_history.add_user_message(
+            f"Existing summary:\n{summary or '(none)'}\n\nNew messages:\n{transcript}"
+        )
+
+        settings = chat_service.instantiate_prompt_execution_settings(service_id="chat")
+        settings.max_tokens = self.summary_token_budget
+        response = await chat_service.get_chat_message_contents(
+            chat_history=chat_history, settings=settings
+        )
+        if not response:
+            return summary
+        return response[0].content
+
+
+def _add_message(chat_history: ChatHistory, message: Dict[str, str]) -> None:
+    if message["role"] == "user":
+        chat_history.add_user_message(message["content"])
+    elif message["role"] == "assistant":
+        chat_history.add_assistant_message(message["content"])
+    elif message["role"] == "system":
+        chat_history.add_system_message(message["content"])
@@ -2,12 +2,6 @@ import os
 import logging
 from typing import Tuple, List, Optional
 import semantic_kernel as sk
-from semantic_kernel.connectors.ai.open_ai.services.azure_chat_completion import (
-    AzureChatCompletion,
-)
-from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import (
-    AzureTextEmbedding,
-)
 from semantic_kernel.memory.semantic_text_memory import SemanticTextMemory
 from semantic_kernel.memory.volatile_memory_store import VolatileMemoryStore
 from semantic_kernel.core_plugins.text_memory_plugin import TextMemoryPlugin
@@ -15,6 +9,24 @@ from dotenv import load_dotenv
 import time
 from semantic_kernel.filters import FunctionInvocationContext
 from typing import Callable, Awaitable
+from app.core.memory_ingest import ingest_memory_items
+from app.core.services import (
+    SharedAzureChatCompletion,
+    SharedAzureTextEmbedding,
+    SharedMockChatCompletion,
+    SharedMockTextEmbedding,
+)
+from app.core.tracing import tracer
+from app.filters.completion_cache import (
+    completion_cache_invocation_filter,
+    completion_cache_render_filter,
+)
+from app.filters.tracing import (
+    tracing_invocation_filter,
+    tracing_render_filter,
+    tracing_tool_filter,
+)
+from app.models.api_models import MemoryItem
 
 # Load environment variables
 load_dotenv("../../.env", override=True)
@@ -33,8 +45,41 @@ embedding_deployment = os.getenv(
     "AZURE_OPENAI_EMBEDDING_DEPLOYMENT_NAME", "text-embedding-ada-002"
 )
 
+# "azure" for the real services, "mock" for deterministic local stand-ins
+ai_service_mode = os.getenv("AI_SERVICE_MODE", "azure").lower()
+mock_function_calls = None
+if ai_service_mode == "mock":
+    from app.core.mock_services import load_function_calls
+
+    mock_function_calls = load_function_calls(os.getenv("MOCK_FUNCTION_CALLS"))
+    logger.info("Using mock AI services (AI_SERVICE_MODE=mock)")
+
+# Serve repeated deterministic prompt completions from the completion cache
+completion_cache_enabled = (
+    os.getenv("COMPLETION_CACHE_ENABLED", "true").lower() == "true"
+)
+
+# Directory for the persistent memory store; unset keeps memories in-process only
+memory_store_path = os.getenv("MEMORY_STORE_PATH")
+
+
+def create_memory_store():
+    """
+    Create the memory store configured by MEMORY_STORE_PATH.
+
+    Returns:
+        MemoryStoreBase: A memory-mapped store when a path is configured,
+        otherwise a VolatileMemoryStore.
+    """
+    if memory_store_path:
+        from app.core.mmap_memory_store import MmapMemoryStore
+
+        return MmapMemoryStore(memory_store_path)
+    return VolatileMemoryStore()
+
+
 # Initialize memory store
-memory_store = VolatileMemoryStore()
+memory_store = create_memory_store()
 
 # Sample collections
 FINANCE_COLLECTION = "finance"
@@ -42,6 +87,46 @@ PERSONAL_COLLECTION = "personal"
 WEATHER_COLLECTION = "weather"
 
 
+def create_ai_services():
+    """
+    Create the chat completion and embedding services selected by AI_SERVICE_MODE.
+
+    Returns:
+        Tuple[ChatCompletionClientBase, EmbeddingGeneratorBase]: The chat
+        service (service_id "chat") and embedding service (service_id
+        "embeddings"), both behind the shared request gates.
+    """
+    if ai_service_mode == "mock":
+        chat_completion = SharedMockChatCompletion(
+            service_id="chat",
+            ai_model_id="mock-chat",
+            latency=float(os.getenv("MOCK_LATENCY_MS", "200")) / 1000,
+            tokens_per_second=float(os.getenv("MOCK_TOKENS_PER_SECOND", "50")),
+            function_calls=mock_function_calls,
+        )
+        embedding_service = SharedMockTextEmbedding(
+            service_id="embeddings",
+            ai_model_id="mock-embeddings",
+            latency=float(os.getenv("MOCK_EMBEDDING_LATENCY_MS", "50")) / 1000,
+            dimensions=int(os.getenv("MOCK_EMBEDDING_DIMENSIONS", "256")),
+        )
+        return chat_completion, embedding_service
+
+    chat_completion = SharedAzureChatCompletion(
+        endpoint=base_url,
+        deployment_name=deployment_name,
+        api_key=api_key,
+        service_id="chat",
+    )
+    embedding_service = SharedAzureTextEmbedding(
+        endpoint=base_url,
+        deployment_name=embedding_deployment,
+        api_key=api_key,
+        service_id="embeddings",
+    )
+    return chat_completion, embedding_service
+
+
 # Add filter for function invocation logging
 async def logger_filter(
     context: FunctionInvocationContext,
@@ -54,15 +139,16 @@ async def logger_filter(
         f"FunctionInvoking - {context.function.plugin_name}.{context.function.name}"
     )
 
-    start_time = time.time()
+    start_time = time.perf_counter()
     await next(context)
-    duration = time.time() - start_time
+    duration = time.perf_counter() - start_time
 
     logger.info(
         f"FunctionInvoked - {context.function.plugin_name}.{context.function.name} ({duration:.3f}s)"
     )
 
 
+@tracer.traced("create_kernel", "kernel")
 def create_kernel(
     plugins: Optional[List[str]] = None,
 ) -> Tuple[sk.Kernel, SemanticTextMemory]:
@@ -81,22 +167,10 @@ def create_kernel(
     # Remove any existing services (just to be safe)
     kernel.remove_all_services()
 
-    # Add chat completion service
-    chat_completion = AzureChatCompletion(
-        endpoint=base_url,
-        deployment_name=deployment_name,
-        api_key=api_key,
-        service_id="chat",
-    )
+    # Add the chat completion and embedding services; identical in-flight
+    # chat requests share one call and all calls pass the rate limiters
+    chat_completion, embedding_service = create_ai_services()
     kernel.add_service(chat_completion)
-
-    # Add embedding service
-    embedding_service = AzureTextEmbedding(
-        endpoint=base_url,
-        deployment_name=embedding_deployment,
-        api_key=api_key,
-        service_id="embeddings",
-    )
     kernel.add_service(embedding_service)
 
     # Create memory instance
@@ -110,12 +184,23 @@ def create_kernel(
     # Add the logger filter
     kernel.add_filter("function_invocation", logger_filter)
 
+    # Add the tracing filters; registered first, so their spans enclose the
+    # cache filters and include cache lookups
+    if tracer.enabled:
+        kernel.add_filter("function_invocation", tracing_invocation_filter)
+        kernel.add_filter("prompt_rendering", tracing_render_filter)
+        kernel.add_filter("auto_function_invocation", tracing_tool_filter)
+
+    # Add the completion cache filters
+    if completion_cache_enabled:
+        kernel.add_filter("prompt_rendering", completion_cache_render_filter)
+        kernel.add_filter("function_invocation", completion_cache_invocation_filter)
+
     # Import plugins here to avoid circular imports
     if plugins:
-        from app.plugins.weather import WeatherPlugin
+        from app.plugins.weather import weather_plugin
 
         if "Weather" in plugins:
-            weather_plugin = WeatherPlugin()
             kernel.add_plugin(weather_plugin, plugin_name="Weather")
         # Add more plugin options here as they become available
 
@@ -126,65 +211,79 @@ async def initialize_memory():
     """
     Initialize memory with sample data.
     """
-    # Create a memory instance for initial data
-    _, memory_instance = create_kernel()
-
-    # Finance collection
-    await memory_instance.save_information(
-        collection=FINANCE_COLLECTION,
-        id="budget",
-        text="Your budget for 2024 is $100,000",
-    )
-    await memory_instance.save_information(
-        collection=FINANCE_COLLECTION,
-        id="savings",
-        text="Your savings from 2023 are $50,000",
-    )
-    await memory_instance.save_information(
-        collection=FINANCE_COLLECTION,
-        id="investments",
-        text="Your investments are $80,000",
-    )
+    # A persistent store already holds the sample data from a previous run
+    sample_collections = [FINANCE_COLLECTION, PERSONAL_COLLECTION, WEATHER_COLLECTION]
+    if all(
+        [await memory_store.does_collection_exist(c) for c in sample_collections]
+    ):
+        logger.info("Sample memories already present, skipping initialization")
+        return
 
-    # Personal collection
-    await memory_instance.save_information(
-        collection=PERSONAL_COLLECTION,
-        id="fact1",
-        text="John was born in Seattle in 1980",
-    )
-    await memory_instance.save_information(
-        collection=PERSONAL_COLLECTION,
-        id="fact2",
-        text="John graduated from University of Washington in 2002",
-    )
-    await memory_instance.save_information(
-        collection=PERSONAL_COLLECTION,
-        id="fact3",
-        text="John has two children named Alex and Sam",
-    )
+    # Embed all sample facts in one batched request
+    kernel, _ = create_kernel()
+    sample_items = [
+        MemoryItem(
+            collection=FINANCE_COLLECTION,
+            id="budget",
+            text="Your budget for 2024 is $100,000",
+        ),
+        MemoryItem(
+            collection=FINANCE_COLLECTION,
+            id="savings",
+            text="Your savings from 2023 are $50,000",
+        ),
+        MemoryItem(
+            collection=FINANCE_COLLECTION,
+            id="investments",
+            text="Your investments are $80,000",
+        ),
+        MemoryItem(
+            collection=PERSONAL_COLLECTION,
+            id="fact1",
+            text="John was born in Seattle in 1980",
+        ),
+        MemoryItem(
+            collection=PERSONAL_COLLECTION,
+            id="fact2",
+            text="John graduated from University of Washington in 2002",
+        ),
+        MemoryItem(
+            collection=PERSONAL_COLLECTION,
+            id="fact3",
+            text="John has two children named Alex and Sam",
+        ),
+        MemoryItem(
+            collection=WEATHER_COLLECTION,
+            id="fact1",
+            text="The weather in New York is typically hot and humid in summer",
+        ),
+        MemoryItem(
+            collection=WEATHER_COLLECTION,
+            id="fact2",
+            text="London often experiences rain throughout the year",
+        ),
+        MemoryItem(
+            collection=WEATHER_COLLECTION,
+            id="fact3",
+            text="Tokyo has a rainy season in June and July",
+        ),
+    ]
 
-    # Weather collection
-    await memory_instance.save_information(
-        collection=WEATHER_COLLECTION,
-        id="fact1",
-        text="The weather in New York is typically hot and humid in summer",
-    )
-    await memory_instance.save_information(
-        collection=WEATHER_COLLECTION,
-        id="fact2",
-        text="London often experiences rain throughout the year",
-    )
-    await memory_instance.save_information(
-        collection=WEATHER_COLLECTION,
-        id="fact3",
-        text="Tokyo has a rainy season in June and July",
-    )
+    async def items():
+        for item in sample_items:
+            yield item
+
+    async for event in ingest_memory_items(
+        items(), kernel.get_service("embeddings"), memory_store
+    ):
+        if event.get("error"):
+            raise RuntimeError(f"Failed to initialize memory: {event['error']}")
 
 
 async def reset_memory() -> None:
     """
     Reset the memory store and reinitialize with sample data.
     """
-    global memory_store
-    memory_store = VolatileMemoryStore()
+    for collection in await memory_store.get_collections():
+        await memory_store.delete_collection(collection)
     await initialize_memory()
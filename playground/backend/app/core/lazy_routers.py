@@ -0,0 +1,95 @@
+import asyncio
+import importlib
+import logging
+import time
+from typing import Dict, List, Tuple
+from fastapi import FastAPI
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Paths that describe the whole API, so they need every router loaded
+_SCHEMA_PATHS = ("/openapi.json", "/docs", "/redoc")
+
+
+class LazyRouters:
+    """
+    Imports router modules on the first request that needs them.
+
+    The router modules pull in large parts of semantic_kernel (agents,
+    processes, the OpenAI connectors), so importing them all dominates cold
+    start. Instead each module is registered with the path prefixes its router
+    serves, and is imported the first time a request for one of those prefixes
+    arrives. The import runs in a worker thread so the event loop keeps
+    serving other requests meanwhile. Requests for the OpenAPI schema or the
+    docs load every router.
+
+    Args:
+        app (FastAPI): The application the routers are added to.
+        modules (dict): Maps module names to the path prefixes their router serves.
+    """
+
+    def __init__(self, app: FastAPI, modules: Dict[str, Tuple[str, ...]]):
+        self.app = app
+        self.modules = modules
+        self.load_seconds: Dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    def pending_for(self, path: str) -> List[str]:
+        """Return the modules not yet loaded that a request for ``path`` needs."""
+        if len(self.load_seconds) == len(self.modules):
+            return []
+        if path in _SCHEMA_PATHS:
+            return [name for name in self.modules if name not in self.load_seconds]
+        return [
+            name
+            for name, prefixes in self.modules.items()
+            if name not in self.load_seconds
+            and any(path == p or path.startswith(p + "/") for p in prefixes)
+        ]
+
+    async def load(self, names: List[str]) -> None:
+        """Import the given router modules and add their routers to the app."""
+        async with self._lock:
+            for name in names:
+                if name in self.load_seconds:
+                    continue
+                start = time.perf_counter()
+                module = await asyncio.to_thread(importlib.import_module, name)
+                self._include(name, module, start)
+
+    def load_all_now(self) -> None:
+        """Import every router module immediately, as a plain eager app would."""
+        for name in self.modules:
+            if name not in self.load_seconds:
+                start = time.perf_counter()
+                self._include(name, importlib.import_module(name), start)
+
+    async def warm_up(self) -> None:
+        """Load every remaining router in the background once the app is serving."""
+        try:
+            await self.load(list(self.modules))
+        except Exception as e:
+            logger.error(f"Error warming up routers: {str(e)}")
+
+    def _include(self, name: str, module, start: float) -> None:
+        self.app.include_router(module.router)
+        # The cached schema predates these routes
+        self.app.openapi_schema = None
+        self.load_seconds[name] = time.perf_counter() - start
+        logger.info(f"Loaded router {name} in {self.load_seconds[name]:.2f}s")
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that loads the routers a request needs before routing it."""
+
+    def __init__(self, app, routers: LazyRouters):
+        self.app = app
+        self.routers = routers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            pending = self.routers.pending_for(scope["path"])
+            if pending:
+                await self.routers.load(pending)
+        await self.app(scope, receive, send)
@@ -0,0 +1,97 @@
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List, Optional
+
+# Format of captured records, matching the console output
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+class LogCapture:
+    """Buffer of formatted log lines captured for one request, bounded in size."""
+
+    def __init__(self, max_bytes: int = 64 * 1024):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.dropped = 0
+        self._lines: List[str] = []
+
+    def append(self, line: str) -> None:
+        if self.size + len(line) + 1 > self.max_bytes:
+            self.dropped += 1
+            return
+        self._lines.append(line)
+        self.size += len(line) + 1
+
+    def getvalue(self) -> str:
+        """Return the captured lines, newline-terminated like a stream handler."""
+        lines = self._lines
+        if self.dropped:
+            lines = lines + [f"... {self.dropped} more log records dropped"]
+        return "".join(f"{line}\n" for line in lines)
+
+
+# Capture buffer of the request running in the current context, if any
+_active_capture: ContextVar[Optional[LogCapture]] = ContextVar(
+    "log_capture", default=None
+)
+
+
+class ContextLogHandler(logging.Handler):
+    """
+    Root handler that routes each record to the capture active in its context.
+
+    Records logged outside ``capture_logs`` are dropped before any locking or
+    formatting, so the handler costs the same no matter how many requests are
+    capturing at once.
+    """
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        if _active_capture.get() is None:
+            return False
+        return super().handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        capture = _active_capture.get()
+        if capture is None:
+            return
+        try:
+            capture.append(self.format(record))
+        except Exception:
+            self.handleError(record)
+
+
+_handler: Optional[ContextLogHandler] = None
+
+
+def install_log_capture() -> ContextLogHandler:
+    """Attach the context log handler to the root logger once per process."""
+    global _handler
+    if _handler is None:
+        _handler = ContextLogHandler(level=logging.DEBUG)
+        _handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        logging.getLogger().addHandler(_handler)
+    return _handler
+
+
+@contextmanager
+def capture_logs(max_bytes: int = 64 * 1024) -> Iterator[LogCapture]:
+    """
+    Capture the log records emitted by the current request.
+
+    Tasks and worker threads started inside the block inherit the context and
+    are captured too; concurrent requests each get only their own records.
+
+    Args:
+        max_bytes (int): Records beyond this many bytes are counted, not kept.
+
+    Yields:
+        LogCapture: The buffer collecting the formatted records.
+    """
+    install_log_capture()
+    capture = LogCapture(max_bytes)
+    token = _active_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _active_capture.reset(token)
@@ -0,0 +1,121 @@
+import asyncio
+import logging
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
+    EmbeddingGeneratorBase,
+)
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+from app.models.api_models import MemoryItem
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+async def ingest_memory_items(
+    items: AsyncIterable[MemoryItem],
+    embedding_service: EmbeddingGeneratorBase,
+    memory_store: MemoryStoreBase,
+    batch_size: int = 64,
+    max_concurrency: int = 4,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Embed and store memory items in batches, yielding progress as batches finish.
+
+    Items are grouped into batches of ``batch_size`` texts per embedding request
+    and at most ``max_concurrency`` requests are in flight. The batch queue is
+    bounded, so a slow embedding service stops the producer from reading further
+    items instead of buffering the whole input.
+
+    Args:
+        items: The memory items to ingest.
+        embedding_service: The service used to embed the item texts.
+        memory_store: The store the records are written to.
+        batch_size (int): Texts per embedding request.
+        max_concurrency (int): Embedding requests in flight at once.
+
+    Yields:
+        dict: A ``progress`` event per finished batch and a final ``done`` event.
+    """
+    batch_size = max(1, batch_size)
+    max_concurrency = max(1, max_concurrency)
+    batches: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+    events: asyncio.Queue = asyncio.Queue()
+    stats = {"received": 0, "ingested": 0, "failed": 0, "batches": 0}
+    known_collections = set()
+    collection_lock = asyncio.Lock()
+
+    async def produce():
+        batch: List[MemoryItem] = []
+        async for item in items:
+            stats["received"] += 1
+            batch.append(item)
+            if len(batch) >= batch_size:
+                await batches.put(batch)
+                batch = []
+        if batch:
+            await batches.put(batch)
+
+    async def store_batch(batch: List[MemoryItem]) -> None:
+        embeddings = await embedding_service.generate_embeddings(
+            [item.text for item in batch]
+        )
+
+        # Group the records so each collection gets one bulk write
+        records_by_collection: Dict[str, List[MemoryRecord]] = {}
+        for item, embedding in zip(batch, embeddings):
+            records_by_collection.setdefault(item.collection, []).append(
+                MemoryRecord.local_record(
+                    id=item.id,
+                    text=item.text,
+                    description=None,
+                    additional_metadata=None,
+                    embedding=embedding,
+                )
+            )
+
+        for collection, records in records_by_collection.items():
+            async with collection_lock:
+                if collection not in known_collections:
+                    if not await memory_store.does_collection_exist(collection):
+                        await memory_store.create_collection(collection)
+                    known_collections.add(collection)
+            await memory_store.upsert_batch(collection, records)
+
+    async def consume():
+        while True:
+            batch = await batches.get()
+            error = None
+            try:
+                await store_batch(batch)
+                stats["ingested"] += len(batch)
+            except Exception as e:
+                logger.error(f"Error ingesting memory batch: {str(e)}")
+                stats["failed"] += len(batch)
+                error = str(e)
+            stats["batches"] += 1
+            event = {"event": "progress", **stats}
+            if error:
+                event["error"] = error
+            await events.put(event)
+            batches.task_done()
+
+    async def run():
+        workers = [asyncio.create_task(consume()) for _ in range(max_concurrency)]
+        try:
+            await produce()
+            await batches.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await events.put(None)
+
+    runner = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+        # Surface errors raised while reading the input
+        await runner
+        yield {"event": "done", **stats}
+    finally:
+        runner.cancel()
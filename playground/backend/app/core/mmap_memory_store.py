@@ -0,0 +1,369 @@
+import asyncio
+import json
+import logging
+import os
+import shutil
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from numpy import ndarray
+from semantic_kernel.exceptions import ServiceResourceNotFoundError
+from semantic_kernel.memory.memory_record import MemoryRecord
+from semantic_kernel.memory.memory_store_base import MemoryStoreBase
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl
+    fcntl = None
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+RECORDS_FILE = "records.jsonl"
+LOCK_FILE = ".lock"
+
+
+@contextmanager
+def _file_lock(path: str):
+    """Hold an exclusive advisory lock on ``path`` where the platform supports it."""
+    with open(path, "a") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+class _Collection:
+    """
+    One collection on disk: an append-only float32 vector file plus a JSONL
+    sidecar describing each row. Upserts append a new row and supersede the
+    previous row for the same key; removals append a tombstone line.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._reset()
+
+    def _reset(self) -> None:
+        """Forget every row read so far, so the next refresh starts from scratch."""
+        self.dim: Optional[int] = None
+        self.records: Dict[str, dict] = {}  # key -> metadata of the live row
+        self.rows: Dict[str, int] = {}  # key -> live row index
+        self.live = np.zeros(0, dtype=bool)  # row -> whether it is the live row
+        self.keys: List[Optional[str]] = []  # row -> key
+        self.vectors: Optional[np.memmap] = None
+        self._offset = 0  # Bytes of the sidecar already consumed
+        self._inode: Optional[int] = None  # Inode of the sidecar that was read
+
+    @property
+    def vectors_path(self) -> str:
+        return os.path.join(self.path, VECTORS_FILE)
+
+    @property
+    def records_path(self) -> str:
+        return os.path.join(self.path, RECORDS_FILE)
+
+    def refresh(self) -> None:
+        """Pick up rows appended since the last call, by this or another process."""
+        try:
+            stat = os.stat(self.records_path)
+            inode, size = stat.st_ino, stat.st_size
+        except FileNotFoundError:
+            inode, size = None, 0
+
+        # Another process deleted the collection, and may have created it again
+        if inode != self._inode or size < self._offset:
+            if self._offset:
+                logger.info(f"Collection at {self.path} was recreated; reloading it")
+            self._reset()
+            self._inode = inode
+        if size <= self._offset:
+            return
+
+        with open(self.records_path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(size - self._offset)
+
+        # Only consume complete lines; a concurrent writer may be mid-append
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return
+        self._offset += end
+
+        entries = [json.loads(line) for line in data[:end].splitlines()]
+        row_count = max(
+            [len(self.live)] + [e["row"] + 1 for e in entries if not e.get("deleted")]
+        )
+        if row_count > len(self.live):
+            self.live = np.concatenate(
+                [self.live, np.zeros(row_count - len(self.live), dtype=bool)]
+            )
+            self.keys.extend([None] * (row_count - len(self.keys)))
+
+        for entry in entries:
+            key = entry["key"]
+            previous_row = self.rows.pop(key, None)
+            self.records.pop(key, None)
+            if previous_row is not None:
+                self.live[previous_row] = False
+            if entry.get("deleted"):
+                continue
+
+            self.dim = entry["dim"]
+            row = entry["row"]
+            self.live[row] = True
+            self.keys[row] = key
+            self.rows[key] = row
+            self.records[key] = entry
+
+        if self.dim and row_count:
+            # Map the vectors read-only; pages are shared between processes
+            self.vectors = np.memmap(
+                self.vectors_path,
+                dtype=np.float32,
+                mode="r",
+                shape=(row_count, self.dim),
+            )
+
+    def append(self, records: List[MemoryRecord]) -> List[str]:
+        """Append records to the vector file and sidecar under the collection lock."""
+        with _file_lock(os.path.join(self.path, LOCK_FILE)):
+            self.refresh()
+            dim = self.dim or len(records[0].embedding)
+
+            vectors = np.asarray([r.embedding for r in records], dtype=np.float32)
+            if vectors.shape[1] != dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match "
+                    f"collection dimension {dim}"
+                )
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            vectors = vectors / np.where(norms == 0, 1, norms)
+
+            # Vectors are written before the sidecar lines that reference them
+            first_row = 0
+            if os.path.exists(self.vectors_path):
+                first_row = os.path.getsize(self.vectors_path) // (4 * dim)
+            with open(self.vectors_path, "ab") as f:
+                f.write(vectors.tobytes())
+
+            lines = []
+            keys = []
+            for i, record in enumerate(records):
+                key = record._id
+                keys.append(key)
+                lines.append(
+                    json.dumps(
+                        {
+                            "key": key,
+                            "row": first_row + i,
+                            "dim": dim,
+                            "id": record._id,
+                            "text": record._text,
+                            "description": record._description,
+                            "additional_metadata": record._additional_metadata,
+                            "external_source_name": record._external_source_name,
+                            "is_reference": record._is_reference,
+                            "timestamp": (
+                                record._timestamp.isoformat()
+                                if record._timestamp
+                                else None
+                            ),
+                        }
+                    )
+                )
+            with open(self.records_path, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+
+            self.refresh()
+        return keys
+
+    def remove(self, keys: List[str]) -> None:
+        """Append tombstones for the given keys."""
+        with _file_lock(os.path.join(self.path, LOCK_FILE)):
+            self.refresh()
+            lines = [
+                json.dumps({"key": key, "deleted": True})
+                for key in keys
+                if key in self.rows
+            ]
+            if lines:
+                with open(self.records_path, "a", encoding="utf-8") as f:
+                    f.write("\n".join(lines) + "\n")
+            self.refresh()
+
+    def to_record(self, key: str, with_embedding: bool) -> MemoryRecord:
+        """Build a MemoryRecord for a live key."""
+        entry = self.records[key]
+        embedding = (
+            np.array(self.vectors[self.rows[key]]) if with_embedding else np.array([])
+        )
+        return MemoryRecord(
+            is_reference=entry["is_reference"],
+            external_source_name=entry["external_source_name"],
+            id=entry["id"],
+            description=entry["description"],
+            text=entry["text"],
+            additional_metadata=entry["additional_metadata"],
+            embedding=embedding,
+            key=key,
+            timestamp=(
+                datetime.fromisoformat(entry["timestamp"])
+                if entry["timestamp"]
+                else None
+            ),
+        )
+
+
+class MmapMemoryStore(MemoryStoreBase):
+    """
+    A persistent memory store backed by memory-mapped files.
+
+    Each collection is a directory holding normalized float32 vectors in an
+    append-only file and a JSONL metadata sidecar. Opening the store only maps
+    the files, and several worker processes can share one directory: every
+    read first picks up rows appended by other processes. Search is a single
+    vectorized dot product over the mapped matrix.
+    """
+
+    def __init__(self, path: str):
+        self._path = os.path.abspath(path)
+        os.makedirs(self._path, exist_ok=True)
+        logger.info(f"Using memory-mapped memory store at {self._path}")
+        self._collections: Dict[str, _Collection] = {}
+        self._lock = asyncio.Lock()
+
+    def _collection_path(self, collection_name: str) -> str:
+        if (
+            not collection_name
+            or os.sep in collection_name
+            or collection_name.startswith(".")
+        ):
+            raise ValueError(f"Invalid collection name '{collection_name}'")
+        return os.path.join(self._path, collection_name)
+
+    def _get_collection(self, collection_name: str) -> _Collection:
+        path = self._collection_path(collection_name)
+        if not os.path.isdir(path):
+            self._collections.pop(collection_name, None)
+            raise ServiceResourceNotFoundError(
+                f"Collection '{collection_name}' does not exist"
+            )
+        collection = self._collections.get(collection_name)
+        if collection is None:
+            collection = self._collections[collection_name] = _Collection(path)
+        collection.refresh()
+        return collection
+
+    async def create_collection(self, collection_name: str) -> None:
+        os.makedirs(self._collection_path(collection_name), exist_ok=True)
+
+    async def get_collections(self) -> List[str]:
+        return sorted(
+            name
+            for name in os.listdir(self._path)
+            if os.path.isdir(os.path.join(self._path, name))
+            and not name.startswith(".")
+        )
+
+    async def delete_collection(self, collection_name: str) -> None:
+        async with self._lock:
+            self._collections.pop(collection_name, None)
+            shutil.rmtree(self._collection_path(collection_name), ignore_errors=True)
+
+    async def does_collection_exist(self, collection_name: str) -> bool:
+        return os.path.isdir(self._collection_path(collection_name))
+
+    async def upsert(self, collection_name: str, record: MemoryRecord) -> str:
+        return (await self.upsert_batch(collection_name, [record]))[0]
+
+    async def upsert_batch(
+        self, collection_name: str, records: List[MemoryRecord]
+    ) -> List[str]:
+        if not records:
+            return []
+        async with self._lock:
+            collection = self._get_collection(collection_name)
+            keys = collection.append(records)
+        for record, key in zip(records, keys):
+            record._key = key
+        return keys
+
+    async def get(
+        self, collection_name: str, key: str, with_embedding: bool = False
+    ) -> Optional[MemoryRecord]:
+        collection = self._get_collection(collection_name)
+        if key not in collection.records:
+            return None
+        return collection.to_record(key, with_embedding)
+
+    async def get_batch(
+        self, collection_name: str, keys: List[str], with_embeddings: bool = False
+    ) -> List[MemoryRecord]:
+        collection = self._get_collection(collection_name)
+        return [
+            collection.to_record(key, with_embeddings)
+            for key in keys
+            if key in collection.records
+        ]
+
+    async def remove(self, collection_name: str, key: str) -> None:
+        await self.remove_batch(collection_name, [key])
+
+    async def remove_batch(self, collection_name: str, keys: List[str]) -> None:
+        async with self._lock:
+            collection = self._get_collection(collection_name)
+            collection.remove(keys)
+
+    async def get_nearest_matches(
+        self,
+        collection_name: str,
+        embedding: ndarray,
+        limit: int,
+        min_relevance_score: float = 0.0,
+        with_embeddings: bool = False,
+    ) -> List[Tuple[MemoryRecord, float]]:
+        collection = self._get_collection(collection_name)
+        if collection.vectors is None or not collection.rows or limit <= 0:
+            return []
+
+        query = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        if norm == 0:
+            return []
+
+        # Stored vectors are normalized, so the dot product is the cosine similarity
+        scores = np.asarray(collection.vectors @ (query / norm))
+        scores[~collection.live] = -np.inf
+
+        candidates = np.flatnonzero(scores >= min_relevance_score)
+        if len(candidates) > limit:
+            top = np.argpartition(scores[candidates], -limit)[-limit:]
+            candidates = candidates[top]
+        candidates = candidates[np.argsort(scores[candidates])[::-1]]
+
+        return [
+            (
+                collection.to_record(collection.keys[row], with_embeddings),
+                float(scores[row]),
+            )
+            for row in candidates
+        ]
+
+    async def get_nearest_match(
+        self,
+        collection_name: str,
+        embedding: ndarray,
+        min_relevance_score: float = 0.0,
+        with_embedding: bool = False,
+    ) -> Tuple[MemoryRecord, float]:
+        matches = await self.get_nearest_matches(
+            collection_name, embedding, 1, min_relevance_score, with_embedding
+        )
+        return matches[0] if matches else None
@@ -0,0 +1,265 @@
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Any, AsyncGenerator, Callable, ClassVar, Dict, List, Optional
+
+import numpy as np
+from semantic_kernel.connectors.ai.chat_completion_client_base import (
+    ChatCompletionClientBase,
+)
+from semantic_kernel.connectors.ai.completion_usage import CompletionUsage
+from semantic_kernel.connectors.ai.embeddings.embedding_generator_base import (
+    EmbeddingGeneratorBase,
+)
+from semantic_kernel.connectors.ai.open_ai import OpenAIChatPromptExecutionSettings
+from semantic_kernel.connectors.ai.prompt_execution_settings import (
+    PromptExecutionSettings,
+)
+from semantic_kernel.contents import (
+    AuthorRole,
+    ChatHistory,
+    ChatMessageContent,
+    FunctionCallContent,
+    FunctionResultContent,
+    StreamingChatMessageContent,
+)
+from app.core.context_builder import estimate_tokens
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Scripted tool calls used when no MOCK_FUNCTION_CALLS file is configured.
+# Each rule matches the latest user message; "$1" in an argument is replaced
+# with the first capture group.
+DEFAULT_FUNCTION_CALLS = [
+    {
+        "pattern": r"(?i)weather (?:in|for) ([A-Z][\w ]*?)(?:[?.!,]|$)",
+        "function": "Weather-get_current_weather",
+        "arguments": {"location": "$1"},
+    },
+    {
+        "pattern": r"(?i)forecast (?:in|for) ([A-Z][\w ]*?)(?:[?.!,]|$)",
+        "function": "Weather-get_forecast",
+        "arguments": {"location": "$1", "days": 3},
+    },
+]
+
+# Key under which the function choice callback lists the callable functions
+_AVAILABLE_FUNCTIONS = "mock_available_functions"
+
+
+def load_function_calls(path: Optional[str]) -> List[Dict[str, Any]]:
+    """Load function call rules from a JSON file, or return the defaults."""
+    if not path:
+        return DEFAULT_FUNCTION_CALLS
+    with open(path, encoding="utf-8") as f:
+        rules = json.load(f)
+    logger.info(f"Loaded {len(rules)} mock function call rules from {path}")
+    return rules
+
+
+class MockChatCompletion(ChatCompletionClientBase):
+    """
+    Deterministic local stand-in for AzureChatCompletion.
+
+    Replies echo the latest user message, or summarize tool results after a
+    tool call, so the same request always gets the same answer. Each reply
+    waits ``latency`` seconds for its first token and then produces
+    ``tokens_per_second`` tokens. When function calling is enabled, rules in
+    ``function_calls`` turn matching user messages into tool calls, which lets
+    the agent and weather endpoints run their full tool loop offline.
+    """
+
+    SUPPORTS_FUNCTION_CALLING: ClassVar[bool] = True
+
+    latency: float = 0.2
+    tokens_per_second: float = 50.0
+    function_calls: List[Dict[str, Any]] = DEFAULT_FUNCTION_CALLS
+
+    def get_prompt_execution_settings_class(self) -> type[PromptExecutionSettings]:
+        return OpenAIChatPromptExecutionSettings
+
+    def _update_function_choice_settings_callback(
+        self,
+    ) -> Callable[[Any, PromptExecutionSettings, Any], None]:
+        def update(configuration, settings, choice_type) -> None:
+            settings.extension_data[_AVAILABLE_FUNCTIONS] = [
+                function.fully_qualified_name
+                for function in configuration.available_functions or []
+            ]
+
+        return update
+
+    def _reset_function_choice_settings(self, settings: PromptExecutionSettings) -> None:
+        settings.extension_data.pop(_AVAILABLE_FUNCTIONS, None)
+
+    async def _inner_get_chat_message_contents(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> List[ChatMessageContent]:
+        await asyncio.sleep(self.latency)
+        tool_calls = self._tool_calls(chat_history, settings)
+        if tool_calls:
+            return [ChatMessageContent(role=AuthorRole.ASSISTANT, items=tool_calls)]
+
+        tokens = self._reply_tokens(chat_history, settings)
+        await asyncio.sleep(len(tokens) / self.tokens_per_second)
+        return [
+            ChatMessageContent(
+                role=AuthorRole.ASSISTANT,
+                content="".join(tokens),
+                ai_model_id=self.ai_model_id,
+                metadata={"usage": self._usage(chat_history, tokens)},
+            )
+        ]
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[List[StreamingChatMessageContent], Any]:
+        await asyncio.sleep(self.latency)
+        tool_calls = self._tool_calls(chat_history, settings)
+        if tool_calls:
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT, choice_index=0, items=tool_calls
+                )
+            ]
+            return
+
+        tokens = self._reply_tokens(chat_history, settings)
+        for token in tokens:
+            await asyncio.sleep(1 / self.tokens_per_second)
+            yield [
+                StreamingChatMessageContent(
+                    role=AuthorRole.ASSISTANT,
+                    choice_index=0,
+                    content=token,
+                    ai_model_id=self.ai_model_id,
+                )
+            ]
+
+    def _tool_calls(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> List[FunctionCallContent]:
+        """Return the scripted tool calls for the latest user message, if any."""
+        available = settings.extension_data.get(_AVAILABLE_FUNCTIONS)
+        last = chat_history.messages[-1] if chat_history.messages else None
+        if not available or last is None or last.role != AuthorRole.USER:
+            return []
+
+        tool_calls = []
+        for index, rule in enumerate(self.function_calls):
+            if rule["function"] not in available:
+                continue
+            match = re.search(rule["pattern"], last.content or "")
+            if match is None:
+                continue
+            arguments = {
+                name: _substitute(value, match)
+                for name, value in rule.get("arguments", {}).items()
+            }
+            plugin_name, function_name = rule["function"].split("-", 1)
+            tool_calls.append(
+                FunctionCallContent(
+                    id=f"call_{index}_{len(chat_history.messages)}",
+                    plugin_name=plugin_name,
+                    function_name=function_name,
+                    name=rule["function"],
+                    arguments=json.dumps(arguments),
+                )
+            )
+        return tool_calls
+
+    def _reply_tokens(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> List[str]:
+        """Build the reply, split into word tokens, capped at ``max_tokens``."""
+        messages = chat_history.messages
+        tool_results = []
+        for message in reversed(messages):
+            results = [
+                item for item in message.items if isinstance(item, FunctionResultContent)
+            ]
+            if not results:
+                break
+            tool_results = [str(item.result) for item in results] + tool_results
+
+        if tool_results:
+            reply = "Here is what I found: " + " ".join(tool_results)
+        else:
+            last_user = next(
+                (m.content for m in reversed(messages) if m.role == AuthorRole.USER),
+                "",
+            )
+            reply = last_user or "Hello from the mock chat service."
+
+        tokens = re.findall(r"\S+\s*", reply)
+        max_tokens = getattr(settings, "max_tokens", None)
+        return tokens[:max_tokens] if max_tokens else tokens
+
+    @staticmethod
+    def _usage(chat_history: ChatHistory, tokens: List[str]) -> CompletionUsage:
+        return CompletionUsage(
+            prompt_tokens=sum(
+                estimate_tokens(m.content or "") for m in chat_history.messages
+            ),
+            completion_tokens=len(tokens),
+        )
+
+
+def _substitute(value: Any, match: re.Match) -> Any:
+    if isinstance(value, str):
+        return re.sub(
+            r"\$(\d)",
+            lambda m: (match.group(int(m.group(1))) or "").strip(),
+            value,
+        )
+    return value
+
+
+class MockTextEmbedding(EmbeddingGeneratorBase):
+    """
+    Deterministic local stand-in for AzureTextEmbedding.
+
+    Texts are embedded as normalized bags of hashed words, so identical texts
+    get identical vectors and texts sharing words score as similar, which is
+    enough for memory search and the semantic cache to behave realistically.
+    """
+
+    latency: float = 0.05
+    dimensions: int = 256
+
+    async def generate_embeddings(
+        self,
+        texts: List[str],
+        settings: Optional[PromptExecutionSettings] = None,
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        return np.array(
+            await self.generate_raw_embeddings(texts, settings, batch_size, **kwargs)
+        )
+
+    async def generate_raw_embeddings(
+        self,
+        texts: List[str],
+        settings: Optional[PromptExecutionSettings] = None,
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        await asyncio.sleep(self.latency)
+        return [self._embed(text).tolist() for text in texts]
+
+    def _embed(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        for word in re.findall(r"\w+", text.lower()):
+            digest = hashlib.blake2b(word.encode("utf-8"), digest_size=8).digest()
+            bucket = int.from_bytes(digest[:4], "little") % self.dimensions
+            vector[bucket] += 1.0 if digest[4] & 1 else -1.0
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
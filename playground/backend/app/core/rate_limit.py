@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class RateLimitTimeout(Exception):
+    """
+    Raised when a call cannot be admitted within the limiter's maximum wait.
+
+    Args:
+        retry_after (float): Seconds after which the call would likely be admitted.
+    """
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Bucket:
+    """Token bucket refilled continuously up to one minute of capacity."""
+
+    def __init__(self, per_minute: Optional[float]):
+        self.capacity = per_minute
+        self.rate = per_minute / 60.0 if per_minute else None
+        self.level = per_minute or 0.0
+        self._updated = time.monotonic()
+
+    def refill(self, now: float) -> None:
+        if self.rate is not None:
+            elapsed = now - self._updated
+            self.level = min(self.capacity, self.level + elapsed * self.rate)
+        self._updated = now
+
+    def wait_for(self, amount: float) -> float:
+        """Seconds until ``amount`` is available; 0 when it already is."""
+        if self.rate is None:
+            return 0.0
+        amount = min(amount, self.capacity)
+        return max(0.0, (amount - self.level) / self.rate)
+
+    def take(self, amount: float) -> None:
+        if self.rate is not None:
+            self.level -= min(amount, self.capacity)
+
+
+def _throttle_delay(error: BaseException) -> Optional[float]:
+    """
+    Return the server's suggested delay if ``error`` is a throttling response.
+
+    Returns None for other errors and 0.0 for throttling without a hint.
+    Semantic Kernel wraps the OpenAI error, so the cause chain is searched.
+    """
+    while error is not None:
+        if getattr(error, "status_code", None) == 429:
+            response = getattr(error, "response", None)
+            retry_after = getattr(response, "headers", {}).get("retry-after")
+            try:
+                return float(retry_after) if retry_after else 0.0
+            except ValueError:
+                return 0.0
+        error = error.__cause__ or error.__context__
+    return None
+
+
+def throttling_retry_after(error: BaseException) -> Optional[float]:
+    """
+    Return how long to wait if ``error`` was caused by rate limiting.
+
+    Covers calls the limiter rejected and upstream throttling that outlasted
+    the retries, anywhere in the cause chain, so an error re-raised by an
+    endpoint still counts. Returns None for other errors.
+    """
+    while error is not None:
+        if isinstance(error, RateLimitTimeout):
+            return error.retry_after
+        retry_after = _throttle_delay(error)
+        if retry_after is not None:
+            return retry_after
+        error = error.__cause__ or error.__context__
+    return None
+
+
+class TokenBucketLimiter:
+    """
+    Async admission control for an upstream API with request and token quotas.
+
+    Callers are admitted strictly in arrival order: the caller at the head of
+    the queue waits until both buckets can cover its estimate, and everyone
+    behind it waits for the head. A caller that would wait longer than
+    ``max_wait`` fails fast with RateLimitTimeout. Throttling responses that
+    still get through are retried with jittered exponential backoff.
+
+    Args:
+        name (str): Label used in logs and errors.
+        requests_per_minute (float, optional): Request quota; None is unlimited.
+        tokens_per_minute (float, optional): Token quota; None is unlimited.
+        max_wait (float): Seconds a caller may queue before giving up.
+        max_retries (int): Retries after a throttling response.
+        base_delay (float): First backoff delay in seconds, doubled per retry.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_wait: float = 30.0,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+    ):
+        self.name = name
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self._requests = _Bucket(requests_per_minute)
+        self._tokens = _Bucket(tokens_per_minute)
+        self._lock = asyncio.Lock()
+
+        self.queue_depth = 0
+        self.peak_queue_depth = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait_seen = 0.0
+
+    async def acquire(self, tokens: int, requests: int = 1) -> float:
+        """
+        Wait until the estimated usage fits in both buckets, then consume it.
+
+        Returns:
+            float: Seconds spent queueing.
+
+        Raises:
+            RateLimitTimeout: If admission would take longer than ``max_wait``.
+        """
+        start = time.monotonic()
+        deadline = start + self.max_wait
+        self.queue_depth += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            # asyncio.Lock wakes waiters in arrival order, which keeps the queue fair
+            try:
+                await asyncio.wait_for(self._lock.acquire(), self.max_wait)
+            except asyncio.TimeoutError:
+                raise RateLimitTimeout(
+                    f"{self.name} rate limit: queued longer than {self.max_wait}s",
+                    retry_after=self.max_wait,
+                ) from None
+
+            try:
+                now = time.monotonic()
+                self._refill(now)
+                delay = max(
+                    self._requests.wait_for(requests), self._tokens.wait_for(tokens)
+                )
+                if now + delay > deadline:
+                    raise RateLimitTimeout(
+                        f"{self.name} rate limit: admission would take {delay:.1f}s",
+                        retry_after=delay,
+                    )
+                if delay:
+                    await asyncio.sleep(delay)
+                    self._refill(time.monotonic())
+                self._requests.take(requests)
+                self._tokens.take(tokens)
+            finally:
+                self._lock.release()
+        except RateLimitTimeout:
+            self.rejected += 1
+            raise
+        finally:
+            self.queue_depth -= 1
+
+        waited = time.monotonic() - start
+        self.admitted += 1
+        self.total_wait += waited
+        self.max_wait_seen = max(self.max_wait_seen, waited)
+        return waited
+
+    def _refill(self, now: float) -> None:
+        self._requests.refill(now)
+        self._tokens.refill(now)
+
+    async def run(
+        self, tokens: int, call: Callable[[], Awaitable[Any]], requests: int = 1
+    ) -> Any:
+        """Admit and run ``call``, retrying it when the upstream throttles."""
+        for attempt in range(self.max_retries + 1):
+            await self.acquire(tokens, requests)
+            try:
+                return await call()
+            except Exception as e:
+                retry_after = _throttle_delay(e)
+                if retry_after is None or attempt == self.max_retries:
+                    raise
+                self.throttled += 1
+                backoff = self.base_delay * 2**attempt * random.uniform(0.5, 1.5)
+                delay = max(retry_after, backoff)
+                logger.warning(
+                    f"{self.name} throttled upstream, retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{self.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": self.queue_depth,
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "throttled_retries": self.throttled,
+            "avg_wait_ms": round(self.total_wait / self.admitted * 1000, 1)
+            if self.admitted
+            else 0.0,
+            "max_wait_ms": round(self.max_wait_seen * 1000, 1),
+            "requests_per_minute": self._requests.capacity,
+            "tokens_per_minute": self._tokens.capacity,
+        }
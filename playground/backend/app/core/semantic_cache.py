@@ -0,0 +1,156 @@
+import hashlib
+import logging
+import os
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from semantic_kernel import Kernel
+from app.core.cache import cache_stats
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _Scope:
+    """Recent question/answer pairs for one system prompt and plugin set."""
+
+    def __init__(self):
+        self.vectors = np.zeros((0, 0), dtype=np.float32)
+        self.entries: List[Dict[str, Any]] = []
+
+    def prune(self, now: float, max_entries: int) -> None:
+        keep = [
+            i for i, entry in enumerate(self.entries) if entry["expires_at"] > now
+        ][-max_entries:]
+        if len(keep) != len(self.entries):
+            self.entries = [self.entries[i] for i in keep]
+            self.vectors = self.vectors[keep]
+
+
+class SemanticCache:
+    """
+    Response cache that matches new questions to recent ones by embedding similarity.
+
+    Entries are scoped by system prompt and plugin set, so an answer is only
+    reused for the same assistant configuration. Answers produced with tool calls
+    get a shorter TTL because the underlying data changes. Recent hits are kept
+    as audit samples so false hits can be reviewed and the threshold tuned.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        ttl: float = 3600.0,
+        tool_ttl: float = 120.0,
+        max_entries_per_scope: int = 512,
+        audit_samples: int = 50,
+    ):
+        self.threshold = threshold
+        self.ttl = ttl
+        self.tool_ttl = tool_ttl
+        self.max_entries_per_scope = max_entries_per_scope
+        self.hits = 0
+        self.misses = 0
+        self.latency_saved_ms = 0.0
+        self.audit_samples = deque(maxlen=audit_samples)
+        self._scopes: Dict[str, _Scope] = {}
+
+    @staticmethod
+    def scope_key(system_prompt: str, plugins: List[str]) -> str:
+        """Build the scope key for a system prompt and plugin set."""
+        payload = system_prompt + "\0" + ",".join(sorted(plugins))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def lookup(
+        self, scope_key: str, question: str, embedding: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached payload of the most similar question above the threshold.
+
+        Args:
+            scope_key: The scope returned by ``scope_key``.
+            question: The incoming question, recorded in audit samples.
+            embedding: The normalized embedding of the question.
+
+        Returns:
+            dict or None: The cached payload on a hit.
+        """
+        scope = self._scopes.get(scope_key)
+        if scope is not None:
+            scope.prune(time.monotonic(), self.max_entries_per_scope)
+
+        if scope is None or not scope.entries:
+            self.misses += 1
+            return None
+
+        similarities = scope.vectors @ embedding
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.threshold:
+            self.misses += 1
+            return None
+
+        entry = scope.entries[best]
+        self.hits += 1
+        self.latency_saved_ms += entry["latency_ms"]
+        self.audit_samples.append(
+            {
+                "question": question,
+                "cached_question": entry["question"],
+                "similarity": round(similarity, 4),
+            }
+        )
+        return entry["payload"]
+
+    def store(
+        self,
+        scope_key: str,
+        question: str,
+        embedding: np.ndarray,
+        payload: Dict[str, Any],
+        latency_ms: float,
+        used_tools: bool = False,
+    ) -> None:
+        """Cache the payload produced for a question."""
+        scope = self._scopes.setdefault(scope_key, _Scope())
+        ttl = self.tool_ttl if used_tools else self.ttl
+        scope.entries.append(
+            {
+                "question": question,
+                "payload": payload,
+                "latency_ms": latency_ms,
+                "expires_at": time.monotonic() + ttl,
+            }
+        )
+        vector = embedding.reshape(1, -1).astype(np.float32)
+        scope.vectors = (
+            np.vstack([scope.vectors, vector]) if scope.vectors.size else vector
+        )
+        scope.prune(time.monotonic(), self.max_entries_per_scope)
+
+    def stats(self) -> Dict[str, Any]:
+        return cache_stats(
+            self.hits,
+            self.misses,
+            latency_saved_ms=round(self.latency_saved_ms, 1),
+            threshold=self.threshold,
+            entries=sum(len(scope.entries) for scope in self._scopes.values()),
+            audit_samples=list(self.audit_samples),
+        )
+
+
+async def embed_question(kernel: Kernel, question: str) -> np.ndarray:
+    """Embed a question with the kernel's embedding service and normalize it."""
+    embeddings = await kernel.get_service("embeddings").generate_embeddings([question])
+    vector = np.asarray(embeddings[0], dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+semantic_cache = SemanticCache(
+    threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.92")),
+    ttl=float(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "3600")),
+    tool_ttl=float(os.getenv("SEMANTIC_CACHE_TOOL_TTL_SECONDS", "120")),
+)
@@ -0,0 +1,207 @@
+import hashlib
+import json
+import logging
+import math
+import os
+from typing import Any, AsyncGenerator, List, Optional
+from semantic_kernel.connectors.ai.open_ai.services.azure_chat_completion import (
+    AzureChatCompletion,
+)
+from semantic_kernel.connectors.ai.open_ai.services.azure_text_embedding import (
+    AzureTextEmbedding,
+)
+from semantic_kernel.connectors.ai.prompt_execution_settings import (
+    PromptExecutionSettings,
+)
+from semantic_kernel.contents import (
+    ChatHistory,
+    ChatMessageContent,
+    StreamingChatMessageContent,
+)
+from app.core.context_builder import estimate_tokens
+from app.core.mock_services import MockChatCompletion, MockTextEmbedding
+from app.core.rate_limit import TokenBucketLimiter
+from app.core.single_flight import SingleFlight
+from app.core.tracing import tracer
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+single_flight_enabled = os.getenv("SINGLE_FLIGHT_ENABLED", "true").lower() == "true"
+
+# Shared by every kernel so identical requests from different requests coalesce
+chat_single_flight = SingleFlight()
+
+
+def _per_minute(name: str) -> Optional[float]:
+    """Read a per-minute quota from the environment; unset or 0 means unlimited."""
+    value = float(os.getenv(name, "0"))
+    return value if value > 0 else None
+
+
+# Admission control in front of the chat and embedding deployments
+chat_limiter = TokenBucketLimiter(
+    "chat",
+    requests_per_minute=_per_minute("CHAT_RATE_LIMIT_RPM"),
+    tokens_per_minute=_per_minute("CHAT_RATE_LIMIT_TPM"),
+    max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "30")),
+    max_retries=int(os.getenv("RATE_LIMIT_MAX_RETRIES", "3")),
+)
+embedding_limiter = TokenBucketLimiter(
+    "embeddings",
+    requests_per_minute=_per_minute("EMBEDDING_RATE_LIMIT_RPM"),
+    tokens_per_minute=_per_minute("EMBEDDING_RATE_LIMIT_TPM"),
+    max_wait=float(os.getenv("RATE_LIMIT_MAX_WAIT_SECONDS", "30")),
+    max_retries=int(os.getenv("RATE_LIMIT_MAX_RETRIES", "3")),
+)
+
+
+def estimate_request_tokens(
+    chat_history: ChatHistory, settings: PromptExecutionSettings
+) -> int:
+    """
+    Estimate the quota a completion consumes: its prompt plus ``max_tokens``.
+
+    Azure OpenAI charges the requested ``max_tokens`` against the tokens per
+    minute quota up front, so it is counted in full.
+    """
+    prompt_tokens = sum(
+        estimate_tokens(message.content or "") for message in chat_history.messages
+    )
+    return prompt_tokens + (getattr(settings, "max_tokens", None) or 0)
+
+
+class SharedChatCompletionMixin:
+    """
+    Routes a chat completion service's requests through process-wide gates.
+
+    Kernels are created per request, so anything that must see all traffic
+    lives at module level and is applied here to every completion, including
+    each round of automatic tool calling: identical non-streaming requests are
+    coalesced, and every upstream call is admitted by the chat rate limiter.
+    """
+
+    def request_key(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> str:
+        """Hash the messages and settings exactly as they are sent upstream."""
+        request = {
+            key: value
+            for key, value in settings.prepare_settings_dict().items()
+            if key != "messages"
+        }
+        payload = json.dumps(
+            {
+                "model": self.ai_model_id,
+                "messages": self._prepare_chat_history_for_request(chat_history),
+                "settings": request,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def _inner_get_chat_message_contents(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> List[ChatMessageContent]:
+        with tracer.span(
+            "chat", "llm", model=self.ai_model_id, messages=len(chat_history.messages)
+        ) as span:
+            coalesced = False
+            if not single_flight_enabled:
+                messages = await self._limited_completion(chat_history, settings)
+            else:
+                key = self.request_key(chat_history, settings)
+                coalesced = chat_single_flight.in_flight(key)
+                messages = await chat_single_flight.do(
+                    key, lambda: self._limited_completion(chat_history, settings)
+                )
+                # Callers append to and edit their results, so each gets its own copy
+                messages = [message.model_copy(deep=True) for message in messages]
+
+            # A coalesced caller's tokens were already counted by the first caller
+            span.set(coalesced=coalesced)
+            if not coalesced:
+                for message in messages:
+                    span.record_usage(message.metadata.get("usage"))
+            return messages
+
+    async def _limited_completion(
+        self, chat_history: ChatHistory, settings: PromptExecutionSettings
+    ) -> List[ChatMessageContent]:
+        call = super()._inner_get_chat_message_contents
+        return await chat_limiter.run(
+            estimate_request_tokens(chat_history, settings),
+            lambda: call(chat_history, settings),
+        )
+
+    async def _inner_get_streaming_chat_message_contents(
+        self,
+        chat_history: ChatHistory,
+        settings: PromptExecutionSettings,
+        *args: Any,
+        **kwargs: Any,
+    ) -> AsyncGenerator[List[StreamingChatMessageContent], Any]:
+        # The span is ended by hand because a stream may be consumed elsewhere
+        span = tracer.start_span(
+            "chat", "llm",
+            model=self.ai_model_id,
+            messages=len(chat_history.messages),
+            streaming=True,
+        )
+        error = None
+        try:
+            # Streams are admitted but not retried, since chunks may already be out
+            await chat_limiter.acquire(estimate_request_tokens(chat_history, settings))
+            async for messages in super()._inner_get_streaming_chat_message_contents(
+                chat_history, settings, *args, **kwargs
+            ):
+                for message in messages:
+                    span.record_usage(message.metadata.get("usage"))
+                yield messages
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            span.end(error)
+
+
+class SharedEmbeddingMixin:
+    """Admits an embedding service's requests through the embedding rate limiter."""
+
+    async def generate_raw_embeddings(
+        self,
+        texts: List[str],
+        settings: Optional[PromptExecutionSettings] = None,
+        batch_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Any:
+        call = super().generate_raw_embeddings
+        requests = math.ceil(len(texts) / batch_size) if batch_size else 1
+        tokens = sum(estimate_tokens(text) for text in texts)
+        with tracer.span(
+            "embeddings", "llm", model=self.ai_model_id, texts=len(texts)
+        ) as span:
+            # The embeddings API reports no usage, so the estimate is recorded
+            span.set(prompt_tokens=tokens)
+            return await embedding_limiter.run(
+                tokens,
+                lambda: call(texts, settings, batch_size, **kwargs),
+                requests=requests,
+            )
+
+
+class SharedAzureChatCompletion(SharedChatCompletionMixin, AzureChatCompletion):
+    """AzureChatCompletion behind the shared request gates."""
+
+
+class SharedAzureTextEmbedding(SharedEmbeddingMixin, AzureTextEmbedding):
+    """AzureTextEmbedding behind the embedding rate limiter."""
+
+
+class SharedMockChatCompletion(SharedChatCompletionMixin, MockChatCompletion):
+    """MockChatCompletion behind the shared request gates, as in production."""
+
+
+class SharedMockTextEmbedding(SharedEmbeddingMixin, MockTextEmbedding):
+    """MockTextEmbedding behind the embedding rate limiter, as in production."""
@@ -0,0 +1,278 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+def _json_size(data: Any) -> int:
+    """Approximate the memory held by a session by its JSON length."""
+    return len(json.dumps(data, default=str))
+
+
+class SessionStore(ABC):
+    """
+    Base class for session stores with idle expiry and bounded size.
+
+    Sessions idle for longer than ``idle_ttl`` seconds expire, and the least
+    recently used sessions are evicted once the store exceeds ``max_entries``.
+    A background sweeper removes expired sessions; it starts with the first
+    write so stores can be created at import time.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float = 1800.0,
+        max_entries: int = 1000,
+        sweep_interval: float = 60.0,
+    ):
+        self.idle_ttl = idle_ttl
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self.evictions = 0
+        self.expirations = 0
+        self._sweeper: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def get(self, session_id: str) -> Optional[Any]:
+        """Return the session data and mark it as used, or None if unknown or expired."""
+
+    @abstractmethod
+    async def put(self, session_id: str, data: Any) -> None:
+        """Create or replace a session."""
+
+    @abstractmethod
+    async def delete(self, session_id: str) -> bool:
+        """Remove a session, returning whether it existed."""
+
+    @abstractmethod
+    async def sweep(self) -> int:
+        """Remove expired sessions, returning how many were removed."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Return the number of live sessions."""
+
+    async def metrics(self) -> Dict[str, Any]:
+        return {
+            "live_sessions": await self.count(),
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "idle_ttl_seconds": self.idle_ttl,
+            "max_entries": self.max_entries,
+        }
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is None or self._sweeper.done():
+            loop = asyncio.get_running_loop()
+            self._sweeper = loop.create_task(self._sweep_forever())
+
+    async def _sweep_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                removed = await self.sweep()
+                if removed:
+                    logger.info(f"Session sweeper removed {removed} expired sessions")
+            except Exception as e:
+                logger.error(f"Error sweeping sessions: {str(e)}")
+
+
+class InMemorySessionStore(SessionStore):
+    """
+    Session store kept in process memory, bounded by entry count and size.
+
+    Args:
+        max_bytes (int, optional): Evict least recently used sessions once the
+            summed ``sizer`` estimate exceeds this many bytes.
+        sizer (callable, optional): Estimates the bytes held by a session.
+            Defaults to the length of its JSON encoding.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: float = 1800.0,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+        sweep_interval: float = 60.0,
+        sizer: Callable[[Any], int] = _json_size,
+    ):
+        super().__init__(idle_ttl, max_entries, sweep_interval)
+        self.max_bytes = max_bytes
+        self.sizer = sizer
+        self.total_bytes = 0
+        # session_id -> (last_access, size, data), least recently used first
+        self._sessions: "OrderedDict[str, tuple[float, int, Any]]" = OrderedDict()
+
+    async def get(self, session_id: str) -> Optional[Any]:
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+
+        last_access, size, data = entry
+        now = time.monotonic()
+        if now - last_access > self.idle_ttl:
+            self._remove(session_id)
+            self.expirations += 1
+            return None
+
+        self._sessions[session_id] = (now, size, data)
+        self._sessions.move_to_end(session_id)
+        return data
+
+    async def put(self, session_id: str, data: Any) -> None:
+        self._ensure_sweeper()
+        self._remove(session_id)
+        size = self.sizer(data)
+        self._sessions[session_id] = (time.monotonic(), size, data)
+        self.total_bytes += size
+
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_entries
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            evicted_id = next(iter(self._sessions))
+            self._remove(evicted_id)
+            self.evictions += 1
+            logger.info(f"Evicted least recently used session {evicted_id}")
+
+    async def delete(self, session_id: str) -> bool:
+        return self._remove(session_id)
+
+    async def sweep(self) -> int:
+        cutoff = time.monotonic() - self.idle_ttl
+        expired = [
+            session_id
+            for session_id, (last_access, _, _) in self._sessions.items()
+            if last_access < cutoff
+        ]
+        for session_id in expired:
+            self._remove(session_id)
+        self.expirations += len(expired)
+        return len(expired)
+
+    async def count(self) -> int:
+        return len(self._sessions)
+
+    async def metrics(self) -> Dict[str, Any]:
+        return {
+            **await super().metrics(),
+            "total_bytes": self.total_bytes,
+            "max_bytes": self.max_bytes,
+        }
+
+    def _remove(self, session_id: str) -> bool:
+        entry = self._sessions.pop(session_id, None)
+        if entry is None:
+            return False
+        self.total_bytes -= entry[1]
+        return True
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Session store persisted in SQLite, shared by every worker using the same file.
+
+    Session data must be JSON-serializable. Queries run in a worker thread so
+    they never block the event loop.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        idle_ttl: float = 1800.0,
+        max_entries: int = 1000,
+        sweep_interval: float = 60.0,
+    ):
+        super().__init__(idle_ttl, max_entries, sweep_interval)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS sessions "
+                "(id TEXT PRIMARY KEY, data TEXT NOT NULL, last_access REAL NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS sessions_last_access "
+                "ON sessions (last_access)"
+            )
+
+    def _get(self, session_id: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT data, last_access FROM sessions WHERE id = ?", (session_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.idle_ttl:
+                self._connection.execute(
+                    "DELETE FROM sessions WHERE id = ?", (session_id,)
+                )
+                self.expirations += 1
+                return None
+            self._connection.execute(
+                "UPDATE sessions SET last_access = ? WHERE id = ?", (now, session_id)
+            )
+        return json.loads(row[0])
+
+    def _put(self, session_id: str, data: Any) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sessions (id, data, last_access) "
+                "VALUES (?, ?, ?)",
+                (session_id, json.dumps(data), time.time()),
+            )
+            evicted = self._connection.execute(
+                "DELETE FROM sessions WHERE id IN (SELECT id FROM sessions "
+                "ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        self.evictions += max(evicted, 0)
+
+    def _delete(self, session_id: str) -> bool:
+        with self._lock, self._connection:
+            return (
+                self._connection.execute(
+                    "DELETE FROM sessions WHERE id = ?", (session_id,)
+                ).rowcount
+                > 0
+            )
+
+    def _sweep(self) -> int:
+        with self._lock, self._connection:
+            removed = self._connection.execute(
+                "DELETE FROM sessions WHERE last_access < ?",
+                (time.time() - self.idle_ttl,),
+            ).rowcount
+        self.expirations += removed
+        return removed
+
+    def _count(self) -> int:
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM sessions").fetchone()
+        return row[0]
+
+    async def get(self, session_id: str) -> Optional[Any]:
+        return await asyncio.to_thread(self._get, session_id)
+
+    async def put(self, session_id: str, data: Any) -> None:
+        self._ensure_sweeper()
+        await asyncio.to_thread(self._put, session_id, data)
+
+    async def delete(self, session_id: str) -> bool:
+        return await asyncio.to_thread(self._delete, session_id)
+
+    async def sweep(self) -> int:
+        return await asyncio.to_thread(self._sweep)
+
+    async def count(self) -> int:
+        return await asyncio.to_thread(self._count)
@@ -0,0 +1,77 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One shared upstream call and the number of callers awaiting it."""
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one upstream call.
+
+    The first caller for a key starts the call; callers arriving while it is
+    in flight await the same result. Each caller awaits through a shield, so
+    cancelling one caller leaves the call running for the others. The call is
+    cancelled only once every caller has gone away.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self._flights: Dict[str, _Flight] = {}
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run ``call`` for ``key``, or join the call already in flight for it.
+
+        Args:
+            key: Identifies requests that are interchangeable.
+            call: Starts the upstream call; only invoked by the first caller.
+
+        Returns:
+            The result of the shared call. Its exception, if any, is raised in
+            every caller.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _: self._forget(key, flight))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+            logger.info(f"Joined in-flight call {key[:12]}")
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                # Nobody is left to use the result
+                self._forget(key, flight)
+                flight.task.cancel()
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for ``key`` is running, so a caller would join it."""
+        return key in self._flights
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._flights),
+        }
@@ -0,0 +1,72 @@
+import json
+import logging
+from typing import Any, AsyncIterator, Optional
+from fastapi.responses import StreamingResponse
+from semantic_kernel import Kernel
+from semantic_kernel.functions import KernelFunction
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Headers that keep proxies from buffering the event stream
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def format_sse(data: Any, event: Optional[str] = None) -> str:
+    """
+    Format a payload as a single server-sent event.
+
+    Args:
+        data: JSON-serializable payload for the ``data:`` field.
+        event (str, optional): Event name. Defaults to the SSE ``message`` event.
+
+    Returns:
+        str: The encoded event, terminated by a blank line.
+    """
+    message = f"event: {event}\n" if event else ""
+    message += f"data: {json.dumps(data, default=str)}\n\n"
+    return message
+
+
+def sse_response(events: AsyncIterator[str]) -> StreamingResponse:
+    """
+    Wrap an async iterator of encoded events in a ``text/event-stream`` response.
+
+    Starlette cancels the iterator when the client disconnects, which also
+    cancels the in-flight completion request.
+    """
+    return StreamingResponse(
+        events, media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
+async def stream_kernel_function(
+    kernel: Kernel, function: KernelFunction, result_key: str, **arguments: Any
+) -> AsyncIterator[str]:
+    """
+    Stream a prompt function as SSE ``token`` events followed by a ``done`` event.
+
+    Args:
+        kernel: The kernel used to invoke the function.
+        function: The prompt function to stream.
+        result_key: Key of the full result in the ``done`` event, matching the
+            field returned by the non-streaming endpoint.
+        **arguments: Kernel arguments for the function.
+
+    Yields:
+        str: Encoded server-sent events.
+    """
+    chunks = []
+    try:
+        async for message in kernel.invoke_stream(function, **arguments):
+            if not isinstance(message, list) or not message:
+                continue
+            content = message[0].content
+            if content:
+                chunks.append(content)
+                yield format_sse({"content": content}, event="token")
+
+        yield format_sse({result_key: "".join(chunks)}, event="done")
+    except Exception as e:
+        logger.error(f"Error streaming {function.plugin_name}.{function.name}: {str(e)}")
+        yield format_sse({"detail": str(e)}, event="error")
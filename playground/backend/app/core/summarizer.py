@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple
+from semantic_kernel import Kernel
+from semantic_kernel.connectors.ai.open_ai import AzureChatPromptExecutionSettings
+from semantic_kernel.functions import KernelFunction
+from app.core.cache import TTLCache, cache_stats
+from app.core.context_builder import count_tokens
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+SECTION_PROMPT = """
+    {{$input}}\n\nSummarize the text above in a few sentences. Keep names, numbers and key claims:"""
+
+MERGE_PROMPT = """
+    {{$input}}\n\nThese are summaries of consecutive parts of one document. Merge them into one shorter summary. Keep names, numbers and key claims:"""
+
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def _is_anchor(unit: str) -> bool:
+    """Pick about one unit in four, by content, as a preferred chunk start."""
+    return int(hashlib.sha256(unit.encode("utf-8")).hexdigest()[:8], 16) % 4 == 0
+
+
+class MapReduceSummarizer:
+    """
+    Condenses long documents by summarizing chunks and merging the summaries.
+
+    Text longer than ``chunk_tokens`` is split into chunks on paragraph, then
+    sentence, then word boundaries. Each chunk is summarized, with at most
+    ``max_concurrency`` calls in flight, and the partial summaries are merged
+    the same way until they fit in one chunk. The caller then runs its own
+    final prompt over the result.
+
+    Chunk summaries are cached by a hash of their content. Chunks preferably
+    start at paragraphs picked by content rather than position, so an edit
+    only moves the chunk boundaries near it; re-summarizing an edited document
+    reprocesses those chunks and serves the rest from the cache.
+
+    Args:
+        chunk_tokens (int): Token budget of one chunk and of the condensed text.
+        max_concurrency (int): Summarization calls in flight at once.
+        summary_max_tokens (int): Completion limit of each chunk summary.
+        max_levels (int): Summarization passes before the text is used as is.
+    """
+
+    def __init__(
+        self,
+        chunk_tokens: int = 2000,
+        max_concurrency: int = 4,
+        summary_max_tokens: int = 256,
+        max_levels: int = 4,
+        cache_max_entries: int = 4096,
+        cache_ttl: float = 86400.0,
+    ):
+        self.chunk_tokens = chunk_tokens
+        self.max_concurrency = max_concurrency
+        self.summary_max_tokens = summary_max_tokens
+        self.max_levels = max_levels
+        self.cache = TTLCache(max_entries=cache_max_entries, ttl=cache_ttl)
+        self.hits = 0
+        self.misses = 0
+
+    def split(self, text: str) -> List[str]:
+        """
+        Split text into chunks of at most ``chunk_tokens`` tokens.
+
+        A chunk is closed early, once it is at least half full, when the next
+        paragraph is an anchor, so chunk boundaries realign after an edit.
+        """
+        chunks: List[str] = []
+        current: List[str] = []
+        size = 0
+        for unit in self._units(text):
+            tokens = count_tokens(unit)
+            if current and (
+                size + tokens > self.chunk_tokens
+                or (size >= self.chunk_tokens // 2 and _is_anchor(unit))
+            ):
+                chunks.append("\n\n".join(current))
+                current, size = [], 0
+            current.append(unit)
+            size += tokens
+        if current:
+            chunks.append("\n\n".join(current))
+        return chunks
+
+    async def condense(self, kernel: Kernel, text: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Summarize text until it fits in one chunk, yielding progress on the way.
+
+        Args:
+            kernel: The kernel whose chat service writes the summaries.
+            text: The document to condense.
+
+        Yields:
+            dict: A ``progress`` event per summarized chunk, then a final
+            ``condensed`` event with the text to run the final prompt on.
+        """
+        stats = {"chunks": 1, "cached_chunks": 0, "levels": 0}
+        if count_tokens(text) <= self.chunk_tokens:
+            yield {"event": "condensed", "text": text, **stats}
+            return
+
+        stage, function = "map", self._add_function(kernel, "section", SECTION_PROMPT)
+        while True:
+            chunks = self.split(text)
+            if stats["levels"] == 0:
+                stats["chunks"] = len(chunks)
+            summaries: List[str] = [""] * len(chunks)
+            async for event in self._summarize_chunks(
+                kernel, function, chunks, summaries, stage, stats["levels"]
+            ):
+                if stats["levels"] == 0:
+                    stats["cached_chunks"] = event["cached"]
+                yield event
+
+            previous_tokens = count_tokens(text)
+            text = "\n\n".join(summaries)
+            stats["levels"] += 1
+            tokens = count_tokens(text)
+            if tokens <= self.chunk_tokens:
+                break
+            # Another pass cannot help once the summaries stop getting shorter
+            if stats["levels"] >= self.max_levels or tokens >= previous_tokens:
+                logger.warning(
+                    f"Summaries still exceed {self.chunk_tokens} tokens after "
+                    f"{stats['levels']} levels; using them as they are"
+                )
+                break
+            if stage == "map":
+                stage, function = "reduce", self._add_function(kernel, "merge", MERGE_PROMPT)
+
+        yield {"event": "condensed", "text": text, **stats}
+
+    def stats(self) -> Dict[str, Any]:
+        return cache_stats(
+            self.hits,
+            self.misses,
+            entries=len(self.cache),
+            chunk_tokens=self.chunk_tokens,
+        )
+
+    async def _summarize_chunks(
+        self,
+        kernel: Kernel,
+        function: KernelFunction,
+        chunks: List[str],
+        summaries: List[str],
+        stage: str,
+        level: int,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Fill ``summaries`` in place, yielding a progress event per chunk."""
+        # Identical chunks share one call and one cache entry
+        positions: Dict[str, List[int]] = {}
+        for index, chunk in enumerate(chunks):
+            key = hashlib.sha256(
+                f"{function.name}\0{self.summary_max_tokens}\0{chunk}".encode("utf-8")
+            ).hexdigest()
+            positions.setdefault(key, []).append(index)
+
+        progress = {
+            "stage": stage,
+            "level": level,
+            "completed": 0,
+            "cached": 0,
+            "total": len(chunks),
+        }
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency))
+
+        async def summarize(key: str) -> Tuple[str, str]:
+            async with semaphore:
+                result = await kernel.invoke(function, input=chunks[positions[key][0]])
+            return key, str(result).strip()
+
+        tasks = []
+        for key, indices in positions.items():
+            cached = self.cache.get(key)
+            if cached is None:
+                self.misses += 1
+                tasks.append(asyncio.create_task(summarize(key)))
+                continue
+            self.hits += 1
+            for index in indices:
+                summaries[index] = cached
+            progress["completed"] += len(indices)
+            progress["cached"] += len(indices)
+        if progress["cached"]:
+            yield {"event": "progress", **progress}
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                key, summary = await next_done
+                self.cache.set(key, summary)
+                for index in positions[key]:
+                    summaries[index] = summary
+                progress["completed"] += len(positions[key])
+                yield {"event": "progress", **progress}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _add_function(self, kernel: Kernel, name: str, prompt: str) -> KernelFunction:
+        return kernel.add_function(
+            prompt=prompt,
+            function_name=name,
+            plugin_name="Summarizer",
+            prompt_execution_settings=AzureChatPromptExecutionSettings(
+                service_id="chat", max_tokens=self.summary_max_tokens, temperature=0.0
+            ),
+        )
+
+    def _units(self, text: str) -> Iterator[str]:
+        """Yield paragraphs, splitting any that exceed a chunk into sentences or words."""
+        for paragraph in _PARAGRAPH_BREAK.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if count_tokens(paragraph) <= self.chunk_tokens:
+                yield paragraph
+                continue
+            for sentence in _SENTENCE_END.split(paragraph):
+                if count_tokens(sentence) <= self.chunk_tokens:
+                    yield sentence
+                    continue
+                piece: List[str] = []
+                size = 0
+                for word in sentence.split():
+                    tokens = count_tokens(" " + word)
+                    if piece and size + tokens > self.chunk_tokens:
+                        yield " ".join(piece)
+                        piece, size = [], 0
+                    piece.append(word)
+                    size += tokens
+                if piece:
+                    yield " ".join(piece)
+
+
+# Condenses long documents for /summarize
+summarizer = MapReduceSummarizer(
+    chunk_tokens=int(os.getenv("SUMMARY_CHUNK_TOKENS", "2000")),
+    max_concurrency=int(os.getenv("SUMMARY_MAX_CONCURRENCY", "4")),
+    summary_max_tokens=int(os.getenv("SUMMARY_CHUNK_MAX_TOKENS", "256")),
+    cache_max_entries=int(os.getenv("SUMMARY_CACHE_MAX_ENTRIES", "4096")),
+    cache_ttl=float(os.getenv("SUMMARY_CACHE_TTL_SECONDS", "86400")),
+)
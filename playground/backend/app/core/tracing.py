@@ -0,0 +1,509 @@
+import asyncio
+import functools
+import json
+import logging
+import os
+import random
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the latency histogram buckets, in seconds
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+
+# OTLP span kinds: internal work, incoming HTTP requests, outgoing model calls
+_OTLP_KINDS = {"http": 2, "llm": 3}
+
+# Span that new spans in this task become children of
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """
+    One timed operation, such as an HTTP request, kernel function or model call.
+
+    Durations come from ``perf_counter_ns``; the wall-clock start is kept only
+    so exporters can place the span on a timeline.
+    """
+
+    __slots__ = (
+        "tracer", "name", "kind", "trace_id", "span_id", "parent_id",
+        "attributes", "status", "start_unix_ns", "start_ns", "duration_ns",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        kind: str,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any],
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.kind = kind
+        self.trace_id = parent.trace_id if parent else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes
+        self.status = "ok"
+        self.start_unix_ns = time.time_ns()
+        self.start_ns = time.perf_counter_ns()
+        self.duration_ns: Optional[int] = None
+
+    def set(self, **attributes: Any) -> None:
+        self.attributes.update(attributes)
+
+    def record_usage(self, usage: Any) -> None:
+        """Add a CompletionUsage (or anything with token counts) to the span."""
+        for field in ("prompt_tokens", "completion_tokens"):
+            count = getattr(usage, field, None)
+            if count:
+                self.attributes[field] = self.attributes.get(field, 0) + count
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Stop the clock and hand the span to the tracer; later calls do nothing."""
+        if self.duration_ns is not None:
+            return
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        if isinstance(error, asyncio.CancelledError):
+            self.status = "cancelled"
+        elif error is not None:
+            self.status = "error"
+            self.attributes["error"] = f"{type(error).__name__}: {error}"
+        self.tracer._finish(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_unix_ns": self.start_unix_ns,
+            "duration_ms": round((self.duration_ns or 0) / 1e6, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan:
+    """Stand-in returned while tracing is disabled."""
+
+    name = kind = ""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def record_usage(self, usage: Any) -> None:
+        pass
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, cheap enough to update on every call."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile as the upper bound of the bucket it falls in."""
+        rank = q * self.count
+        cumulative = 0
+        for bound, count in zip(self.buckets + (self.max,), self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+
+class JsonlSpanExporter:
+    """Appends finished spans to a local file, one JSON object per line."""
+
+    def __init__(self, path: str, flush_every: int = 64):
+        self.path = path
+        self.flush_every = flush_every
+        self._file = open(path, "a", encoding="utf-8", buffering=1 << 16)
+        self._unflushed = 0
+
+    def export(self, span: Span) -> None:
+        self._file.write(json.dumps(span.to_dict(), default=str) + "\n")
+        self._unflushed += 1
+        if self._unflushed >= self.flush_every:
+            self._file.flush()
+            self._unflushed = 0
+
+    async def shutdown(self) -> None:
+        self._file.close()
+
+
+class OtlpSpanExporter:
+    """
+    Sends spans to an OpenTelemetry collector as OTLP/HTTP JSON.
+
+    Spans are queued and posted in batches from a background task, so the
+    request that finished a span never waits on the collector. When the
+    collector falls behind, spans beyond ``max_queue`` are dropped and counted.
+
+    Args:
+        endpoint (str): Traces URL, e.g. ``http://localhost:4318/v1/traces``.
+        service_name (str): Reported as the ``service.name`` resource attribute.
+        batch_size (int): Spans per request.
+        interval (float): Seconds after which a partial batch is sent anyway.
+        max_queue (int): Spans held while waiting to be sent.
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        service_name: str,
+        batch_size: int = 256,
+        interval: float = 5.0,
+        max_queue: int = 8192,
+    ):
+        self.endpoint = endpoint
+        self.service_name = service_name
+        self.batch_size = batch_size
+        self.interval = interval
+        self.max_queue = max_queue
+        self.exported = 0
+        self.dropped = 0
+        self._pending: List[Span] = []
+        self._last_flush = time.monotonic()
+        self._flushing: Optional[asyncio.Task] = None
+        self._client = None
+
+    def export(self, span: Span) -> None:
+        if len(self._pending) >= self.max_queue:
+            self.dropped += 1
+            return
+        self._pending.append(span)
+
+        due = (
+            len(self._pending) >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.interval
+        )
+        if due and (self._flushing is None or self._flushing.done()):
+            try:
+                self._flushing = asyncio.get_running_loop().create_task(self.flush())
+            except RuntimeError:
+                pass  # No event loop; the spans go out with the next flush
+
+    async def flush(self) -> None:
+        import httpx
+
+        self._last_flush = time.monotonic()
+        while self._pending:
+            batch = self._pending[: self.batch_size]
+            del self._pending[: self.batch_size]
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=10.0)
+            try:
+                response = await self._client.post(self.endpoint, json=self._payload(batch))
+                response.raise_for_status()
+                self.exported += len(batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                logger.warning(f"Failed to export {len(batch)} spans to {self.endpoint}: {e}")
+
+    async def shutdown(self) -> None:
+        await self.flush()
+        if self._client is not None:
+            await self._client.aclose()
+
+    def _payload(self, batch: List[Span]) -> Dict[str, Any]:
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otlp_attributes({"service.name": self.service_name})
+                    },
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": __name__},
+                            "spans": [_otlp_span(span) for span in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+
+
+def _otlp_span(span: Span) -> Dict[str, Any]:
+    otlp = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": _OTLP_KINDS.get(span.kind, 1),
+        "startTimeUnixNano": str(span.start_unix_ns),
+        "endTimeUnixNano": str(span.start_unix_ns + (span.duration_ns or 0)),
+        "attributes": _otlp_attributes({"span.kind": span.kind, **span.attributes}),
+        "status": {"code": 2 if span.status == "error" else 1},
+    }
+    if span.parent_id:
+        otlp["parentSpanId"] = span.parent_id
+    return otlp
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    encoded = []
+    for key, value in attributes.items():
+        if isinstance(value, bool):
+            encoded.append({"key": key, "value": {"boolValue": value}})
+        elif isinstance(value, int):
+            encoded.append({"key": key, "value": {"intValue": str(value)}})
+        elif isinstance(value, float):
+            encoded.append({"key": key, "value": {"doubleValue": value}})
+        elif value is not None:
+            encoded.append({"key": key, "value": {"stringValue": str(value)}})
+    return encoded
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Tracer:
+    """
+    Records spans with parent-child links and aggregates them into metrics.
+
+    The span active in the current task is kept in a ContextVar, so spans
+    started from filters, services and endpoints nest under the HTTP request
+    that caused them without any state being passed around. Every finished
+    span updates a latency histogram keyed by its kind and name, plus token
+    counters for model calls, and is handed to the configured exporters.
+
+    Args:
+        enabled (bool): When False, spans are no-ops and nothing is recorded.
+        exporters (list, optional): Objects with ``export(span)`` and
+            ``shutdown()``, such as JsonlSpanExporter or OtlpSpanExporter.
+    """
+
+    def __init__(self, enabled: bool = True, exporters: Optional[List[Any]] = None):
+        self.enabled = enabled
+        self.exporters = exporters or []
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self.errors: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.tokens: Dict[Tuple[str, str, str], int] = defaultdict(int)
+
+    def start_span(self, name: str, kind: str, **attributes: Any) -> Span:
+        """
+        Start a span under the current one without making it current.
+
+        Use this for work that outlives the caller's frame, such as a stream
+        consumed later; the caller must call ``end``.
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, kind, _current_span.get(), attributes)
+
+    @contextmanager
+    def span(self, name: str, kind: str, **attributes: Any) -> Iterator[Span]:
+        """Time the enclosed block as a span that is current while it runs."""
+        span = self.start_span(name, kind, **attributes)
+        if span is _NOOP_SPAN:
+            yield span
+            return
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.end(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+
+    def traced(self, name: str, kind: str) -> Callable:
+        """Decorator that runs every call of a function inside a span."""
+
+        def decorator(fn: Callable) -> Callable:
+            if asyncio.iscoroutinefunction(fn):
+
+                @functools.wraps(fn)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(name, kind):
+                        return await fn(*args, **kwargs)
+
+                return async_wrapper
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                with self.span(name, kind):
+                    return fn(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def _finish(self, span: Span) -> None:
+        key = (span.kind, span.name)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = LatencyHistogram()
+        histogram.observe(span.duration_ns / 1e9)
+        if span.status == "error":
+            self.errors[key] += 1
+        for field in ("prompt_tokens", "completion_tokens"):
+            count = span.attributes.get(field)
+            if count:
+                self.tokens[(span.kind, span.name, field.split("_")[0])] += count
+
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                logger.warning(f"Span exporter {type(exporter).__name__} failed: {e}")
+
+    async def shutdown(self) -> None:
+        for exporter in self.exporters:
+            await exporter.shutdown()
+
+    def summary(self) -> Dict[str, Any]:
+        """Latency percentiles, error counts and token totals per span kind and name."""
+        spans = []
+        for (kind, name), histogram in sorted(self.histograms.items()):
+            spans.append(
+                {
+                    "kind": kind,
+                    "name": name,
+                    "count": histogram.count,
+                    "errors": self.errors.get((kind, name), 0),
+                    "total_ms": round(histogram.sum * 1000, 1),
+                    "avg_ms": round(histogram.sum / histogram.count * 1000, 1),
+                    "p50_ms": round(histogram.quantile(0.5) * 1000, 1),
+                    "p90_ms": round(histogram.quantile(0.9) * 1000, 1),
+                    "p99_ms": round(histogram.quantile(0.99) * 1000, 1),
+                    "max_ms": round(histogram.max * 1000, 1),
+                }
+            )
+        tokens = [
+            {"kind": kind, "name": name, "type": token_type, "count": count}
+            for (kind, name, token_type), count in sorted(self.tokens.items())
+        ]
+        return {"enabled": self.enabled, "spans": spans, "tokens": tokens}
+
+    def prometheus(self) -> str:
+        """Render the metrics in the Prometheus text exposition format."""
+        lines = [
+            "# HELP sk_span_duration_seconds Duration of traced operations.",
+            "# TYPE sk_span_duration_seconds histogram",
+        ]
+        for (kind, name), histogram in sorted(self.histograms.items()):
+            labels = f'kind="{_label(kind)}",name="{_label(name)}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(
+                    f'sk_span_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}'
+                )
+            lines.append(
+                f'sk_span_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}'
+            )
+            lines.append(f"sk_span_duration_seconds_sum{{{labels}}} {histogram.sum}")
+            lines.append(f"sk_span_duration_seconds_count{{{labels}}} {histogram.count}")
+
+        lines += [
+            "# HELP sk_span_errors_total Traced operations that raised an error.",
+            "# TYPE sk_span_errors_total counter",
+        ]
+        for (kind, name), count in sorted(self.errors.items()):
+            lines.append(
+                f'sk_span_errors_total{{kind="{_label(kind)}",name="{_label(name)}"}} {count}'
+            )
+
+        lines += [
+            "# HELP sk_tokens_total Tokens reported by model calls.",
+            "# TYPE sk_tokens_total counter",
+        ]
+        for (kind, name, token_type), count in sorted(self.tokens.items()):
+            lines.append(
+                f'sk_tokens_total{{kind="{_label(kind)}",name="{_label(name)}",'
+                f'type="{token_type}"}} {count}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+class TracingMiddleware:
+    """
+    ASGI middleware that opens the root span of every HTTP request.
+
+    The span ends once the response body has been fully sent, so streaming
+    endpoints are timed to their last chunk. It is named after the matched
+    route template rather than the raw path to keep metric labels bounded.
+    """
+
+    def __init__(self, app, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self.tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        span = self.tracer.start_span(scope["method"], "http", path=scope["path"])
+        token = _current_span.set(span)
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                span.attributes["status_code"] = message["status"]
+            await send(message)
+
+        error = None
+        try:
+            await self.app(scope, receive, send_with_status)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            _current_span.reset(token)
+            route = scope.get("route")
+            span.name = f"{scope['method']} {getattr(route, 'path', '<unmatched>')}"
+            if error is None and span.attributes.get("status_code", 200) >= 500:
+                span.status = "error"
+            span.end(error)
+
+
+def create_tracer() -> Tracer:
+    """Create the tracer configured by the TRACING_* and OTLP_* environment variables."""
+    enabled = os.getenv("TRACING_ENABLED", "true").lower() == "true"
+    exporters = []
+    if enabled and os.getenv("TRACE_JSONL_PATH"):
+        exporters.append(JsonlSpanExporter(os.getenv("TRACE_JSONL_PATH")))
+    if enabled and os.getenv("OTLP_TRACES_ENDPOINT"):
+        exporters.append(
+            OtlpSpanExporter(
+                os.getenv("OTLP_TRACES_ENDPOINT"),
+                service_name=os.getenv("TRACE_SERVICE_NAME", "semantic-kernel-playground"),
+            )
+        )
+    return Tracer(enabled=enabled, exporters=exporters)
+
+
+# Shared by the middleware, filters and services so spans from one request nest
+tracer = create_tracer()
@@ -0,0 +1,183 @@
+import hashlib
+import json
+import logging
+import os
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, Optional
+from semantic_kernel.contents import AuthorRole, ChatMessageContent
+from semantic_kernel.filters import FunctionInvocationContext, PromptRenderContext
+from semantic_kernel.functions import FunctionResult
+from app.core.cache import SQLiteCache, TTLCache, cache_stats
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# Cache key computed while rendering the prompt of the function being invoked
+_pending_key: ContextVar[Optional[str]] = ContextVar(
+    "completion_cache_key", default=None
+)
+
+
+class CompletionCache:
+    """
+    Exact-match cache for prompt function completions.
+
+    Entries are keyed by a canonical hash of the rendered prompt, the model and
+    the execution settings, and live in a TTL/LRU memory tier backed by an
+    optional SQLite tier. Only deterministic settings (temperature at or below
+    ``max_temperature``, no function calling) are cached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 3600.0,
+        sqlite_path: Optional[str] = None,
+        max_temperature: float = 0.0,
+    ):
+        self.memory = TTLCache(max_entries=max_entries, ttl=ttl)
+        self.sqlite = (
+            SQLiteCache(sqlite_path, table="completions") if sqlite_path else None
+        )
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.hits = 0
+        self.misses = 0
+        self.skipped = 0
+        self.tokens_saved = 0
+
+    def make_key(self, context: PromptRenderContext) -> Optional[str]:
+        """
+        Compute the cache key for a rendered prompt, or None if it is not cacheable.
+        """
+        settings = context.arguments.execution_settings or getattr(
+            context.function, "prompt_execution_settings", None
+        )
+        canonical_settings = {}
+        for service_id, setting in (settings or {}).items():
+            # Tool results can change between calls, so tool use is never cached
+            if getattr(setting, "function_choice_behavior", None) is not None:
+                return None
+            values = setting.model_dump(exclude_none=True, mode="json")
+            values.update(values.pop("extension_data", {}) or {})
+            temperature = values.get("temperature")
+            if temperature is None or temperature > self.max_temperature:
+                return None
+            service = context.kernel.services.get(service_id)
+            values["model"] = getattr(service, "ai_model_id", None)
+            canonical_settings[service_id] = values
+
+        if not canonical_settings:
+            return None
+
+        payload = json.dumps(
+            {"prompt": context.rendered_prompt, "settings": canonical_settings},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``, promoting SQLite hits to memory."""
+        entry = self.memory.get(key)
+        if entry is None and self.sqlite is not None:
+            entry = await self.sqlite.get(key)
+            if entry is not None:
+                self.memory.set(key, entry)
+
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self.tokens_saved += entry.get("tokens", 0)
+        return entry
+
+    async def store(self, key: str, result: FunctionResult) -> None:
+        """Store the text and token usage of a completed function result."""
+        entry = {"content": str(result), "tokens": _total_tokens(result)}
+        self.memory.set(key, entry)
+        if self.sqlite is not None:
+            await self.sqlite.set(key, entry, self.ttl)
+
+    def stats(self) -> Dict[str, Any]:
+        return cache_stats(
+            self.hits,
+            self.misses,
+            skipped=self.skipped,
+            tokens_saved=self.tokens_saved,
+            entries=len(self.memory),
+            evictions=self.memory.evictions,
+            persistent=self.sqlite is not None,
+        )
+
+
+def _total_tokens(result: FunctionResult) -> int:
+    """Sum the prompt and completion tokens reported for a function result."""
+    total = 0
+    for metadata in (result.metadata or {}).get("metadata", []) or []:
+        usage = metadata.get("usage") if isinstance(metadata, dict) else None
+        if usage is not None:
+            total += (getattr(usage, "prompt_tokens", 0) or 0) + (
+                getattr(usage, "completion_tokens", 0) or 0
+            )
+    return total
+
+
+completion_cache = CompletionCache(
+    max_entries=int(os.getenv("COMPLETION_CACHE_MAX_ENTRIES", "1024")),
+    ttl=float(os.getenv("COMPLETION_CACHE_TTL_SECONDS", "3600")),
+    sqlite_path=os.getenv("COMPLETION_CACHE_SQLITE_PATH"),
+)
+
+
+async def completion_cache_render_filter(
+    context: PromptRenderContext,
+    next: Callable[[PromptRenderContext], Awaitable[None]],
+) -> None:
+    """
+    Filter that short-circuits the model call when the rendered prompt is cached.
+    """
+    await next(context)
+
+    if context.is_streaming:
+        return
+
+    key = completion_cache.make_key(context)
+    if key is None:
+        completion_cache.skipped += 1
+        return
+
+    entry = await completion_cache.lookup(key)
+    if entry is None:
+        # Remember the key so the invocation filter can store the completion
+        _pending_key.set(key)
+        return
+
+    logger.info(
+        f"Completion cache hit - {context.function.plugin_name}.{context.function.name}"
+    )
+    context.function_result = FunctionResult(
+        function=context.function.metadata,
+        value=[
+            ChatMessageContent(role=AuthorRole.ASSISTANT, content=entry["content"])
+        ],
+        metadata={"cache_hit": True},
+    )
+
+
+async def completion_cache_invocation_filter(
+    context: FunctionInvocationContext,
+    next: Callable[[FunctionInvocationContext], Awaitable[None]],
+) -> None:
+    """
+    Filter that stores the completion of a cache miss once the function returns.
+    """
+    token = _pending_key.set(None)
+    try:
+        await next(context)
+
+        key = _pending_key.get()
+        if key is not None and context.result is not None:
+            await completion_cache.store(key, context.result)
+    finally:
+        _pending_key.reset(token)
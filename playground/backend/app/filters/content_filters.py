@@ -1,6 +1,8 @@
 import re
 import logging
-from typing import List, Dict, Tuple, Callable, Awaitable, Any
+import string
+from typing import List, Dict, Tuple, Callable, Awaitable, Any, AsyncIterator
+from semantic_kernel.contents import StreamingChatMessageContent
 from semantic_kernel.filters import FunctionInvocationContext
 from semantic_kernel.functions import FunctionResult
 
@@ -19,36 +21,65 @@ PATTERNS = {
 }
 
 
+def compile_patterns(patterns: Dict[str, str]) -> "re.Pattern[str]":
+    """Combine the patterns into one regex with a named group per pattern."""
+    alternatives = "|".join(
+        f"(?P<{name}>{pattern})" for name, pattern in patterns.items()
+    )
+    # Hoist a shared leading word boundary so most positions fail on one check
+    if all(pattern.startswith(r"\b") for pattern in patterns.values()):
+        alternatives = "|".join(
+            f"(?P<{name}>{pattern[2:]})" for name, pattern in patterns.items()
+        )
+        return re.compile(rf"\b(?:{alternatives})")
+    return re.compile(alternatives)
+
+
+# Combined regex for the default patterns, compiled once at import
+COMBINED_PATTERN = compile_patterns(PATTERNS)
+
+
+def redaction_label(pattern_name: str) -> str:
+    """Return the placeholder that replaces a match of the given pattern."""
+    return f"[REDACTED {pattern_name.upper()}]"
+
+
 class ContentFilter:
     def __init__(self, patterns=PATTERNS):
         self.patterns = patterns
+        self.compiled_patterns = {
+            name: re.compile(pattern) for name, pattern in patterns.items()
+        }
+        self.combined_pattern = (
+            COMBINED_PATTERN if patterns is PATTERNS else compile_patterns(patterns)
+        )
+        self._pattern_order = {name: i for i, name in enumerate(patterns)}
 
     def redact_sensitive_info(self, text: str) -> tuple[str, list[str]]:
         """Redact sensitive information from text and return detected items."""
         if not text:
             return text, []
 
-        result = text
-        detected = []
+        matches = []
 
         logger.debug(
             f"Checking text for sensitive info: {text[:50]}{'...' if len(text) > 50 else ''}")
 
-        for pattern_name, pattern in self.patterns.items():
-            matches = re.finditer(pattern, result)
-            match_found = False
+        def redact(match: re.Match) -> str:
+            pattern_name = match.lastgroup
+            matches.append((pattern_name, match.group()))
+            return redaction_label(pattern_name)
 
-            for match in matches:
-                match_found = True
-                match_value = match.group()
-                detected.append(f"{pattern_name}: {match_value}")
-                result = result.replace(
-                    match_value, f"[REDACTED {pattern_name.upper()}]")
+        # One left-to-right scan over the text redacts every pattern at once
+        result = self.combined_pattern.sub(redact, text)
 
-            if match_found:
-                logger.debug(f"Found {pattern_name} pattern match in text")
+        # Report detections grouped by pattern, in pattern order
+        matches.sort(key=lambda m: self._pattern_order[m[0]])
+        detected = [f"{pattern_name}: {value}" for pattern_name, value in matches]
 
         if detected:
+            for pattern_name in dict.fromkeys(name for name, _ in matches):
+                logger.debug(f"Found {pattern_name} pattern match in text")
             logger.debug(
                 f"Detected {len(detected)} instances of sensitive information")
 
@@ -69,8 +100,7 @@ class ContentFilter:
             logger.info(
                 f"Testing pattern '{pattern_name}' with input '{test_input}'")
 
-            pattern = self.patterns[pattern_name]
-            match = re.search(pattern, test_input)
+            match = self.compiled_patterns[pattern_name].search(test_input)
 
             if match:
                 logger.info(
@@ -88,6 +118,131 @@ class ContentFilter:
 
         return detected
 
+
+# Characters that can continue a match that reaches the end of the buffer
+_MATCH_CHARS = frozenset(string.ascii_letters + string.digits + "._%+-@()|")
+# Tail of digits and separators that could grow into a card, phone or SSN match
+_DIGIT_TAIL = re.compile(r"[\d(+][\d()+\-\s]*\Z")
+# Longest card, phone or SSN match, e.g. "+123 (555) 123-4567"
+MAX_DIGIT_MATCH_CHARS = 19
+# Longest valid email address; longer tails are released unredacted
+MAX_HOLD_CHARS = 254
+
+
+class StreamingRedactor:
+    """
+    Redacts a stream of text chunks incrementally with a ContentFilter.
+
+    Text is released as soon as no later chunk can change how it is redacted.
+    Only the trailing characters that could still start or extend a match are
+    held back until the next chunk or ``flush``, so the output matches what
+    ``redact_sensitive_info`` returns for the whole text.
+    """
+
+    def __init__(self, content_filter: ContentFilter):
+        self.content_filter = content_filter
+        self.detected: List[str] = []
+        self._buffer = ""
+        # Last released character, so \b at the start of the buffer is exact
+        self._previous = ""
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk and return the redacted text that is safe to release."""
+        self._buffer += chunk
+        return self._release(self._hold_start())
+
+    def flush(self) -> str:
+        """Redact and return everything still held back at the end of the stream."""
+        return self._release(len(self._buffer))
+
+    def _hold_start(self) -> int:
+        buffer = self._buffer
+        start = len(buffer)
+        while start > 0 and buffer[start - 1] in _MATCH_CHARS:
+            start -= 1
+
+        digits = _DIGIT_TAIL.search(
+            buffer, max(len(buffer) - MAX_DIGIT_MATCH_CHARS, 0)
+        )
+        if digits:
+            start = min(start, digits.start())
+        return max(start, len(buffer) - MAX_HOLD_CHARS)
+
+    def _release(self, hold: int) -> str:
+        text = self._previous + self._buffer
+        position = len(self._previous)
+        hold += position
+
+        pieces = []
+        for match in self.content_filter.combined_pattern.finditer(text, position):
+            if match.end() > hold:
+                # A match running into the held tail may still grow; hold it whole
+                hold = min(hold, match.start())
+                break
+            pattern_name = match.lastgroup
+            self.detected.append(f"{pattern_name}: {match.group()}")
+            pieces.append(text[position : match.start()])
+            pieces.append(redaction_label(pattern_name))
+            position = match.end()
+        pieces.append(text[position:hold])
+
+        self._previous = text[hold - 1 : hold] or self._previous
+        self._buffer = text[hold:]
+        return "".join(pieces)
+
+
+# Shared filter instance used by the kernel filters and the filters API
+content_filter = ContentFilter()
+
+
+async def redact_stream(
+    stream: AsyncIterator[List[Any]],
+) -> AsyncIterator[List[Any]]:
+    """
+    Redact the chat message chunks of a streaming function result as they arrive.
+
+    Each choice gets its own StreamingRedactor; chunks without text, such as
+    usage updates, pass through unchanged.
+    """
+    redactors: Dict[int, StreamingRedactor] = {}
+    roles = {}
+    async for messages in stream:
+        redacted = []
+        for message in messages:
+            if not isinstance(message, StreamingChatMessageContent) or not message.content:
+                redacted.append(message)
+                continue
+
+            redactor = redactors.setdefault(
+                message.choice_index, StreamingRedactor(content_filter)
+            )
+            roles[message.choice_index] = message.role
+            released = redactor.feed(message.content)
+            if released:
+                message = message.model_copy(deep=True)
+                message.content = released
+                redacted.append(message)
+        if redacted:
+            yield redacted
+
+    # Release whatever is still held back at the end of the stream
+    tail = []
+    for choice_index, redactor in redactors.items():
+        released = redactor.flush()
+        if released:
+            tail.append(
+                StreamingChatMessageContent(
+                    role=roles[choice_index], choice_index=choice_index, content=released
+                )
+            )
+    if tail:
+        yield tail
+
+    detected = [item for redactor in redactors.values() for item in redactor.detected]
+    if detected:
+        logger.warning(
+            f"Sensitive information detected in streamed output: {', '.join(detected)}")
+
 # Input filter function for semantic kernel
 
 
@@ -99,8 +254,6 @@ async def input_filter_fn(
     Filter function that detects and redacts sensitive information from function inputs.
     This demonstrates pre-processing in the Semantic Kernel pipeline.
     """
-    content_filter = ContentFilter()
-
     # Check if there's an input parameter
     if "input" in context.arguments:
         original_input = context.arguments["input"]
@@ -137,9 +290,17 @@ async def output_filter_fn(
     # First, continue to the next filter or execute the function
     await next(context)
 
+    # Streaming results are redacted chunk by chunk as the client reads them
+    if context.is_streaming and context.result is not None:
+        context.result = FunctionResult(
+            function=context.function.metadata,
+            value=redact_stream(context.result.value),
+            metadata=context.result.metadata,
+        )
+        return
+
     # Process the output if it exists
     if context.result:
-        content_filter = ContentFilter()
         original_output = str(context.result)
 
         # Apply the filter
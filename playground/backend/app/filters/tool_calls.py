@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from semantic_kernel import Kernel
+from semantic_kernel.filters import AutoFunctionInvocationContext
+from semantic_kernel.functions import FunctionResult
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+class ToolCallRecorder:
+    """
+    Records every tool call the model makes during a request, with its result.
+
+    Register ``record`` as an ``auto_function_invocation`` filter on a
+    per-request kernel; the recorded results are exactly what the model saw,
+    so endpoints never need to invoke a tool a second time to report it.
+
+    Semantic Kernel runs the function calls of one model response together,
+    so the recorder also bounds how many run at once, applies a per-call
+    timeout, and timestamps each call relative to the start of the request.
+    A call that timed out keeps the error the model was given as its result,
+    but ``last_result`` only returns the results of calls that succeeded.
+    ``peak_in_flight`` is the most calls that ran at the same time, which
+    endpoints report as ``peak_tool_concurrency``.
+
+    Args:
+        max_concurrency (int, optional): Tool calls running at once across
+            the whole request. Defaults to no limit.
+        timeout (float, optional): Seconds before a tool call is abandoned and
+            the model is told it timed out. Defaults to no timeout.
+    """
+
+    def __init__(
+        self, max_concurrency: Optional[int] = None, timeout: Optional[float] = None
+    ):
+        self.calls: List[Dict[str, Any]] = []
+        self.timeout = timeout
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._semaphore = (
+            asyncio.Semaphore(max(1, max_concurrency)) if max_concurrency else None
+        )
+        self._start = time.perf_counter()
+
+    async def record(
+        self,
+        context: AutoFunctionInvocationContext,
+        next: Callable[[AutoFunctionInvocationContext], Awaitable[None]],
+    ) -> None:
+        queued_at = time.perf_counter()
+        if self._semaphore is not None:
+            await self._semaphore.acquire()
+        try:
+            started_at = time.perf_counter()
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            status = "ok"
+            try:
+                await asyncio.wait_for(next(context), self.timeout)
+            except asyncio.TimeoutError:
+                status = "timeout"
+                logger.warning(
+                    f"Tool call {context.function.plugin_name}.{context.function.name} "
+                    f"timed out after {self.timeout}s"
+                )
+                # Let the model continue with an explicit error instead of failing the turn
+                context.function_result = FunctionResult(
+                    function=context.function.metadata,
+                    value=f"Error: the tool call timed out after {self.timeout} seconds.",
+                )
+            finished_at = time.perf_counter()
+        finally:
+            self.in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+        result = context.function_result
+        self.calls.append(
+            {
+                "plugin_name": context.function.plugin_name,
+                "function_name": context.function.name,
+                "parameters": _tool_call_arguments(context),
+                "result": result.value if result is not None else None,
+                "status": status,
+                "queued_ms": round((started_at - queued_at) * 1000, 1),
+                "started_ms": round((started_at - self._start) * 1000, 1),
+                "duration_ms": round((finished_at - started_at) * 1000, 1),
+            }
+        )
+
+    def last_result(self, function_name: str) -> Optional[Any]:
+        """Return the result of the most recent successful call to ``function_name``."""
+        for call in reversed(self.calls):
+            if call["function_name"] == function_name and call["status"] == "ok":
+                return call["result"]
+        return None
+
+    def failed(self, *function_names: str) -> bool:
+        """Return whether any call to one of these functions did not succeed."""
+        return any(
+            call["function_name"] in function_names and call["status"] != "ok"
+            for call in self.calls
+        )
+
+    def plugin_calls(self) -> List[Dict[str, Any]]:
+        """Return the recorded calls with their timings, without the raw results."""
+        return [
+            {key: value for key, value in call.items() if key != "result"}
+            for call in sorted(self.calls, key=lambda call: call["started_ms"])
+        ]
+
+
+def _tool_call_arguments(context: AutoFunctionInvocationContext) -> Dict[str, Any]:
+    """Return the arguments the model passed, without the request's execution settings."""
+    arguments = context.arguments or {}
+    return {
+        parameter.name: arguments[parameter.name]
+        for parameter in context.function.metadata.parameters
+        if parameter.name in arguments
+    }
+
+
+def record_tool_calls(
+    kernel: Kernel,
+    max_concurrency: Optional[int] = None,
+    timeout: Optional[float] = None,
+) -> ToolCallRecorder:
+    """Attach a new ToolCallRecorder to a per-request kernel and return it."""
+    recorder = ToolCallRecorder(max_concurrency, timeout)
+    kernel.add_filter("auto_function_invocation", recorder.record)
+    return recorder
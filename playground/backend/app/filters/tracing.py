@@ -0,0 +1,82 @@
+from typing import Any, AsyncGenerator, Awaitable, Callable
+from semantic_kernel.filters import (
+    AutoFunctionInvocationContext,
+    FunctionInvocationContext,
+    PromptRenderContext,
+)
+from semantic_kernel.functions import FunctionResult
+from app.core.tracing import Span, tracer
+
+
+def _function_name(context: Any) -> str:
+    return f"{context.function.plugin_name}.{context.function.name}"
+
+
+async def _traced_stream(
+    stream: AsyncGenerator[Any, Any], span: Span
+) -> AsyncGenerator[Any, Any]:
+    """Pass a result stream through, ending ``span`` when it is exhausted."""
+    error = None
+    try:
+        async for chunk in stream:
+            yield chunk
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        span.end(error)
+
+
+async def tracing_invocation_filter(
+    context: FunctionInvocationContext,
+    next: Callable[[FunctionInvocationContext], Awaitable[None]],
+) -> None:
+    """
+    Time each kernel function invocation as a ``function`` span.
+
+    Streaming invocations return before any output exists, so their span is
+    kept open until the client has read the whole stream.
+    """
+    if not context.is_streaming:
+        with tracer.span(_function_name(context), "function"):
+            await next(context)
+        return
+
+    span = tracer.start_span(_function_name(context), "function", streaming=True)
+    try:
+        await next(context)
+    except BaseException as e:
+        span.end(e)
+        raise
+    if context.result is None:
+        span.end()
+        return
+    context.result = FunctionResult(
+        function=context.function.metadata,
+        value=_traced_stream(context.result.value, span),
+        metadata=context.result.metadata,
+    )
+
+
+async def tracing_render_filter(
+    context: PromptRenderContext,
+    next: Callable[[PromptRenderContext], Awaitable[None]],
+) -> None:
+    """Time prompt template rendering as a ``render`` span."""
+    with tracer.span(_function_name(context), "render") as span:
+        await next(context)
+        span.set(prompt_chars=len(context.rendered_prompt or ""))
+
+
+async def tracing_tool_filter(
+    context: AutoFunctionInvocationContext,
+    next: Callable[[AutoFunctionInvocationContext], Awaitable[None]],
+) -> None:
+    """Time each tool call the model requests as a ``tool`` span."""
+    with tracer.span(
+        _function_name(context),
+        "tool",
+        request_sequence_index=context.request_sequence_index,
+        function_sequence_index=context.function_sequence_index,
+    ):
+        await next(context)
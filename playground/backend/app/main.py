@@ -1,7 +1,16 @@
+import asyncio
 import logging
-from fastapi import FastAPI
+import math
+import os
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import http_exception_handler
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import memory, functions, weather, agents, filters, kernel, process
+from fastapi.responses import JSONResponse
+from app.api import metrics
+from app.core.lazy_routers import LazyRouterMiddleware, LazyRouters
+from app.core.rate_limit import RateLimitTimeout, throttling_retry_after
+from app.core.tracing import TracingMiddleware, tracer
 
 # Configure logging
 logging.basicConfig(
@@ -9,7 +18,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Semantic Kernel Demo API")
+# Import routers on their first request instead of at startup
+lazy_routers_enabled = os.getenv("LAZY_ROUTERS", "true").lower() == "true"
+# Import the remaining routers in the background once the app is serving
+router_warmup_enabled = os.getenv("ROUTER_WARMUP", "true").lower() == "true"
+# Run the content filter pattern self-test at startup
+startup_self_test = os.getenv("STARTUP_SELF_TEST", "false").lower() == "true"
+
+# Router modules and the path prefixes they serve
+ROUTER_MODULES = {
+    "app.api.memory": ("/memory",),
+    "app.api.functions": ("/functions", "/translate", "/summarize"),
+    "app.api.weather": ("/weather",),
+    "app.api.agents": ("/agent",),
+    "app.api.filters": ("/filters",),
+    "app.api.kernel": ("/kernel",),
+    "app.api.process": ("/process",),
+}
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if startup_self_test:
+        from app.filters.content_filters import content_filter
+
+        logger.info("Testing content filter regex patterns...")
+        test_results = content_filter.test_patterns()
+        logger.info(f"Pattern test results: {test_results}")
+
+    warmup = None
+    if lazy_routers_enabled and router_warmup_enabled:
+        warmup = asyncio.create_task(routers.warm_up())
+    yield
+    if warmup is not None:
+        warmup.cancel()
+    # Write process checkpoints still queued for the next batch
+    if "app.api.process" in routers.load_seconds:
+        from app.api.process import checkpoint_store
+
+        await checkpoint_store.close()
+    # Send any spans still queued for the exporters
+    await tracer.shutdown()
+
+
+app = FastAPI(title="Semantic Kernel Demo API", lifespan=lifespan)
 
 # Configure CORS
 app.add_middleware(
@@ -21,13 +73,39 @@ app.add_middleware(
 )
 
 # Include routers
-app.include_router(memory.router)
-app.include_router(functions.router)
-app.include_router(weather.router)
-app.include_router(agents.router)
-app.include_router(filters.router)
-app.include_router(kernel.router)
-app.include_router(process.router)
+routers = LazyRouters(app, ROUTER_MODULES)
+if lazy_routers_enabled:
+    app.add_middleware(LazyRouterMiddleware, routers=routers)
+else:
+    routers.load_all_now()
+app.include_router(metrics.router)
+
+# Trace every request; added last so its span encloses the other middleware
+app.add_middleware(TracingMiddleware, tracer=tracer)
+
+
+def rate_limited_response(detail: str, retry_after: float) -> JSONResponse:
+    """Build a 429 response telling the client when to retry."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": detail},
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+    )
+
+
+@app.exception_handler(RateLimitTimeout)
+async def rate_limit_timeout_handler(request: Request, exc: RateLimitTimeout):
+    return rate_limited_response(str(exc), exc.retry_after)
+
+
+@app.exception_handler(HTTPException)
+async def throttled_http_exception_handler(request: Request, exc: HTTPException):
+    # Endpoints turn every failure into a 500; report rate limiting as a 429
+    if exc.status_code == 500:
+        retry_after = throttling_retry_after(exc.__cause__ or exc.__context__)
+        if retry_after is not None:
+            return rate_limited_response(str(exc.detail), retry_after)
+    return await http_exception_handler(request, exc)
 
 
 # Root endpoint
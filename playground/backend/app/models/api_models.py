@@ -1,4 +1,4 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Literal, Optional, Union
 from pydantic import BaseModel
 
 
@@ -8,6 +8,12 @@ class MemoryItem(BaseModel):
     collection: str
 
 
+class MemoryBulkRequest(BaseModel):
+    items: List[MemoryItem]
+    batch_size: int = 64  # Texts per embedding request
+    max_concurrency: int = 4  # Embedding requests in flight at once
+
+
 class SearchQuery(BaseModel):
     collection: str
     query: str
@@ -20,6 +26,17 @@ class FunctionInput(BaseModel):
     prompt: str
     input_text: str
     parameters: Optional[Dict[str, str]] = None
+    temperature: Optional[float] = None  # 0 makes repeated calls cacheable
+
+
+class FunctionBatchInput(BaseModel):
+    function_name: str
+    plugin_name: str
+    prompt: str
+    inputs: List[Union[str, Dict[str, str]]]  # Input texts or argument maps
+    parameters: Optional[Dict[str, str]] = None  # Arguments shared by every input
+    temperature: Optional[float] = None
+    max_concurrency: int = 4  # Invocations in flight at once
 
 
 class AgentRequest(BaseModel):
@@ -30,6 +47,11 @@ class AgentRequest(BaseModel):
     temperature: float = 0.7
     available_plugins: List[str] = []
     chat_history: List[Dict[str, str]] = []
+    semantic_cache: bool = False  # Reuse answers to near-duplicate first questions
+    tool_concurrency: int = 4  # Tool calls running at once for this request
+    tool_timeout: Optional[float] = 30.0  # Seconds before a tool call is abandoned
+    session_id: Optional[str] = None  # Continue a server-side session; send only message
+    stateful: bool = False  # Start a server-side session seeded with chat_history
 
 
 class MultiAgentRequest(BaseModel):
@@ -42,19 +64,31 @@ class MultiAgentRequest(BaseModel):
     chat_history: List[Dict[str, str]] = []
     agent_configs: List[Dict[str, str]] = []
     max_iterations: int = 8
+    stream_tokens: bool = False  # Only used by /agent/multi-chat/stream
+    mode: Literal["sequential", "parallel"] = "sequential"  # Group chat or fan-out round
+    max_concurrency: int = 4  # Agents answering at once in parallel mode
+    tool_concurrency: int = 4  # Tool calls running at once for this request
+    tool_timeout: Optional[float] = 30.0  # Seconds before a tool call is abandoned
+    session_id: Optional[str] = None  # Continue a server-side session; send only message
+    stateful: bool = False  # Start a server-side session seeded with chat_history
 
 
 class TranslationRequest(BaseModel):
     text: str
     target_language: str
+    temperature: Optional[float] = None  # 0 makes repeated calls cacheable
 
 
 class WeatherRequest(BaseModel):
     query: str  # Changed from city to query to handle free text
+    semantic_cache: bool = False  # Reuse answers to near-duplicate queries
+    tool_concurrency: int = 4  # Tool calls running at once for this request
+    tool_timeout: Optional[float] = 30.0  # Seconds before a tool call is abandoned
 
 
 class SummarizeRequest(BaseModel):
     text: str
+    temperature: Optional[float] = None  # 0 makes repeated calls cacheable
 
 
 class FilterRequest(BaseModel):
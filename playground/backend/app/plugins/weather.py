@@ -1,9 +1,31 @@
+import asyncio
+import os
 import random
-from typing import Dict, List, Annotated
+from abc import ABC, abstractmethod
+from typing import Dict, List, Annotated, Optional
 from semantic_kernel.functions.kernel_function_decorator import kernel_function
+from app.core.cache import TTLCache
 
 
-class WeatherPlugin:
+class WeatherProvider(ABC):
+    """Source of weather data behind the WeatherPlugin."""
+
+    @abstractmethod
+    async def current(self, location: str) -> Dict:
+        """Return the current conditions for a location."""
+
+    @abstractmethod
+    async def forecast(self, location: str, days: int) -> List[Dict]:
+        """Return one forecast entry per day for a location."""
+
+    @abstractmethod
+    async def alert(self, location: str) -> Optional[str]:
+        """Return the active alert message for a location, if any."""
+
+
+class SimulatedWeatherProvider(WeatherProvider):
+    """Local provider that makes up plausible weather for the demo."""
+
     def __init__(self):
         # Simulated weather data
         self.weather_conditions = [
@@ -33,25 +55,109 @@ class WeatherPlugin:
             "Paris": "Air quality warning",
         }
 
-    @kernel_function
-    async def get_current_weather(
-        self, location: Annotated[str, "The city name to get weather for"]
-    ) -> Dict:
-        """Gets the current weather for a specified location."""
+    async def current(self, location: str) -> Dict:
         temp_range = self.temperature_ranges.get(
             location, self.temperature_ranges["Default"]
         )
-        temperature = random.randint(temp_range[0], temp_range[1])
-        condition = random.choice(self.weather_conditions)
-
         return {
             "location": location,
-            "temperature": temperature,
-            "condition": condition,
+            "temperature": random.randint(temp_range[0], temp_range[1]),
+            "condition": random.choice(self.weather_conditions),
             "humidity": random.randint(30, 95),
             "wind_speed": random.randint(0, 30),
         }
 
+    async def forecast(self, location: str, days: int) -> List[Dict]:
+        temp_range = self.temperature_ranges.get(
+            location, self.temperature_ranges["Default"]
+        )
+        return [
+            {
+                "day": i + 1,
+                "temperature": random.randint(temp_range[0], temp_range[1]),
+                "condition": random.choice(self.weather_conditions),
+                "humidity": random.randint(30, 95),
+                "wind_speed": random.randint(0, 30),
+            }
+            for i in range(days)
+        ]
+
+    async def alert(self, location: str) -> Optional[str]:
+        return self.alerts.get(location)
+
+
+class WeatherPlugin:
+    """
+    Weather functions for the kernel, backed by a cached WeatherProvider.
+
+    Provider results are cached per location and function for ``ttl``
+    seconds, so repeated tool calls within a conversation (or across
+    requests sharing the plugin) return the same data without a provider
+    round trip. Locations are normalized once, so every spelling of a city
+    gets the same provider lookup and cache entry, and callers receive
+    copies they are free to modify. The batch functions answer multi-city
+    questions in one tool call.
+
+    Args:
+        provider (WeatherProvider, optional): Defaults to the simulated provider.
+        ttl (float): Seconds a provider result stays cached.
+        max_entries (int): Cached (location, function) results kept at most.
+    """
+
+    def __init__(
+        self,
+        provider: Optional[WeatherProvider] = None,
+        ttl: float = 300.0,
+        max_entries: int = 1024,
+    ):
+        self.provider = provider or SimulatedWeatherProvider()
+        self.cache = TTLCache(max_entries=max_entries, ttl=ttl)
+
+    @staticmethod
+    def _normalize(location: str) -> str:
+        """Spell a city as the provider names it: "new  york" -> "New York"."""
+        return " ".join(location.split()).title()
+
+    async def _current(self, location: str) -> Dict:
+        location = self._normalize(location)
+        key = ("current", location)
+        current = self.cache.get(key)
+        if current is None:
+            current = await self.provider.current(location)
+            self.cache.set(key, current)
+        return dict(current)
+
+    async def _forecast(self, location: str, days: int) -> List[Dict]:
+        # One entry per location serves any shorter forecast as well
+        location = self._normalize(location)
+        key = ("forecast", location)
+        forecast = self.cache.get(key)
+        if forecast is None or len(forecast) < days:
+            forecast = await self.provider.forecast(location, days)
+            self.cache.set(key, forecast)
+        return [dict(day) for day in forecast[:days]]
+
+    async def _alert(self, location: str) -> Dict:
+        location = self._normalize(location)
+        key = ("alert", location)
+        alert = self.cache.get(key)
+        if alert is None:
+            message = await self.provider.alert(location)
+            alert = {
+                "location": location,
+                "has_alert": message is not None,
+                "alert_message": message if message else "No active alerts",
+            }
+            self.cache.set(key, alert)
+        return dict(alert)
+
+    @kernel_function
+    async def get_current_weather(
+        self, location: Annotated[str, "The city name to get weather for"]
+    ) -> Dict:
+        """Gets the current weather for a specified location."""
+        return await self._current(location)
+
     @kernel_function
     async def get_forecast(
         self,
@@ -59,33 +165,40 @@ class WeatherPlugin:
         days: Annotated[int, "Number of days for the forecast"] = 3,
     ) -> List[Dict]:
         """Gets a weather forecast for a specified number of days."""
-        forecast = []
-        temp_range = self.temperature_ranges.get(
-            location, self.temperature_ranges["Default"]
-        )
-
-        for i in range(days):
-            forecast.append(
-                {
-                    "day": i + 1,
-                    "temperature": random.randint(temp_range[0], temp_range[1]),
-                    "condition": random.choice(self.weather_conditions),
-                    "humidity": random.randint(30, 95),
-                    "wind_speed": random.randint(0, 30),
-                }
-            )
-
-        return forecast
+        return await self._forecast(location, days)
 
     @kernel_function
     async def get_weather_alert(
         self, location: Annotated[str, "The city name to check for weather alerts"]
     ) -> Dict:
         """Gets any active weather alerts for a location."""
-        alert = self.alerts.get(location)
+        return await self._alert(location)
 
-        return {
-            "location": location,
-            "has_alert": alert is not None,
-            "alert_message": alert if alert else "No active alerts",
-        }
+    @kernel_function
+    async def get_weather_batch(
+        self, locations: Annotated[List[str], "The city names to get weather for"]
+    ) -> List[Dict]:
+        """Gets the current weather for several locations in one call."""
+        return list(await asyncio.gather(*(self._current(loc) for loc in locations)))
+
+    @kernel_function
+    async def get_forecast_batch(
+        self,
+        locations: Annotated[List[str], "The city names to get forecasts for"],
+        days: Annotated[int, "Number of days for each forecast"] = 3,
+    ) -> List[Dict]:
+        """Gets weather forecasts for several locations in one call."""
+        forecasts = await asyncio.gather(
+            *(self._forecast(loc, days) for loc in locations)
+        )
+        return [
+            {"location": self._normalize(location), "forecast": forecast}
+            for location, forecast in zip(locations, forecasts)
+        ]
+
+
+# Shared instance so cached results are reused across requests
+weather_plugin = WeatherPlugin(
+    ttl=float(os.getenv("WEATHER_CACHE_TTL_SECONDS", "300")),
+    max_entries=int(os.getenv("WEATHER_CACHE_MAX_ENTRIES", "1024")),
+)
@@ -0,0 +1,120 @@
+"""
+Benchmark chat process session start: latency and memory per session.
+
+Compares two ways of starting a chatbot process session, each running the
+process's start event through the introduction step:
+
+    rebuild   a new kernel and a new ProcessBuilder graph, built per session
+    template  what /process/chat/start does: a fresh instance of the cached
+              process template, run on the shared chat kernel
+
+For each mode, N sessions are started back to back and the p50/p90/p99
+latency is reported, along with the memory retained per session while all N
+are kept alive (measured with tracemalloc). The mock AI services are used so
+no Azure credentials are needed.
+
+Usage (from playground/backend):
+    python scripts/bench_process_start.py [--sessions 200] [--modes rebuild,template]
+"""
+
+import argparse
+import asyncio
+import gc
+import os
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(BACKEND_DIR))
+os.environ.setdefault("AI_SERVICE_MODE", "mock")
+os.environ.setdefault("MOCK_LATENCY_MS", "0")
+
+from app.api import process  # noqa: E402
+from app.core.kernel import create_kernel  # noqa: E402
+from semantic_kernel.processes.local_runtime.local_event import (  # noqa: E402
+    KernelProcessEvent,
+)
+from semantic_kernel.processes.local_runtime.local_kernel_process import (  # noqa: E402
+    start,
+)
+
+
+async def start_rebuild():
+    kernel, _ = create_kernel(plugins=["Weather"])
+    chatbot = process.build_chatbot_process()
+    await start(
+        process=chatbot,
+        kernel=kernel,
+        initial_event=KernelProcessEvent(
+            id=process.ChatBotEvents.StartProcess, data=None
+        ),
+    )
+    return chatbot, kernel
+
+
+async def start_template():
+    return await process.run_chatbot_process(
+        uuid.uuid4().hex, process.ChatBotEvents.StartProcess
+    )
+
+
+MODES: Dict[str, Callable[[], Awaitable]] = {
+    "rebuild": start_rebuild,
+    "template": start_template,
+}
+
+
+def quantile(samples: List[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def report_latency(start_session: Callable, sessions: int) -> None:
+    samples = []
+    for _ in range(sessions):
+        started = time.perf_counter()
+        await start_session()
+        samples.append(time.perf_counter() - started)
+    print(
+        f"  latency: p50 {quantile(samples, 0.5) * 1000:7.2f} ms"
+        f"   p90 {quantile(samples, 0.9) * 1000:7.2f} ms"
+        f"   p99 {quantile(samples, 0.99) * 1000:7.2f} ms"
+    )
+
+
+async def report_memory(start_session: Callable, sessions: int) -> None:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    # Keep every session alive so the measurement is what each one retains
+    alive = [await start_session() for _ in range(sessions)]
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    print(
+        f"  memory:  {retained / sessions / 1024:7.1f} KiB per session"
+        f"   ({retained / 1024 / 1024:.1f} MiB for {len(alive)})"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", default="rebuild,template")
+    parser.add_argument("--sessions", type=int, default=200)
+    args = parser.parse_args()
+
+    for mode in args.modes.split(","):
+        start_session = MODES[mode]
+        # Untimed first call, so one-off imports and the shared kernel are excluded
+        await start_session()
+        print(f"\n[{mode}]")
+        await report_latency(start_session, args.sessions)
+        await report_memory(start_session, args.sessions)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
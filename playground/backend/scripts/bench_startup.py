@@ -0,0 +1,167 @@
+"""
+Benchmark backend cold start: import cost and time to first request.
+
+For each mode, reports the `python -X importtime` breakdown of importing
+app.main (self time summed per top-level package, and the slowest modules),
+then starts uvicorn and times how long until `/` answers and how long the
+first and second request to each probe route take. The mock AI services are
+used so no Azure credentials are needed.
+
+Modes:
+    eager  every router imported at startup (LAZY_ROUTERS=false)
+    lazy   routers imported on their first request, no background warm-up
+    warm   lazy, plus remaining routers imported in the background (default)
+
+Usage (from playground/backend):
+    python scripts/bench_startup.py [--modes eager,lazy,warm] [--top 10]
+"""
+
+import argparse
+import json
+import os
+import re
+import socket
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+
+MODES = {
+    "eager": {"LAZY_ROUTERS": "false"},
+    "lazy": {"LAZY_ROUTERS": "true", "ROUTER_WARMUP": "false"},
+    "warm": {"LAZY_ROUTERS": "true", "ROUTER_WARMUP": "true"},
+}
+
+# Requests timed after startup: (method, path, JSON body)
+PROBES = [
+    ("GET", "/kernel/cache", None),
+    ("POST", "/filters/process", {"text": "Email me at john.doe@example.com"}),
+    ("POST", "/translate", {"text": "Good morning", "target_language": "French"}),
+]
+
+IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+
+def mode_env(mode: str) -> Dict[str, str]:
+    env = dict(os.environ, AI_SERVICE_MODE="mock", MOCK_LATENCY_MS="0")
+    env.update(MODES[mode])
+    return env
+
+
+def import_profile(mode: str) -> Tuple[float, List[Tuple[str, int, int]]]:
+    """Import app.main under -X importtime; return total seconds and (module, self_us, cumulative_us)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=BACKEND_DIR,
+        env=mode_env(mode),
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing app.main failed:\n{result.stderr[-2000:]}")
+
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORT_LINE.match(line)
+        if match:
+            self_us, cumulative_us, _, name = match.groups()
+            modules.append((name, int(self_us), int(cumulative_us)))
+    total = next(c for name, _, c in modules if name == "app.main") / 1e6
+    return total, modules
+
+
+def report_imports(mode: str, top: int) -> None:
+    total, modules = import_profile(mode)
+    by_package: Dict[str, int] = defaultdict(int)
+    for name, self_us, _ in modules:
+        by_package[name.split(".")[0]] += self_us
+
+    print(f"  import app.main: {total * 1000:.0f} ms, {len(modules)} modules")
+    print("  self time by package:")
+    for package, self_us in sorted(by_package.items(), key=lambda p: -p[1])[:top]:
+        print(f"    {package:<28} {self_us / 1000:8.1f} ms")
+    print("  slowest modules (self time):")
+    for name, self_us, _ in sorted(modules, key=lambda m: -m[1])[:top]:
+        print(f"    {name:<50} {self_us / 1000:8.1f} ms")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def request(base_url: str, method: str, path: str, body: Optional[dict]) -> float:
+    """Send one request and return its latency in seconds."""
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    req = urllib.request.Request(
+        base_url + path,
+        data=data,
+        method=method,
+        headers={"Content-Type": "application/json"},
+    )
+    start = time.perf_counter()
+    with urllib.request.urlopen(req, timeout=120) as response:
+        response.read()
+    return time.perf_counter() - start
+
+
+def report_first_requests(mode: str, timeout: float) -> None:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--log-level", "warning"],
+        cwd=BACKEND_DIR,
+        env=mode_env(mode),
+    )
+    try:
+        while True:
+            try:
+                request(base_url, "GET", "/", None)
+                break
+            except (urllib.error.URLError, ConnectionError):
+                if server.poll() is not None:
+                    raise RuntimeError("uvicorn exited before serving")
+                if time.perf_counter() - start > timeout:
+                    raise RuntimeError(f"uvicorn not ready after {timeout}s")
+                time.sleep(0.02)
+        print(f"  time to first response: {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        for method, path, body in PROBES:
+            try:
+                first = request(base_url, method, path, body)
+                second = request(base_url, method, path, body)
+                print(
+                    f"    {method} {path:<20} first {first * 1000:8.1f} ms"
+                    f"   second {second * 1000:8.1f} ms"
+                )
+            except urllib.error.HTTPError as e:
+                print(f"    {method} {path:<20} failed: HTTP {e.code}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--modes", default="eager,lazy,warm")
+    parser.add_argument("--top", type=int, default=10, help="Rows in each import table")
+    parser.add_argument("--timeout", type=float, default=60.0, help="Seconds to wait for uvicorn")
+    args = parser.parse_args()
+
+    for mode in args.modes.split(","):
+        print(f"\n[{mode}]")
+        report_imports(mode, args.top)
+        report_first_requests(mode, args.timeout)
+
+
+if __name__ == "__main__":
+    main()
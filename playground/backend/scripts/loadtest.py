@@ -0,0 +1,236 @@
+"""
+Drive every playground router at a target request rate and report latency.
+
+By default the app runs in-process over an ASGI transport with the mock AI
+services (AI_SERVICE_MODE=mock), so no Azure credentials are needed and the
+memory growth of the app itself is measured. Pass --url to load an already
+running server instead, and --pid to sample that server's memory.
+
+Usage (from playground/backend):
+    python scripts/loadtest.py [--rps 20] [--duration 30] [--routes memory,agents]
+    python scripts/loadtest.py --url http://localhost:8000 --pid 12345
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+QUESTIONS = [
+    "What's the weather in Paris?",
+    "What's the forecast for Tokyo?",
+    "Summarize the benefits of unit testing.",
+    "What's the weather in New York?",
+]
+PII_TEXT = (
+    "Contact John at john.doe@example.com or (555) 123-4567. "
+    "Card 4111-1111-1111-1111 expires soon."
+)
+
+
+def rss_bytes(pid: Optional[int] = None) -> Optional[int]:
+    """Return the resident set size of a process, or None where unavailable."""
+    try:
+        with open(f"/proc/{pid or 'self'}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        return None
+
+
+async def _post(client: httpx.AsyncClient, path: str, payload: Dict[str, Any]):
+    response = await client.post(path, json=payload)
+    response.raise_for_status()
+    return response
+
+
+async def memory_scenario(client: httpx.AsyncClient, n: int) -> None:
+    await _post(
+        client,
+        "/memory/add",
+        {"id": f"load-{n}", "text": f"Load test fact number {n}", "collection": "loadtest"},
+    )
+    await _post(
+        client,
+        "/memory/search",
+        {"collection": "loadtest", "query": f"fact number {n}", "limit": 3},
+    )
+
+
+async def functions_scenario(client: httpx.AsyncClient, n: int) -> None:
+    path, payload = [
+        ("/translate", {"text": f"Good morning number {n}", "target_language": "French"}),
+        ("/summarize", {"text": f"Request {n}. " + QUESTIONS[n % len(QUESTIONS)]}),
+        (
+            "/functions/semantic",
+            {
+                "function_name": "echo",
+                "plugin_name": "LoadTest",
+                "prompt": "{{$input}}",
+                "input_text": f"Hello {n}",
+            },
+        ),
+    ][n % 3]
+    await _post(client, path, payload)
+
+
+async def weather_scenario(client: httpx.AsyncClient, n: int) -> None:
+    await _post(client, "/weather", {"query": QUESTIONS[n % 2 * 3]})
+
+
+async def agents_scenario(client: httpx.AsyncClient, n: int) -> None:
+    if n % 4:
+        await _post(
+            client,
+            "/agent/chat",
+            {"message": QUESTIONS[n % len(QUESTIONS)], "available_plugins": ["Weather"]},
+        )
+    else:
+        await _post(
+            client,
+            "/agent/multi-chat",
+            {"message": QUESTIONS[n % len(QUESTIONS)], "max_iterations": 4},
+        )
+
+
+async def filters_scenario(client: httpx.AsyncClient, n: int) -> None:
+    await _post(client, "/filters/process", {"text": f"{PII_TEXT} ({n})"})
+
+
+async def process_scenario(client: httpx.AsyncClient, n: int) -> None:
+    started = await _post(client, "/process/chat/start", {"message": ""})
+    process_id = started.json()["process_id"]
+    await _post(
+        client, f"/process/chat/{process_id}/message", {"message": f"Hello {n}"}
+    )
+
+
+SCENARIOS: Dict[str, Callable[[httpx.AsyncClient, int], Awaitable[None]]] = {
+    "memory": memory_scenario,
+    "functions": functions_scenario,
+    "weather": weather_scenario,
+    "agents": agents_scenario,
+    "filters": filters_scenario,
+    "process": process_scenario,
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+async def run(args: argparse.Namespace) -> None:
+    if args.url:
+        transport = None
+        base_url = args.url
+    else:
+        os.environ.setdefault("AI_SERVICE_MODE", "mock")
+        from app.main import app
+
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+
+    routes = args.routes.split(",") if args.routes else list(SCENARIOS)
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    errors: Dict[str, int] = defaultdict(int)
+    dropped = 0
+    in_flight = asyncio.Semaphore(args.max_in_flight)
+    tasks = set()
+
+    async def fire(route: str, n: int) -> None:
+        start = time.perf_counter()
+        try:
+            await SCENARIOS[route](client, n)
+            latencies[route].append((time.perf_counter() - start) * 1000)
+        except Exception as e:
+            errors[route] += 1
+            if args.verbose:
+                print(f"{route} #{n} failed: {e!r}")
+        finally:
+            in_flight.release()
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url=base_url, timeout=args.timeout
+    ) as client:
+        # Routers load on their first request, which is cold start, not load
+        for _ in range(args.warmup):
+            results = await asyncio.gather(
+                *(SCENARIOS[route](client, -1) for route in routes),
+                return_exceptions=True,
+            )
+            for route, result in zip(routes, results):
+                if isinstance(result, Exception) and args.verbose:
+                    print(f"{route} warm-up failed: {result!r}")
+
+        rss_start = rss_bytes(args.pid)
+        # Open-loop schedule: requests start on time whether or not earlier ones finished
+        interval = 1.0 / args.rps
+        started_at = time.perf_counter()
+        for n in itertools.count():
+            scheduled = started_at + n * interval
+            if scheduled - started_at >= args.duration:
+                break
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            if in_flight.locked():
+                dropped += 1
+                continue
+            await in_flight.acquire()
+            task = asyncio.create_task(fire(routes[n % len(routes)], n))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started_at
+    rss_end = rss_bytes(args.pid)
+
+    print(f"\n{'route':>10} {'ok':>6} {'err':>5} {'rps':>7} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    all_latencies = []
+    for route in routes:
+        values = latencies[route]
+        all_latencies.extend(values)
+        print(
+            f"{route:>10} {len(values):>6} {errors[route]:>5} {len(values) / elapsed:>7.1f} "
+            f"{percentile(values, 0.5):>8.1f} {percentile(values, 0.9):>8.1f} "
+            f"{percentile(values, 0.99):>8.1f} {max(values, default=0.0):>8.1f}"
+        )
+    print(
+        f"{'total':>10} {len(all_latencies):>6} {sum(errors.values()):>5} "
+        f"{len(all_latencies) / elapsed:>7.1f} {percentile(all_latencies, 0.5):>8.1f} "
+        f"{percentile(all_latencies, 0.9):>8.1f} {percentile(all_latencies, 0.99):>8.1f} "
+        f"{max(all_latencies, default=0.0):>8.1f}"
+    )
+    print(f"\nLatencies in ms over {elapsed:.1f}s; {dropped} requests dropped at the in-flight cap")
+    if rss_start is not None and rss_end is not None:
+        print(
+            f"Memory: {rss_start / 2**20:.1f} MB -> {rss_end / 2**20:.1f} MB "
+            f"({(rss_end - rss_start) / 2**20:+.1f} MB)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rps", type=float, default=20.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds to generate load")
+    parser.add_argument("--routes", help=f"Comma-separated subset of {','.join(SCENARIOS)}")
+    parser.add_argument("--url", help="Load a running server instead of the in-process app")
+    parser.add_argument("--pid", type=int, help="Server process to sample memory from")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed passes over the routes first")
+    parser.add_argument("--max-in-flight", type=int, default=256)
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--verbose", action="store_true")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
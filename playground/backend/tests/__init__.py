@@ -0,0 +1,5 @@
+import os
+
+# Run the app against the deterministic offline AI services
+os.environ.setdefault("AI_SERVICE_MODE", "mock")
+os.environ.setdefault("MOCK_LATENCY_MS", "0")
@@ -0,0 +1,92 @@
+import json
+import unittest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from semantic_kernel.agents import AgentGroupChat
+from app.main import app
+
+
+class AgentChatTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_chat_returns_the_answer_text(self):
+        response = self.client.post("/agent/chat", json={"message": "Hello agent"})
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertIsInstance(body["response"], str)
+        self.assertEqual(body["chat_history"][-1]["content"], body["response"])
+
+    def test_stream_done_event_matches_chat_payload(self):
+        response = self.client.post("/agent/chat/stream", json={"message": "Hello agent"})
+
+        self.assertEqual(response.status_code, 200)
+        done = response.text.split("event: done\ndata: ", 1)[1].split("\n", 1)[0]
+        chat = self.client.post("/agent/chat", json={"message": "Hello agent"}).json()
+        self.assertEqual(json.loads(done)["response"], chat["response"])
+
+
+class MultiAgentChatTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_failed_turn_leaves_the_session_unchanged(self):
+        started = self.client.post(
+            "/agent/multi-chat",
+            json={"message": "First question", "stateful": True, "max_iterations": 2},
+        ).json()
+        session_id = started["session_id"]
+        before = self.client.get(f"/agent/sessions/{session_id}").json()
+
+        async def failing_invoke(group_chat, *args, **kwargs):
+            raise RuntimeError("upstream failure")
+            yield
+
+        with patch.object(AgentGroupChat, "invoke", failing_invoke):
+            failed = self.client.post(
+                "/agent/multi-chat",
+                json={"message": "Lost question", "session_id": session_id},
+            )
+        after = self.client.get(f"/agent/sessions/{session_id}").json()
+
+        self.assertEqual(failed.status_code, 500)
+        self.assertEqual(after["chat_history"], before["chat_history"])
+
+    def test_streamed_turns_of_the_same_agent_stay_apart(self):
+        response = self.client.post(
+            "/agent/multi-chat/stream",
+            json={
+                "message": "Think twice",
+                "agent_configs": [{"name": "Thinker"}],
+                "max_iterations": 2,
+                "stream_tokens": True,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        done = response.text.split("event: done\ndata: ", 1)[1].split("\n", 1)[0]
+        turns = json.loads(done)["agent_responses"]
+        self.assertEqual([turn["agent_name"] for turn in turns], ["Thinker", "Thinker"])
+        self.assertEqual(response.text.count("event: turn\n"), 2)
+
+    def test_parallel_round_reports_its_timings(self):
+        response = self.client.post(
+            "/agent/multi-chat", json={"message": "Weigh in", "mode": "parallel"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        timings = response.json()["timings"]
+        self.assertIn("fan_out_ms", timings)
+        self.assertIn("synthesis_ms", timings)
+
+    def test_unknown_mode_is_rejected(self):
+        response = self.client.post(
+            "/agent/multi-chat", json={"message": "Weigh in", "mode": "paralel"}
+        )
+
+        self.assertEqual(response.status_code, 422)
+
+
+if __name__ == "__main__":
+    unittest.main()
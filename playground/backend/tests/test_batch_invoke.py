@@ -0,0 +1,49 @@
+import asyncio
+import unittest
+from app.core.batch_invoke import invoke_function_batch
+
+
+class EchoKernel:
+    """Kernel stand-in whose invocations return their input right away."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def invoke(self, function, **arguments):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return arguments["input"]
+
+
+class BatchInvokeTest(unittest.IsolatedAsyncioTestCase):
+    async def test_results_and_done_event(self):
+        kernel = EchoKernel()
+        inputs = [f"item {i}" for i in range(6)]
+
+        batch = invoke_function_batch(kernel, None, inputs, max_concurrency=2)
+        events = [event async for event in batch]
+
+        results = [event["result"] for event in events if event["event"] == "result"]
+        self.assertEqual(sorted(results), inputs)
+        self.assertEqual(events[-1]["event"], "done")
+        self.assertEqual(events[-1]["succeeded"], 6)
+
+    async def test_reader_leaving_early_stops_the_workers(self):
+        kernel = EchoKernel()
+        before = asyncio.all_tasks()
+        batch = invoke_function_batch(
+            kernel, None, [f"item {i}" for i in range(50)], max_concurrency=1
+        )
+
+        await batch.__anext__()
+        # Give the workers time to fill the bounded result queue
+        await asyncio.sleep(0.01)
+        await asyncio.wait_for(batch.aclose(), timeout=1)
+        await asyncio.sleep(0)
+
+        self.assertEqual(asyncio.all_tasks() - before, set())
+        self.assertLess(kernel.calls, 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+import unittest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+class CompletionCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def cache_hits(self):
+        return self.client.get("/kernel/cache").json()["completion_cache"]["hits"]
+
+    def test_translate_is_not_cached_by_default(self):
+        request = {"text": "Uncached morning", "target_language": "French"}
+        self.client.post("/translate", json=request)
+        hits = self.cache_hits()
+
+        response = self.client.post("/translate", json=request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.cache_hits(), hits)
+
+    def test_translate_at_temperature_zero_is_cached(self):
+        request = {"text": "Cached morning", "target_language": "French", "temperature": 0}
+        first = self.client.post("/translate", json=request).json()
+        hits = self.cache_hits()
+
+        second = self.client.post("/translate", json=request).json()
+
+        self.assertEqual(second, first)
+        self.assertEqual(self.cache_hits(), hits + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
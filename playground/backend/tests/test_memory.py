@@ -0,0 +1,60 @@
+import json
+import unittest
+from fastapi.testclient import TestClient
+from app.main import app
+
+
+def ndjson(lines):
+    return "\n".join(json.dumps(line) for line in lines) + "\n"
+
+
+class AddBulkToMemoryTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_ndjson_body_is_ingested(self):
+        items = [
+            {"id": f"bulk-{i}", "text": f"Bulk fact number {i}", "collection": "bulk-test"}
+            for i in range(7)
+        ]
+        response = self.client.post(
+            "/memory/add-bulk?batch_size=3",
+            content=ndjson(items),
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        events = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(events[-1]["event"], "done")
+        self.assertEqual(events[-1]["received"], 7)
+        self.assertEqual(events[-1]["ingested"], 7)
+        self.assertEqual(events[-1]["batches"], 3)
+
+    def test_malformed_ndjson_line_is_rejected(self):
+        body = ndjson([{"id": "ok", "text": "fine", "collection": "bulk-test"}])
+        response = self.client.post(
+            "/memory/add-bulk",
+            content=body + "{not json\n",
+            headers={"Content-Type": "application/x-ndjson"},
+        )
+
+        self.assertEqual(response.status_code, 422)
+        self.assertIn("line 2", response.json()["detail"])
+
+    def test_json_body_is_ingested(self):
+        response = self.client.post(
+            "/memory/add-bulk",
+            json={
+                "items": [
+                    {"id": "json-1", "text": "A JSON item", "collection": "bulk-test"}
+                ]
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        done = json.loads(response.text.splitlines()[-1])
+        self.assertEqual(done["ingested"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
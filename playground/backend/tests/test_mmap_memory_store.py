@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+import numpy as np
+from semantic_kernel.memory.memory_record import MemoryRecord
+from app.core.mmap_memory_store import MmapMemoryStore
+
+
+def record(id, text, embedding):
+    return MemoryRecord.local_record(
+        id=id,
+        text=text,
+        description=None,
+        additional_metadata=None,
+        embedding=np.array(embedding, dtype=np.float32),
+    )
+
+
+class MmapMemoryStoreTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.store = MmapMemoryStore(self.directory.name)
+        await self.store.create_collection("facts")
+
+    async def test_upsert_search_and_remove(self):
+        await self.store.upsert_batch(
+            "facts",
+            [
+                record("north", "Points north", [1, 0, 0]),
+                record("east", "Points east", [0, 1, 0]),
+                record("up", "Points up", [0, 0, 1]),
+            ],
+        )
+        # Upserting an existing key replaces its row
+        await self.store.upsert("facts", record("east", "Due east", [0, 2, 0]))
+
+        query = np.array([0.1, 1, 0])
+        matches = await self.store.get_nearest_matches("facts", query, 2)
+        self.assertEqual([match.id for match, _ in matches], ["east", "north"])
+        self.assertEqual(matches[0][0].text, "Due east")
+
+        await self.store.remove("facts", "east")
+
+        self.assertIsNone(await self.store.get("facts", "east"))
+        match, _ = await self.store.get_nearest_match("facts", query)
+        self.assertEqual(match.id, "north")
+
+    async def test_reopen_from_disk(self):
+        await self.store.upsert("facts", record("north", "Points north", [1, 0, 0]))
+        await self.store.upsert("facts", record("up", "Points up", [0, 0, 1]))
+        await self.store.remove("facts", "up")
+
+        reopened = MmapMemoryStore(self.directory.name)
+        north = await reopened.get("facts", "north", with_embedding=True)
+
+        self.assertEqual(north.text, "Points north")
+        np.testing.assert_allclose(north.embedding, [1, 0, 0])
+        self.assertIsNone(await reopened.get("facts", "up"))
+
+    async def test_collection_recreated_by_another_store(self):
+        other = MmapMemoryStore(self.directory.name)
+        await self.store.upsert_batch(
+            "facts", [record(f"old-{i}", "Old", [1, 0, 0]) for i in range(3)]
+        )
+        self.assertIsNotNone(await self.store.get("facts", "old-0"))
+
+        # The other worker resets the collection and writes more than was there
+        await other.delete_collection("facts")
+        await other.create_collection("facts")
+        await other.upsert_batch(
+            "facts",
+            [record(f"new-{i}", "A longer text " * 10, [0, 1, 0]) for i in range(5)],
+        )
+
+        self.assertIsNone(await self.store.get("facts", "old-0"))
+        query = np.array([1, 1, 0])
+        matches = await self.store.get_nearest_matches("facts", query, 10)
+        self.assertEqual(
+            sorted(match.id for match, _ in matches), [f"new-{i}" for i in range(5)]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
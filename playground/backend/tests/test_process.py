@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from unittest import mock
+import httpx
+from fastapi.testclient import TestClient
+from app.api import process
+from app.main import app
+
+
+class ChatTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def start_chat(self):
+        response = self.client.post("/process/chat/start", json={})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def send(self, process_id, message):
+        response = self.client.post(
+            f"/process/chat/{process_id}/message", json={"message": message}
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+
+class ChatProcessTest(ChatTestCase):
+    def test_chat_runs_the_process_template(self):
+        process.get_chatbot_process()
+        with mock.patch.object(
+            process, "build_chatbot_process", wraps=process.build_chatbot_process
+        ) as build:
+            started = self.start_chat()
+            reply = self.send(started["process_id"], "Hello process")
+
+        build.assert_not_called()
+        self.assertEqual(started["chat_history"][0]["role"], "system")
+        self.assertEqual(reply["response"], "Hello process")
+        self.assertEqual(
+            [message["role"] for message in reply["chat_history"]],
+            ["system", "user", "assistant"],
+        )
+
+    def test_exit_ends_the_chat(self):
+        process_id = self.start_chat()["process_id"]
+
+        reply = self.send(process_id, "exit")
+
+        self.assertEqual(reply["response"], "Goodbye! Chat session ended.")
+        self.assertEqual(len(reply["chat_history"]), 3)
+
+
+class ChatCheckpointTest(ChatTestCase):
+    def test_chat_turns_are_checkpointed(self):
+        process_id = self.start_chat()["process_id"]
+        self.send(process_id, "Checkpoint me")
+
+        checkpoint = self.client.get(f"/process/checkpoints/{process_id}").json()
+        metrics = self.client.get("/process/metrics").json()["checkpoints"]
+
+        steps = checkpoint["steps"]
+        self.assertEqual(steps["UserInputStep"]["user_inputs"], ["Checkpoint me"])
+        self.assertEqual(len(steps["ChatBotResponseStep"]["chat_messages"]), 3)
+        self.assertGreater(metrics["diffs_written"], 0)
+
+    def test_resume_restores_state_without_replaying_the_intro(self):
+        process_id = self.start_chat()["process_id"]
+        before = self.send(process_id, "First message")
+        # Lose the live session, as after a restart or on another worker
+        asyncio.run(process.session_store.delete(process_id))
+        process.checkpoint_store._last.pop(process_id, None)
+        lost = self.client.post(
+            f"/process/chat/{process_id}/message", json={"message": "Anyone there?"}
+        )
+        self.assertEqual(lost.status_code, 404)
+
+        resumed = self.client.post(f"/process/chat/{process_id}/resume")
+        after = self.send(process_id, "Second message")
+
+        self.assertEqual(resumed.status_code, 200)
+        self.assertEqual(resumed.json()["chat_history"], before["chat_history"])
+        roles = [message["role"] for message in after["chat_history"]]
+        self.assertEqual(roles, ["system", "user", "assistant", "user", "assistant"])
+        checkpoint = self.client.get(f"/process/checkpoints/{process_id}").json()
+        self.assertEqual(
+            checkpoint["steps"]["UserInputStep"]["user_inputs"],
+            ["First message", "Second message"],
+        )
+
+    def test_resume_unknown_process(self):
+        response = self.client.post("/process/chat/unknown-process/resume")
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_ending_a_chat_removes_its_checkpoints(self):
+        process_id = self.start_chat()["process_id"]
+        self.send(process_id, "Short chat")
+
+        self.client.delete(f"/process/chat/{process_id}")
+
+        response = self.client.post(f"/process/chat/{process_id}/resume")
+        self.assertEqual(response.status_code, 404)
+
+
+class ConcurrentChatTest(unittest.IsolatedAsyncioTestCase):
+    async def test_concurrent_messages_keep_both_turns(self):
+        transport = httpx.ASGITransport(app=app)
+        client = httpx.AsyncClient(transport=transport, base_url="http://test")
+        async with client:
+            started = await client.post("/process/chat/start", json={})
+            process_id = started.json()["process_id"]
+
+            replies = await asyncio.gather(
+                *(
+                    client.post(
+                        f"/process/chat/{process_id}/message", json={"message": message}
+                    )
+                    for message in ["Concurrent one", "Concurrent two"]
+                )
+            )
+            resumed = await client.post(f"/process/chat/{process_id}/resume")
+
+        self.assertEqual([reply.status_code for reply in replies], [200, 200])
+        user_messages = [
+            message["content"]
+            for message in resumed.json()["chat_history"]
+            if message["role"] == "user"
+        ]
+        self.assertEqual(sorted(user_messages), ["Concurrent one", "Concurrent two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.mock_services import MockChatCompletion
+from app.core.rate_limit import RateLimitTimeout
+from app.core.services import chat_limiter
+
+
+class UpstreamThrottled(Exception):
+    """Shaped like the OpenAI client's error for a 429 response."""
+
+    status_code = 429
+
+    class response:
+        headers = {"retry-after": "7"}
+
+
+TRANSLATE = {"text": "Good morning", "target_language": "French"}
+
+
+class RateLimitResponseTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_rejected_admission_returns_429(self):
+        rejected = RateLimitTimeout("chat rate limit: queued too long", retry_after=2.5)
+        with patch.object(chat_limiter, "acquire", side_effect=rejected):
+            response = self.client.post("/translate", json=TRANSLATE)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "3")
+
+    def test_upstream_throttling_after_retries_returns_429(self):
+        async def throttled(*args, **kwargs):
+            raise UpstreamThrottled("Too many requests")
+
+        with patch.object(chat_limiter, "max_retries", 0), patch.object(
+            MockChatCompletion, "_inner_get_chat_message_contents", throttled
+        ):
+            response = self.client.post("/translate", json=TRANSLATE)
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response.headers["Retry-After"], "7")
+
+    def test_other_errors_stay_500(self):
+        async def broken(*args, **kwargs):
+            raise RuntimeError("upstream exploded")
+
+        with patch.object(MockChatCompletion, "_inner_get_chat_message_contents", broken):
+            response = self.client.post("/translate", json=TRANSLATE)
+
+        self.assertEqual(response.status_code, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.plugins.weather import SimulatedWeatherProvider, WeatherPlugin
+
+
+class WeatherToolCallTest(unittest.TestCase):
+    def setUp(self):
+        self.client = TestClient(app)
+
+    def test_each_tool_call_runs_once(self):
+        locations = []
+        current = SimulatedWeatherProvider.current
+
+        async def counting_current(provider, location):
+            locations.append(location)
+            return await current(provider, location)
+
+        with patch.object(SimulatedWeatherProvider, "current", counting_current):
+            response = self.client.post(
+                "/weather", json={"query": "What is the weather in Tromso?"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(locations, ["Tromso"])
+        body = response.json()
+        self.assertEqual(len(body["function_calls"]), 1)
+        self.assertEqual(body["function_calls"][0]["parameters"], {"location": "Tromso"})
+        self.assertIn("current_weather", body)
+
+    def slow_provider(self):
+        """Make each weather lookup take a moment, so overlapping calls are visible."""
+        current = SimulatedWeatherProvider.current
+        forecast = SimulatedWeatherProvider.forecast
+
+        async def slow_current(provider, location):
+            await asyncio.sleep(0.05)
+            return await current(provider, location)
+
+        async def slow_forecast(provider, location, days):
+            await asyncio.sleep(0.05)
+            return await forecast(provider, location, days)
+
+        return (
+            patch.object(SimulatedWeatherProvider, "current", slow_current),
+            patch.object(SimulatedWeatherProvider, "forecast", slow_forecast),
+        )
+
+    def test_tool_calls_of_one_turn_overlap(self):
+        patch_current, patch_forecast = self.slow_provider()
+        with patch_current, patch_forecast:
+            response = self.client.post(
+                "/weather", json={"query": "Weather in Bergen, forecast in Bergen."}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["function_calls"]), 2)
+        self.assertEqual(response.json()["peak_tool_concurrency"], 2)
+
+    def test_tool_concurrency_cap(self):
+        patch_current, patch_forecast = self.slow_provider()
+        with patch_current, patch_forecast:
+            response = self.client.post(
+                "/weather",
+                json={
+                    "query": "Weather in Narvik, forecast in Narvik.",
+                    "tool_concurrency": 1,
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["function_calls"]), 2)
+        self.assertEqual(response.json()["peak_tool_concurrency"], 1)
+
+    def test_tool_timeout_degrades_the_answer(self):
+        patch_current, patch_forecast = self.slow_provider()
+        with patch_current, patch_forecast:
+            response = self.client.post(
+                "/weather",
+                json={
+                    "query": "What is the weather in Longyearbyen?",
+                    "tool_timeout": 0.01,
+                },
+            )
+
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual(body["function_calls"][0]["status"], "timeout")
+        self.assertTrue(body["current_weather"].startswith("Unavailable"))
+
+
+class RecordingProvider(SimulatedWeatherProvider):
+    def __init__(self):
+        super().__init__()
+        self.locations = []
+
+    async def current(self, location):
+        self.locations.append(location)
+        return await super().current(location)
+
+
+class WeatherPluginCacheTest(unittest.IsolatedAsyncioTestCase):
+    async def test_spellings_of_a_city_share_one_lookup(self):
+        provider = RecordingProvider()
+        plugin = WeatherPlugin(provider=provider)
+
+        first = await plugin.get_current_weather("new  york")
+        second = await plugin.get_current_weather("New York")
+
+        self.assertEqual(provider.locations, ["New York"])
+        self.assertEqual(first, second)
+        self.assertEqual(first["location"], "New York")
+        low, high = provider.temperature_ranges["New York"]
+        self.assertTrue(low <= first["temperature"] <= high)
+
+    async def test_callers_cannot_change_cached_results(self):
+        plugin = WeatherPlugin()
+
+        current = await plugin.get_current_weather("Paris")
+        current["temperature"] = "changed"
+        forecast = await plugin.get_forecast("Paris", 2)
+        forecast[0]["condition"] = "changed"
+
+        current = await plugin.get_current_weather("Paris")
+        forecast = await plugin.get_forecast("Paris", 2)
+        self.assertNotEqual(current["temperature"], "changed")
+        self.assertNotEqual(forecast[0]["condition"], "changed")
+
+
+if __name__ == "__main__":
+    unittest.main()